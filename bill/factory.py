@@ -0,0 +1,278 @@
+"""The one place the BiLL coordinator team is assembled.
+
+bill_api.py, bill_agui.py, discord_team.py and team_playground.py each used
+to carry their own 600-line copy of build_team(), with prompts inline and
+the model, tool and cache settings drifting apart, and most of them built
+the whole team at import time. They now all call get_team():
+
+  - agno, the web/crawl tools and the Postgres backends are imported
+    inside the builders, so importing an entry point no longer pays for
+    them. Nothing is constructed until the first get_team() call;
+  - each member agent has its own builder, so a front end (or a test)
+    can build just the agent it needs;
+  - prompts come from the versioned files in bill/prompts
+    (BILL_PROMPT_VERSION);
+  - get_team() caches one team per process and option set, so every
+    front end shares the same GridironTools settings (compaction,
+    projection, multi_call, comparison tools, intent router, answer
+    cache) and the same process-wide pools and caches.
+
+Usage:
+  from bill.factory import get_team, get_storage
+  team = get_team()                          # built on first call, then cached
+  team = get_team(summarize_crawls=True)     # web agent with crawl summaries
+"""
+import functools
+import os
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from bill.prompts import load_prompt, prompt_version as current_prompt_version
+
+DEFAULT_SERVER_URL = os.getenv("GRIDIRON_MCP_URL", "http://192.168.68.66:8002/mcp/")
+SUPERVISOR_MODEL = os.getenv("BILL_SUPERVISOR_MODEL", "gpt-5-mini")
+MEMBER_MODEL = os.getenv("BILL_MEMBER_MODEL", "gpt-5-mini")
+WEB_MODEL = os.getenv("BILL_WEB_MODEL", "gpt-4.1-mini")
+SUMMARIZER_MODEL = os.getenv("SUMMARIZER_MODEL_ID", "gpt-5-nano")
+
+ANALYTICS_TOOLS = [
+    "get_player_info_tool",
+    "get_metrics_metadata",
+    "get_advanced_receiving_stats",
+    "get_advanced_passing_stats",
+    "get_advanced_rushing_stats",
+    "get_advanced_defense_stats",
+    "get_advanced_receiving_stats_weekly",
+    "get_advanced_passing_stats_weekly",
+    "get_advanced_rushing_stats_weekly",
+    "get_advanced_defense_stats_weekly",
+]
+LEAGUE_TOOLS = [
+    "get_stats_metadata",
+    "get_offensive_players_game_stats",
+    "get_defensive_players_game_stats",
+]
+FANTASY_TOOLS = [
+    "get_player_info_tool",
+    "get_sleeper_leagues_by_username",
+    "get_sleeper_league_rosters",
+    "get_sleeper_league_users",
+    "get_sleeper_league_matchups",
+    "get_sleeper_league_transactions",
+    "get_sleeper_trending_players",
+    "get_sleeper_user_drafts",
+    "get_players_by_sleeper_id_tool",
+    "get_fantasy_rank_page_types",
+    "get_fantasy_ranks",
+    "get_sleeper_league_by_id",
+    "get_sleeper_draft_by_id",
+    "get_sleeper_all_draft_picks_by_id",
+]
+
+
+def db_url() -> str:
+    url = os.getenv("db_url") or os.getenv("DB_URL")
+    if not url:
+        raise RuntimeError("Database password not found in environment variable 'db_url'")
+    return url
+
+
+@functools.lru_cache(maxsize=None)
+def get_storage() -> Any:
+    """Process-wide team session storage (`session_storage`)."""
+    from agno.storage.postgres import PostgresStorage
+
+    return PostgresStorage(table_name="session_storage", db_url=db_url(), mode="team")
+
+
+@functools.lru_cache(maxsize=None)
+def get_memory_db() -> Any:
+    """Process-wide user-memory table."""
+    from agno.memory.v2.db.postgres import PostgresMemoryDb
+
+    return PostgresMemoryDb(table_name="memory", db_url=db_url())
+
+
+def _stats_tools(server_url: str, include_tools: List[str]) -> Any:
+    from gridiron_toolkit.compact import STATS_TOOLS
+    from gridiron_toolkit.info import GridironTools
+
+    # stats rows go to the model as projected, compact CSV; multi_call fans out independent calls
+    return GridironTools(url=server_url, compact_tools=STATS_TOOLS, project_results=True, multi_call=True,
+                         include_tools=include_tools)
+
+
+def build_web_agent(prompt_version: Optional[str] = None, summarize_crawls: bool = False) -> Any:
+    from agno.agent import Agent
+    from agno.models.openai import OpenAIChat
+    from agno.tools.crawl4ai import Crawl4aiTools
+    from agno.tools.googlesearch import GoogleSearchTools
+
+    crawl: Any = Crawl4aiTools(max_length=500)
+    memory_options: Dict[str, Any] = {}
+    if summarize_crawls:
+        from agno.memory.v2.memory import Memory
+
+        from helpers.crawl_helpers import SummarizingCrawl4aiTools
+
+        # crawl pages are summarized (and remembered) before the model sees them
+        crawl = SummarizingCrawl4aiTools(inner=Crawl4aiTools(), memory=None, model=OpenAIChat(id=SUMMARIZER_MODEL))
+        memory_options = {"memory": Memory(db=get_memory_db(), debug_mode=True), "enable_user_memories": True}
+    agent = Agent(
+        name="Web Search Agent",
+        model=OpenAIChat(id=WEB_MODEL),
+        role="Handle web search requests",
+        tools=[GoogleSearchTools(fixed_max_results=3), crawl],
+        tool_call_limit=4,
+        add_datetime_to_instructions=True,
+        timezone_identifier="Etc/UTC",
+        instructions=load_prompt("web", prompt_version),
+        **memory_options,
+    )
+    if summarize_crawls:
+        # the agent creates its Memory during construction; hand it to the wrapper
+        crawl.memory = agent.memory
+    return agent
+
+
+def build_analytics_agent(server_url: str = DEFAULT_SERVER_URL, prompt_version: Optional[str] = None) -> Any:
+    from agno.agent import Agent
+    from agno.models.openai import OpenAIChat
+
+    from gridiron_toolkit.compare_tools import comparison_tools
+
+    return Agent(
+        name="Analytics Agent",
+        model=OpenAIChat(id=MEMBER_MODEL),
+        description="You make complex analytics questions simple by breaking down information, researching and formatting results in an easy to understand way.",
+        tools=[_stats_tools(server_url, ANALYTICS_TOOLS), *comparison_tools(server_url)],
+        add_datetime_to_instructions=True,
+        timezone_identifier="Etc/UTC",
+        instructions=load_prompt("analytics", prompt_version),
+        show_tool_calls=True,
+        markdown=True,
+        debug_mode=True,
+        monitoring=True,
+    )
+
+
+def build_league_agent(server_url: str = DEFAULT_SERVER_URL, prompt_version: Optional[str] = None) -> Any:
+    from agno.agent import Agent
+    from agno.models.openai import OpenAIChat
+
+    return Agent(
+        name="League Agent",
+        model=OpenAIChat(id=MEMBER_MODEL),
+        description="You are a fantasy football expert specializing in league operations. You provide insights, league information, and player details using the tools available to you.",
+        tools=[_stats_tools(server_url, LEAGUE_TOOLS)],
+        add_datetime_to_instructions=True,
+        timezone_identifier="Etc/UTC",
+        instructions=load_prompt("league", prompt_version),
+    )
+
+
+def build_fantasy_agent(server_url: str = DEFAULT_SERVER_URL, prompt_version: Optional[str] = None) -> Any:
+    from agno.agent import Agent
+    from agno.models.openai import OpenAIChat
+
+    from gridiron_toolkit.info import GridironTools
+
+    return Agent(
+        name="Fantasy Agent",
+        model=OpenAIChat(id=MEMBER_MODEL),
+        description="You are a fantasy football expert specializing in Sleeper leagues. You provide insights, player information, and league details using the tools available to you.",
+        tools=[GridironTools(url=server_url, include_tools=FANTASY_TOOLS)],
+        add_datetime_to_instructions=True,
+        timezone_identifier="Etc/UTC",
+        instructions=load_prompt("fantasy", prompt_version),
+        show_tool_calls=True,
+        markdown=True,
+        debug_mode=True,
+        monitoring=True,
+    )
+
+
+def build_team(
+    server_url: str = DEFAULT_SERVER_URL,
+    prompt_version: Optional[str] = None,
+    summarize_crawls: bool = False,
+) -> Any:
+    """Build a fresh coordinator team (most callers want the cached get_team())."""
+    from agno.memory.v2.memory import Memory
+    from agno.models.openai import OpenAIChat
+    from agno.team import Team
+
+    from gridiron_toolkit.answers import install_answer_cache
+    from gridiron_toolkit.info import GridironTools
+    from gridiron_toolkit.router import install_intent_router
+
+    gridiron_team = Team(
+        name="Gridiron Ball Squad (BiLL)",
+        team_id="gridiron_team",
+        mode="coordinate",
+        model=OpenAIChat(SUPERVISOR_MODEL),
+        members=[
+            build_fantasy_agent(server_url, prompt_version),
+            build_analytics_agent(server_url, prompt_version),
+            build_league_agent(server_url, prompt_version),
+            build_web_agent(prompt_version, summarize_crawls=summarize_crawls),
+        ],
+        instructions=load_prompt("supervisor", prompt_version),
+        tools=[GridironTools(url=server_url, include_tools=["get_player_info_tool"])],
+        storage=get_storage(),
+        memory=Memory(db=get_memory_db(), debug_mode=True),
+        enable_agentic_memory=True,
+        add_history_to_messages=True,
+        add_datetime_to_instructions=True,
+        num_history_runs=3,
+        markdown=True,
+        debug_mode=True,
+        show_members_responses=True,
+        monitoring=True,
+    )
+
+    # simple lookups (player info, league rosters, trending) skip the coordinator model
+    install_intent_router(gridiron_team, server_url)
+    # repeat questions are answered from the semantic answer cache while their data is fresh
+    install_answer_cache(gridiron_team)
+
+    return gridiron_team
+
+
+_TEAMS: Dict[Tuple[str, str, bool], Any] = {}
+_LOCK = threading.Lock()
+
+
+def get_team(
+    server_url: str = DEFAULT_SERVER_URL,
+    prompt_version: Optional[str] = None,
+    summarize_crawls: bool = False,
+) -> Any:
+    """Return the process-wide team for these options, building it on first use."""
+    key = (server_url, prompt_version or current_prompt_version(), summarize_crawls)
+    team = _TEAMS.get(key)
+    if team is None:
+        # entry points may ask from several threads (uvicorn workers, executor-run servers)
+        with _LOCK:
+            team = _TEAMS.get(key)
+            if team is None:
+                team = _TEAMS[key] = build_team(server_url, key[1], summarize_crawls)
+    return team
+
+
+async def close_team_tools(team: Any) -> None:
+    """Best-effort close of every toolkit on the team's members and on the team itself."""
+    import asyncio
+
+    for node in [*(getattr(team, "members", None) or []), team]:
+        for t in getattr(node, "tools", None) or []:
+            close = getattr(t, "close", None)
+            if close is None:
+                continue
+            try:
+                if asyncio.iscoroutinefunction(close):
+                    await close()
+                else:
+                    await asyncio.get_running_loop().run_in_executor(None, close)
+            except Exception:
+                pass
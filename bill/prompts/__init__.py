@@ -0,0 +1,39 @@
+"""Versioned agent prompts for the BiLL team.
+
+Each prompt lives in `bill/prompts/<version>/<name>.md`, so prompt edits are
+reviewed as text diffs and a new wording ships as a new version directory
+next to the old one. BILL_PROMPT_VERSION picks the version at startup
+(default DEFAULT_VERSION); a name missing from that version falls back to
+DEFAULT_VERSION.
+
+Usage:
+  load_prompt("supervisor")            # BILL_PROMPT_VERSION, else v1
+  load_prompt("analytics", "v2")
+"""
+import functools
+import os
+from typing import List, Optional
+
+PROMPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_VERSION = "v1"
+PROMPT_NAMES = ("supervisor", "analytics", "league", "fantasy", "web")
+
+
+def prompt_version() -> str:
+    return os.getenv("BILL_PROMPT_VERSION") or DEFAULT_VERSION
+
+
+def versions() -> List[str]:
+    return sorted(d for d in os.listdir(PROMPTS_DIR) if os.path.isdir(os.path.join(PROMPTS_DIR, d)) and d[:1] == "v")
+
+
+@functools.lru_cache(maxsize=None)
+def load_prompt(name: str, version: Optional[str] = None) -> str:
+    """Text of prompt `name` for `version`; raises FileNotFoundError if no version has it."""
+    version = version or prompt_version()
+    for candidate in dict.fromkeys((version, DEFAULT_VERSION)):
+        path = os.path.join(PROMPTS_DIR, candidate, f"{name}.md")
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                return f.read()
+    raise FileNotFoundError(f"no prompt {name!r} in {version!r} or {DEFAULT_VERSION!r} under {PROMPTS_DIR}")
@@ -0,0 +1,381 @@
+"""Semantic cache for whole team answers.
+
+Many users ask near-identical questions ("compare Jefferson and Chase
+2023-2024 receiving"), and each one ran the full coordinator -> member ->
+MCP -> synthesis pipeline. AnswerCache sits at the team-run boundary
+(`install_answer_cache(team)` wraps team.arun) and answers repeats from
+memory:
+
+  - questions are normalized (case, punctuation, dashes, "vs"/"versus"),
+    and an exact normalized match is a dictionary hit;
+  - otherwise the question is embedded and compared by cosine similarity
+    against the cached questions. Only candidates with the same scope and
+    the same `question_gate()` are compared: the same numbers (seasons,
+    weeks, league ids), the same stat domain (receiving, rushing, per
+    game, weekly, ...) and the same names, where a name is any word that
+    is neither filler nor stats vocabulary. So "... 2023" never answers
+    "... 2024", "Jefferson" never answers "Waddle", and "receiving" never
+    answers "rushing", however long the rest of the question is. The
+    default embedder is a local hashed word/character n-gram vector; pass
+    `embed=` to use a model embedder instead;
+  - questions about "my" team or league are scoped to the asking user,
+    and questions that lean on the conversation ("what about his 2022?")
+    are never cached.
+
+Freshness follows the data. While a run executes, GridironTools notes
+every remote tool it calls (`note_tool()`, through a ContextVar that
+member tasks inherit). The answer expires with the shortest result-cache
+TTL among them, capped by GRIDIRON_ANSWER_CACHE_TTL_SECONDS. An answer is
+not stored at all when it used a never-cached tool (transactions), called
+no tools (nothing says how long it stays true), or was built around a
+failed tool call (`note_tool_error()`, or a tool error agno recorded).
+
+Cached answers come back as a TeamRunResponse with `model="answer-cache"`
+and `metrics["cached"] = True` (plus the entry's age), and the turn is
+written to the team's session storage like a run of its own.
+
+Usage:
+  install_answer_cache(team)                 # after install_intent_router
+  get_answer_cache().lookup("who is josh allen", user_id="u1")
+"""
+import contextvars
+import hashlib
+import math
+import os
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple
+
+from gridiron_toolkit.cache import get_cache
+
+DEFAULT_MAX_ENTRIES = int(os.getenv("GRIDIRON_ANSWER_CACHE_MAX_ENTRIES", "1024"))
+DEFAULT_MAX_TTL = float(os.getenv("GRIDIRON_ANSWER_CACHE_TTL_SECONDS", "3600"))
+DEFAULT_THRESHOLD = float(os.getenv("GRIDIRON_ANSWER_CACHE_THRESHOLD", "0.9"))
+HASH_DIM = 2 ** 18
+
+_TOOLS_USED: contextvars.ContextVar[Optional[Set[str]]] = contextvars.ContextVar("gridiron_tools_used", default=None)
+_TOOL_ERRORS: contextvars.ContextVar[Optional[Set[str]]] = contextvars.ContextVar("gridiron_tool_errors", default=None)
+
+_DASHES = re.compile(r"[‐-―−]")
+_NON_WORD = re.compile(r"[^a-z0-9\- ]+")
+_NUMBERS = re.compile(r"\d+")
+# possessive and subject forms only: the "me" in "show me ..." is not about the asker
+_PERSONAL = re.compile(r"\b(my|mine|i|our|ours|we)\b")
+# leans on the conversation so far ("what about his 2022?"); the answer depends on history
+_CONTEXTUAL = re.compile(r"\b(he|him|his|she|her|they|them|their|it|its|what about|how about)\b")
+_SYNONYMS = {"versus": "vs", "v": "vs", "against": "vs", "yds": "yards", "td": "touchdowns", "tds": "touchdowns",
+             "wr": "receiver", "wrs": "receivers", "rb": "running back", "rbs": "running backs",
+             "qb": "quarterback", "qbs": "quarterbacks", "te": "tight end", "tes": "tight ends"}
+_FILLER = {"please", "can", "you", "could", "would", "tell", "show", "give", "me", "the", "a", "an", "of", "for",
+           "to", "and", "in", "on", "about", "what", "is", "are", "hey", "bill"}
+# words that say which stats are wanted; two questions must agree on these exactly
+_DOMAIN_WORDS = {"receiving": "receiving", "rushing": "rushing", "passing": "passing", "defense": "defense",
+                 "defensive": "defense", "kicking": "kicking", "returning": "returning", "fantasy": "fantasy",
+                 "week": "weekly", "weeks": "weekly", "weekly": "weekly", "career": "career", "playoffs": "playoffs",
+                 "playoff": "playoffs", "rookie": "rookie"}
+_PER_GAME = re.compile(r"\bper game\b")
+# wording that does not change who or what is asked about; any other word counts as a name
+_STATS_VOCABULARY = {
+    "yards", "yard", "targets", "target", "receptions", "reception", "catches", "catch", "touchdowns", "touchdown",
+    "share", "air", "after", "separation", "attempts", "carries", "completions", "completion", "interceptions",
+    "sacks", "tackles", "fumbles", "points", "ppr", "stats", "stat", "statistics", "numbers", "total", "totals",
+    "average", "avg", "rate", "percentage", "pct", "efficiency", "snap", "snaps", "routes", "route", "per", "game",
+    "games", "season", "seasons", "year", "years", "compare", "comparison", "vs", "who", "which", "how", "many",
+    "much", "did", "does", "do", "has", "have", "had", "was", "were", "with", "by", "from", "at", "between",
+    "than", "more", "less", "most", "top", "best", "leaders", "leader", "rank", "ranking", "rankings", "list",
+    "player", "players", "receiver", "receivers", "running", "back", "backs", "quarterback", "quarterbacks",
+    "tight", "end", "ends", "wide", "info", "information", "all", "so", "far", "this", "last", "get",
+}
+
+
+def normalize_question(text: str) -> str:
+    """Lowercase ASCII form: dashes unified, punctuation dropped, common synonyms folded."""
+    text = _DASHES.sub("-", str(text or ""))
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii").lower().replace("'", "")
+    words = []
+    for word in _NON_WORD.sub(" ", text).replace(" - ", "-").split():
+        words.extend(_SYNONYMS.get(word, word).split())
+    return " ".join(words)
+
+
+def question_numbers(normalized: str) -> FrozenSet[str]:
+    return frozenset(_NUMBERS.findall(normalized))
+
+
+def question_gate(normalized: str) -> Tuple[FrozenSet[str], FrozenSet[str], FrozenSet[str]]:
+    """(numbers, stat domain, names) that a semantic match must share exactly."""
+    words = normalized.split()
+    domain = {_DOMAIN_WORDS[w] for w in words if w in _DOMAIN_WORDS}
+    if _PER_GAME.search(normalized):
+        domain.add("per game")
+    names = {w for w in words if w not in _FILLER and w not in _STATS_VOCABULARY and w not in _DOMAIN_WORDS
+             and not _NUMBERS.search(w)}
+    return question_numbers(normalized), frozenset(domain), frozenset(names)
+
+
+def _bucket(feature: str) -> int:
+    return int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "big") % HASH_DIM
+
+
+def hashed_embedding(normalized: str) -> Dict[int, float]:
+    """Sparse unit vector of hashed content words, word bigrams and character trigrams."""
+    words = [w for w in normalized.split() if w not in _FILLER]
+    features: Dict[int, float] = {}
+    for i, word in enumerate(words):
+        features[_bucket("w:" + word)] = features.get(_bucket("w:" + word), 0.0) + 1.0
+        if i:
+            key = _bucket(f"b:{words[i - 1]} {word}")
+            features[key] = features.get(key, 0.0) + 1.0
+        padded = f" {word} "
+        for j in range(len(padded) - 2):
+            key = _bucket("c:" + padded[j:j + 3])
+            features[key] = features.get(key, 0.0) + 0.25
+    norm = math.sqrt(sum(v * v for v in features.values())) or 1.0
+    return {k: v / norm for k, v in features.items()}
+
+
+def _sparse(vector: Any) -> Dict[int, float]:
+    if isinstance(vector, dict):
+        return vector
+    values = [float(v) for v in vector]
+    norm = math.sqrt(sum(v * v for v in values)) or 1.0
+    return {i: v / norm for i, v in enumerate(values) if v}
+
+
+def cosine(a: Dict[int, float], b: Dict[int, float]) -> float:
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(v * b.get(k, 0.0) for k, v in a.items())
+
+
+def note_tool(tool_name: str) -> None:
+    """Record that the current team run called `tool_name` (no-op outside a tracked run)."""
+    used = _TOOLS_USED.get()
+    if used is not None:
+        used.add(tool_name)
+
+
+def note_tool_error(tool_name: str) -> None:
+    """Record that a `tool_name` call failed during the current team run (no-op outside one)."""
+    errors = _TOOL_ERRORS.get()
+    if errors is not None:
+        errors.add(tool_name)
+
+
+def _reported_errors(item: Any) -> Set[str]:
+    # tools agno recorded as failed on a run response (and its members'), or on a streamed tool event
+    tools = [getattr(item, "tool", None), *(getattr(item, "tools", None) or ())]
+    failed = {str(getattr(t, "tool_name", None)) for t in tools if getattr(t, "tool_call_error", False)}
+    for member in getattr(item, "member_responses", None) or ():
+        failed |= _reported_errors(member)
+    return failed
+
+
+class CachedAnswer:
+    __slots__ = ("question", "vector", "content", "created_at", "expires_at", "tools")
+
+    def __init__(self, question: str, vector: Dict[int, float], content: str, ttl: float, tools: FrozenSet[str]):
+        self.question = question
+        self.vector = vector
+        self.content = content
+        self.created_at = time.time()
+        self.expires_at = self.created_at + ttl
+        self.tools = tools
+
+
+class AnswerCache:
+    """LRU of team answers, matched by normalized text, then by embedding similarity."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        threshold: float = DEFAULT_THRESHOLD,
+        max_ttl: float = DEFAULT_MAX_TTL,
+        embed: Optional[Callable[[str], Sequence[float]]] = None,
+        ttl_for: Optional[Callable[[str], float]] = None,
+    ):
+        self.max_entries = max(1, int(max_entries))
+        self.threshold = threshold
+        self.max_ttl = max_ttl
+        self._embed = embed
+        self._ttl_for = ttl_for
+        # (scope, normalized question) -> entry, in LRU order
+        self._entries: "OrderedDict[Tuple[str, str], CachedAnswer]" = OrderedDict()
+        # (scope, question_gate) -> keys of entries that may be compared with each other
+        self._buckets: Dict[Tuple[str, Tuple[FrozenSet[str], ...]], Set[Tuple[str, str]]] = {}
+        self.hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+        self.skipped = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _vector(self, normalized: str) -> Dict[int, float]:
+        return _sparse(self._embed(normalized)) if self._embed is not None else hashed_embedding(normalized)
+
+    @staticmethod
+    def scope(normalized: str, user_id: Optional[str]) -> Optional[str]:
+        """Who may share an answer: "*" for everyone, one user for "my ..." questions, None if nobody."""
+        if not normalized or _CONTEXTUAL.search(normalized):
+            return None
+        if _PERSONAL.search(normalized):
+            return f"user:{user_id}" if user_id else None
+        return "*"
+
+    def ttl(self, tools: Iterable[str]) -> float:
+        ttl_for = self._ttl_for or get_cache().ttl_for
+        return min([self.max_ttl, *(ttl_for(t) for t in tools)])
+
+    def lookup(self, question: str, user_id: Optional[str] = None) -> Optional[CachedAnswer]:
+        normalized = normalize_question(question)
+        scope = self.scope(normalized, user_id)
+        if scope is None:
+            return None
+        now = time.time()
+        entry = self._entries.get((scope, normalized))
+        if entry is not None and entry.expires_at > now:
+            self._entries.move_to_end((scope, normalized))
+            self.hits += 1
+            return entry
+        best, best_key, best_score = None, None, self.threshold
+        candidates = self._buckets.get((scope, question_gate(normalized)), ())
+        vector = self._vector(normalized) if candidates else None
+        for key in candidates:
+            other = self._entries[key]
+            if other.expires_at <= now:
+                continue
+            score = cosine(vector, other.vector)
+            if score >= best_score:
+                best, best_key, best_score = other, key, score
+        if best is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(best_key)
+        self.hits += 1
+        self.semantic_hits += 1
+        return best
+
+    def store(
+        self,
+        question: str,
+        content: Any,
+        tools: Iterable[str],
+        user_id: Optional[str] = None,
+        errors: Iterable[str] = (),
+    ) -> bool:
+        """Keep `content` for as long as the data behind it stays fresh; returns False if it can't be cached.
+
+        Nothing is kept when no tools were used or any of them failed (`errors`).
+        """
+        normalized = normalize_question(question)
+        tools = frozenset(tools)
+        ttl = self.ttl(tools) if tools else 0.0
+        scope = self.scope(normalized, user_id)
+        if scope is None or not isinstance(content, str) or not content.strip() or ttl <= 0 or any(errors):
+            self.skipped += 1
+            return False
+        key = (scope, normalized)
+        self._drop(key)
+        self._entries[key] = CachedAnswer(normalized, self._vector(normalized), content, ttl, tools)
+        self._buckets.setdefault((scope, question_gate(normalized)), set()).add(key)
+        while len(self._entries) > self.max_entries:
+            self._drop(next(iter(self._entries)))
+        return True
+
+    def _drop(self, key: Tuple[str, str]) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        bucket_key = (key[0], question_gate(key[1]))
+        bucket = self._buckets.get(bucket_key)
+        if bucket is not None:
+            bucket.discard(key)
+            if not bucket:
+                del self._buckets[bucket_key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._buckets.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"entries": len(self._entries), "hits": self.hits, "semantic_hits": self.semantic_hits,
+                "misses": self.misses, "skipped": self.skipped}
+
+
+_ANSWERS: Optional[AnswerCache] = None
+
+
+def get_answer_cache() -> AnswerCache:
+    """Return the process-wide answer cache."""
+    global _ANSWERS
+    if _ANSWERS is None:
+        _ANSWERS = AnswerCache()
+    return _ANSWERS
+
+
+def _team_text(event: Any) -> bool:
+    # streamed text from the team itself (not member events): content deltas from agno.run.team
+    if not isinstance(getattr(event, "content", None), str) or type(event).__module__ != "agno.run.team":
+        return False
+    name = type(event).__name__
+    return name == "TeamRunResponse" or "Content" in name
+
+
+def install_answer_cache(team: Any, cache: Optional[AnswerCache] = None) -> AnswerCache:
+    """Wrap `team.arun` so repeated questions are answered from `cache`."""
+    from gridiron_toolkit.router import team_response
+
+    cache = cache if cache is not None else get_answer_cache()
+    team_arun = team.arun
+
+    async def arun(message: Any = None, *args: Any, stream: Optional[bool] = None, **kwargs: Any) -> Any:
+        question = message if isinstance(message, str) else getattr(message, "content", None)
+        if not isinstance(question, str) or args:
+            return await team_arun(message, *args, stream=stream, **kwargs)
+        user_id = kwargs.get("user_id")
+        use_stream = bool(getattr(team, "stream", False) if stream is None else stream)
+        hit = cache.lookup(question, user_id=user_id)
+        if hit is not None:
+            metrics = {"cached": True, "cache_age_seconds": round(time.time() - hit.created_at, 1)}
+            return team_response(team, hit.content, "answer-cache", kwargs.get("session_id"), use_stream, metrics,
+                                 question=question, user_id=user_id)
+
+        used: Set[str] = set()
+        errors: Set[str] = set()
+        tokens = _TOOLS_USED.set(used), _TOOL_ERRORS.set(errors)
+        try:
+            result = await team_arun(message, *args, stream=stream, **kwargs)
+        finally:
+            _TOOLS_USED.reset(tokens[0])
+            _TOOL_ERRORS.reset(tokens[1])
+        if not use_stream:
+            errors.update(_reported_errors(result))
+            cache.store(question, getattr(result, "content", None), used, user_id=user_id, errors=errors)
+            return result
+
+        async def _relay():
+            # a streamed run does its work while the iterator is drained, so track tools here too
+            tokens = _TOOLS_USED.set(used), _TOOL_ERRORS.set(errors)
+            parts: List[str] = []
+            try:
+                async for event in result:
+                    if _team_text(event):
+                        parts.append(event.content)
+                    errors.update(_reported_errors(event))
+                    yield event
+            finally:
+                try:
+                    _TOOLS_USED.reset(tokens[0])
+                    _TOOL_ERRORS.reset(tokens[1])
+                except ValueError:
+                    pass  # drained from another context
+            cache.store(question, "".join(parts), used, user_id=user_id, errors=errors)
+
+        return _relay()
+
+    team.arun = arun
+    team.answer_cache = cache
+    return cache
@@ -0,0 +1,206 @@
+"""Micro-batching of array-argument player lookups.
+
+`get_player_info_tool(player_names=[...])` and
+`get_players_by_sleeper_id_tool(sleeper_ids=[...])` accept lists, but every
+agent call sends its own short one. Each GridironTools keeps one
+MicroBatcher per lookup tool, shared by every chat using that toolkit.
+Lookups submitted in the same event-loop step go out together straight away.
+While a batch is in flight, new lookups are collected for a short window
+(default 10 ms). Each batch is one merged remote call with the de-duplicated
+union, and each caller gets only the rows that match what it asked for.
+
+The merged call belongs to no single caller. `send` is fixed when the
+batcher is created and runs outside every caller's context, so it never
+carries one chat's agent or request budget. Each caller waits for its share
+within its own budget.
+
+Rows are matched client-side the way the server matches them: sleeper ids
+exactly, player names as a case-insensitive partial match on the name
+fields. If the merged result can't be split into rows, each caller falls back
+to its own unbatched call so nobody receives somebody else's players.
+"""
+import asyncio
+import contextvars
+import os
+from typing import Any, Awaitable, Callable, Coroutine, Dict, List, Optional, Sequence, Set, Tuple
+
+from gridiron_toolkit.deadline import DeadlineExceeded, remaining
+from gridiron_toolkit.results import extract_rows, replace_rows
+
+
+DEFAULT_WINDOW_SECONDS = float(os.getenv("GRIDIRON_BATCH_WINDOW_MS", "10")) / 1000.0
+DEFAULT_MAX_BATCH = int(os.getenv("GRIDIRON_BATCH_MAX_SIZE", "200"))
+
+_NAME_FIELDS = ("player_name", "display_name", "full_name", "name", "merge_name", "football_name")
+
+
+def _match_sleeper_id(row: Dict[str, Any], value: str) -> bool:
+    return str(row.get("sleeper_id", "")) == value
+
+
+def _match_player_name(row: Dict[str, Any], value: str) -> bool:
+    needle = value.strip().lower()
+    for field in _NAME_FIELDS:
+        v = row.get(field)
+        if isinstance(v, str) and needle in v.lower():
+            return True
+    return False
+
+
+# remote tool -> (list argument, row matcher)
+BATCHABLE_TOOLS: Dict[str, Tuple[str, Callable[[Dict[str, Any], str], bool]]] = {
+    "get_player_info_tool": ("player_names", _match_player_name),
+    "get_players_by_sleeper_id_tool": ("sleeper_ids", _match_sleeper_id),
+}
+
+
+def batch_values(tool_name: str, args: Sequence[Any], kwargs: Dict[str, Any]) -> Optional[List[str]]:
+    """Return the lookup values when this call can join a batch, else None.
+
+    Only calls that pass the list argument by keyword and nothing else are
+    batched; anything unusual goes straight to the server.
+    """
+    spec = BATCHABLE_TOOLS.get(tool_name)
+    if spec is None or args:
+        return None
+    arg_name = spec[0]
+    if set(kwargs) != {arg_name}:
+        return None
+    values = kwargs[arg_name]
+    if isinstance(values, str):
+        values = [values]
+    if not isinstance(values, (list, tuple)) or not values:
+        return None
+    return [str(v) for v in values]
+
+
+class MicroBatcher:
+    """Merges concurrent lookups for one remote tool into one `send(values)` call."""
+
+    def __init__(
+        self,
+        tool_name: str,
+        send: Callable[[List[str]], Awaitable[Any]],
+        window: float = DEFAULT_WINDOW_SECONDS,
+        max_batch: int = DEFAULT_MAX_BATCH,
+    ):
+        self.tool_name = tool_name
+        self.arg_name, self._match = BATCHABLE_TOOLS[tool_name]
+        # one remote call for a list of lookup values; must not depend on who submitted
+        self._send = send
+        self.window = window
+        self.max_batch = max(1, int(max_batch))
+        self._pending: List[Tuple[List[str], "asyncio.Future[Any]"]] = []
+        self._pending_size = 0
+        self._flush_handle: Optional[asyncio.Handle] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._in_flight = 0
+        # strong refs so running batch tasks aren't garbage collected mid-flight
+        self._tasks: Set["asyncio.Task[Any]"] = set()
+        # counters: callers served vs remote calls actually made
+        self.requests = 0
+        self.batches = 0
+
+    async def submit(self, values: List[str]) -> Any:
+        """Queue `values` for the next batch and wait for this caller's share of the result."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # a batch can't span event loops; start over on this one
+            self._pending, self._pending_size, self._flush_handle, self._in_flight = [], 0, None, 0
+            self._loop = loop
+        self.requests += 1
+        fut: "asyncio.Future[Any]" = loop.create_future()
+        self._pending.append((values, fut))
+        self._pending_size += len(values)
+        if self._pending_size >= self.max_batch:
+            self._flush()
+        elif self._flush_handle is None:
+            # idle: go at the end of this loop step (lookups from the same gather still merge);
+            # busy: let lookups pile up behind the batch in flight for `window`
+            if self._in_flight:
+                self._flush_handle = loop.call_later(self.window, self._flush)
+            else:
+                self._flush_handle = loop.call_soon(self._flush)
+        left = remaining()
+        if left is None:
+            return await fut
+        try:
+            return await asyncio.wait_for(fut, max(0.0, left))
+        except asyncio.TimeoutError:
+            raise DeadlineExceeded(f"{self.tool_name}: request time budget exhausted") from None
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending, self._pending_size = self._pending, [], 0
+        if batch:
+            # counted from the flush, so lookups arriving before the task starts still wait
+            self._in_flight += 1
+            self._spawn(self._run(batch))
+
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> None:
+        # a fresh context: the merged call must not inherit whichever caller triggered the flush
+        task = contextvars.Context().run(asyncio.ensure_future, coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: List[Tuple[List[str], "asyncio.Future[Any]"]]) -> None:
+        try:
+            await self._run_batch(batch)
+        finally:
+            self._in_flight -= 1
+
+    async def _run_batch(self, batch: List[Tuple[List[str], "asyncio.Future[Any]"]]) -> None:
+        send = self._send
+        merged: List[str] = []
+        seen = set()
+        for values, _ in batch:
+            for v in values:
+                if v not in seen:
+                    seen.add(v)
+                    merged.append(v)
+
+        self.batches += 1
+        try:
+            result = await send(merged)
+        except asyncio.CancelledError:
+            for _, fut in batch:
+                fut.cancel()
+            raise
+        except Exception as e:
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(e)
+            return
+
+        if len(batch) == 1:
+            # nothing was merged; hand the result back untouched
+            if not batch[0][1].done():
+                batch[0][1].set_result(result)
+            return
+
+        rows = extract_rows(result)
+        for values, fut in batch:
+            if fut.done():
+                continue
+            if rows is None:
+                # can't split the merged payload; let this caller ask on its own
+                self._spawn(self._run_single(values, fut))
+                continue
+            mine = [r for r in rows if any(self._match(r, v) for v in values)]
+            fut.set_result(replace_rows(result, mine))
+
+    async def _run_single(self, values: List[str], fut: "asyncio.Future[Any]") -> None:
+        self.batches += 1
+        try:
+            result = await self._send(values)
+        except Exception as e:
+            if not fut.done():
+                fut.set_exception(e)
+            return
+        if not fut.done():
+            fut.set_result(result)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"requests": self.requests, "batches": self.batches}
@@ -0,0 +1,237 @@
+"""TTL + LRU result cache for remote MCP tool calls.
+
+Entries are keyed on the tool name, the MCP server url and a canonical JSON
+form of the call arguments, so `f(a=1, b=2)` and `f(b=2, a=1)` share an entry
+while toolkits pointed at different servers never do. Values are copied on
+the way in and out: every toolkit shares the cache, and a caller mutating
+its result must not change what the next caller gets. How long a
+result may be reused is decided per tool by a TTL policy:
+
+  - metadata / dictionary tools change about once a season -> hours
+  - Sleeper trending, matchups, rosters move during the week -> minutes
+  - transactions (and anything with ttl 0) are never cached
+
+The cache is bounded; the least recently used entry is evicted first.
+Expired entries stay until evicted so that, when the server is failing,
+`get_stale()` can still serve a last known good value within the tool's
+stale-if-error window (STALE_IF_ERROR_POLICY).
+
+Usage:
+  cache = get_cache()
+  hit, value = cache.get("get_metrics_metadata", {"category": "receiving"})
+  if not hit:
+      value = await remote(...)
+      cache.put("get_metrics_metadata", {"category": "receiving"}, value)
+"""
+import copy
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+DEFAULT_MAX_ENTRIES = int(os.getenv("GRIDIRON_CACHE_MAX_ENTRIES", "2048"))
+
+HOUR = 3600.0
+MINUTE = 60.0
+
+# seconds a result stays fresh, by remote tool name; 0 disables caching
+DEFAULT_TTL_POLICY: Dict[str, float] = {
+    # metadata: effectively static within a season
+    "get_metrics_metadata": 12 * HOUR,
+    "get_stats_metadata": 12 * HOUR,
+    "get_dictionary_info": 12 * HOUR,
+    "get_fantasy_rank_page_types": 12 * HOUR,
+    # identity lookups and closed-season stats
+    "get_player_info_tool": 1 * HOUR,
+    "get_players_by_sleeper_id_tool": 1 * HOUR,
+    "get_advanced_receiving_stats": 1 * HOUR,
+    "get_advanced_passing_stats": 1 * HOUR,
+    "get_advanced_rushing_stats": 1 * HOUR,
+    "get_advanced_defense_stats": 1 * HOUR,
+    "get_advanced_receiving_stats_weekly": 15 * MINUTE,
+    "get_advanced_passing_stats_weekly": 15 * MINUTE,
+    "get_advanced_rushing_stats_weekly": 15 * MINUTE,
+    "get_advanced_defense_stats_weekly": 15 * MINUTE,
+    "get_offensive_players_game_stats": 15 * MINUTE,
+    "get_defensive_players_game_stats": 15 * MINUTE,
+    "get_fantasy_ranks": 30 * MINUTE,
+    # Sleeper: changes during the week
+    "get_sleeper_trending_players": 5 * MINUTE,
+    "get_sleeper_league_matchups": 2 * MINUTE,
+    "get_sleeper_league_rosters": 5 * MINUTE,
+    "get_sleeper_league_users": 15 * MINUTE,
+    "get_sleeper_leagues_by_username": 15 * MINUTE,
+    "get_sleeper_user_drafts": 15 * MINUTE,
+    "get_sleeper_league_by_id": 15 * MINUTE,
+    # never cache: users ask about transactions precisely because they just happened
+    "get_sleeper_league_transactions": 0.0,
+}
+
+
+# seconds past expiry a result may still be served when the server is failing; 0 = never
+STALE_IF_ERROR_POLICY: Dict[str, float] = {
+    "get_metrics_metadata": 7 * 24 * HOUR,
+    "get_stats_metadata": 7 * 24 * HOUR,
+    "get_dictionary_info": 7 * 24 * HOUR,
+    "get_fantasy_rank_page_types": 7 * 24 * HOUR,
+    "get_player_info_tool": 24 * HOUR,
+    "get_players_by_sleeper_id_tool": 24 * HOUR,
+    "get_advanced_receiving_stats": 24 * HOUR,
+    "get_advanced_passing_stats": 24 * HOUR,
+    "get_advanced_rushing_stats": 24 * HOUR,
+    "get_advanced_defense_stats": 24 * HOUR,
+    "get_advanced_receiving_stats_weekly": 6 * HOUR,
+    "get_advanced_passing_stats_weekly": 6 * HOUR,
+    "get_advanced_rushing_stats_weekly": 6 * HOUR,
+    "get_advanced_defense_stats_weekly": 6 * HOUR,
+    "get_offensive_players_game_stats": 6 * HOUR,
+    "get_defensive_players_game_stats": 6 * HOUR,
+    "get_fantasy_ranks": 6 * HOUR,
+    "get_sleeper_trending_players": 1 * HOUR,
+    "get_sleeper_league_users": 1 * HOUR,
+    "get_sleeper_leagues_by_username": 1 * HOUR,
+    "get_sleeper_user_drafts": 1 * HOUR,
+    "get_sleeper_league_by_id": 1 * HOUR,
+    # live game-day data: better an error than a stale score or roster
+    "get_sleeper_league_matchups": 0.0,
+    "get_sleeper_league_rosters": 0.0,
+    "get_sleeper_league_transactions": 0.0,
+}
+
+
+def canonical_args(args: Any = (), kwargs: Optional[Dict[str, Any]] = None) -> str:
+    """Stable string form of call arguments (sorted keys, None-valued kwargs dropped)."""
+    payload = {
+        "args": list(args or ()),
+        "kwargs": {k: v for k, v in (kwargs or {}).items() if v is not None},
+    }
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+
+
+_IMMUTABLE = (str, bytes, int, float, bool, type(None))
+
+
+def _detached(value: Any) -> Any:
+    # most results are JSON text; only containers and result objects need a copy
+    if isinstance(value, _IMMUTABLE):
+        return value
+    try:
+        return copy.deepcopy(value)
+    except Exception:
+        return value
+
+
+class ResultCache:
+    """Bounded LRU cache whose entries expire after a per-tool TTL."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_policy: Optional[Dict[str, float]] = None,
+        default_ttl: float = 0.0,
+        stale_policy: Optional[Dict[str, float]] = None,
+    ):
+        self.max_entries = max(1, int(max_entries))
+        self.ttl_policy: Dict[str, float] = dict(DEFAULT_TTL_POLICY if ttl_policy is None else ttl_policy)
+        self.default_ttl = default_ttl
+        self.stale_policy: Dict[str, float] = dict(STALE_IF_ERROR_POLICY if stale_policy is None else stale_policy)
+        # (tool, url, args) -> (expires_at, value)
+        self._entries: "OrderedDict[Tuple[str, str, str], Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.stale_served = 0
+
+    def ttl_for(self, tool_name: str) -> float:
+        return float(self.ttl_policy.get(tool_name, self.default_ttl))
+
+    def cacheable(self, tool_name: str) -> bool:
+        return self.ttl_for(tool_name) > 0
+
+    def key(
+        self, tool_name: str, kwargs: Optional[Dict[str, Any]] = None, args: Any = (), url: str = ""
+    ) -> Tuple[str, str, str]:
+        return (tool_name, url, canonical_args(args, kwargs))
+
+    def get(
+        self, tool_name: str, kwargs: Optional[Dict[str, Any]] = None, args: Any = (), url: str = ""
+    ) -> Tuple[bool, Any]:
+        """Return (hit, value). Expired entries count as misses (but are kept for get_stale)."""
+        if not self.cacheable(tool_name):
+            return False, None
+        k = self.key(tool_name, kwargs, args, url)
+        entry = self._entries.get(k)
+        if entry is None or entry[0] <= time.monotonic():
+            self.misses += 1
+            return False, None
+        # mark as recently used
+        self._entries.move_to_end(k)
+        self.hits += 1
+        return True, _detached(entry[1])
+
+    def peek(self, tool_name: str, kwargs: Optional[Dict[str, Any]] = None, args: Any = (), url: str = "") -> Any:
+        """Return a fresh cached value or None, without touching counters or LRU order."""
+        entry = self._entries.get(self.key(tool_name, kwargs, args, url))
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return _detached(entry[1])
+
+    def get_stale(
+        self, tool_name: str, kwargs: Optional[Dict[str, Any]] = None, args: Any = (), url: str = ""
+    ) -> Tuple[bool, Any]:
+        """Return (found, value) for a last known good result still inside its stale-if-error window."""
+        window = float(self.stale_policy.get(tool_name, 0.0))
+        if window <= 0:
+            return False, None
+        entry = self._entries.get(self.key(tool_name, kwargs, args, url))
+        if entry is None or entry[0] + window <= time.monotonic():
+            return False, None
+        self.stale_served += 1
+        return True, _detached(entry[1])
+
+    def put(self, tool_name: str, kwargs: Optional[Dict[str, Any]], value: Any, args: Any = (), url: str = "") -> None:
+        ttl = self.ttl_for(tool_name)
+        if ttl <= 0:
+            return
+        k = self.key(tool_name, kwargs, args, url)
+        self._entries[k] = (time.monotonic() + ttl, _detached(value))
+        self._entries.move_to_end(k)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, tool_name: Optional[str] = None, url: Optional[str] = None) -> None:
+        """Drop every entry, or only the entries for one tool (on one server when `url` is given)."""
+        if tool_name is None:
+            self._entries.clear()
+            return
+        for k in [k for k in self._entries if k[0] == tool_name and (url is None or k[1] == url)]:
+            del self._entries[k]
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "stale_served": self.stale_served,
+            "hit_ratio": (self.hits / total) if total else 0.0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_CACHE: Optional[ResultCache] = None
+
+
+def get_cache() -> ResultCache:
+    """Return the process-wide result cache shared by every GridironTools instance."""
+    global _CACHE
+    if _CACHE is None:
+        _CACHE = ResultCache()
+    return _CACHE
@@ -0,0 +1,124 @@
+"""Compact table encodings for row-shaped stats results.
+
+`get_advanced_*_stats` and friends return up to 100 rows as a list of dicts,
+so every row repeats every key and the whole blob lands in the model
+context. These encoders emit the header once, round floats and drop columns
+that are null in every row:
+
+  csv     -> "rows: 2\\nplayer_name,season,targets\\nJa'Marr Chase,2023,145\\n..."
+  columns -> {"columns": [...], "rows": [[...], ...]}
+
+Non-row keys of a wrapped result (notes, errors) are kept as a trailing
+"meta:" JSON line / "meta" key. Results that aren't row-shaped pass through
+untouched.
+"""
+import csv
+import io
+import json
+import math
+from typing import Any, Dict, List, Optional
+
+from gridiron_toolkit.results import extra_fields, extract_rows, replace_content
+
+
+FORMATS = ("csv", "columns")
+
+DEFAULT_PRECISION = 2
+
+# every tool that returns a stats table; handy as GridironTools(compact_tools=STATS_TOOLS)
+STATS_TOOLS = (
+    "get_advanced_receiving_stats",
+    "get_advanced_passing_stats",
+    "get_advanced_rushing_stats",
+    "get_advanced_defense_stats",
+    "get_advanced_receiving_stats_weekly",
+    "get_advanced_passing_stats_weekly",
+    "get_advanced_rushing_stats_weekly",
+    "get_advanced_defense_stats_weekly",
+    "get_offensive_players_game_stats",
+    "get_defensive_players_game_stats",
+)
+
+
+def _columns(rows: List[Dict[str, Any]], drop_null_columns: bool) -> List[str]:
+    # first-seen key order, so identity columns the server puts first stay first
+    cols: Dict[str, bool] = {}
+    for row in rows:
+        for k, v in row.items():
+            if v is not None and v != "":
+                cols[k] = True
+            else:
+                cols.setdefault(k, False)
+    return [k for k, has_value in cols.items() if has_value or not drop_null_columns]
+
+
+def _round(value: Any, precision: int) -> Any:
+    if isinstance(value, float):
+        if not math.isfinite(value):
+            return None
+        r = round(value, precision)
+        return int(r) if r == int(r) else r
+    return value
+
+
+def _cell(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, default=str, separators=(",", ":"))
+    return str(value)
+
+
+def encode_csv(
+    rows: List[Dict[str, Any]],
+    precision: int = DEFAULT_PRECISION,
+    drop_null_columns: bool = True,
+    meta: Optional[Dict[str, Any]] = None,
+) -> str:
+    cols = _columns(rows, drop_null_columns)
+    buf = io.StringIO()
+    buf.write(f"rows: {len(rows)}\n")
+    writer = csv.writer(buf, lineterminator="\n")
+    writer.writerow(cols)
+    for row in rows:
+        writer.writerow([_cell(_round(row.get(c), precision)) for c in cols])
+    if meta:
+        buf.write("meta: " + json.dumps(meta, default=str, separators=(",", ":")) + "\n")
+    return buf.getvalue()
+
+
+def encode_columns(
+    rows: List[Dict[str, Any]],
+    precision: int = DEFAULT_PRECISION,
+    drop_null_columns: bool = True,
+    meta: Optional[Dict[str, Any]] = None,
+) -> str:
+    cols = _columns(rows, drop_null_columns)
+    table: Dict[str, Any] = {
+        "columns": cols,
+        "rows": [[_round(row.get(c), precision) for c in cols] for row in rows],
+    }
+    if meta:
+        table["meta"] = meta
+    return json.dumps(table, default=str, separators=(",", ":"))
+
+
+_ENCODERS = {"csv": encode_csv, "columns": encode_columns}
+
+
+def compact_result(
+    result: Any,
+    fmt: str = "csv",
+    precision: int = DEFAULT_PRECISION,
+    drop_null_columns: bool = True,
+) -> Any:
+    """Re-encode a row-shaped tool result as a compact table; anything else is returned as is."""
+    if fmt not in _ENCODERS:
+        raise ValueError(f"Unknown compact format '{fmt}'; expected one of {FORMATS}")
+    rows = extract_rows(result)
+    if rows is None:
+        return result
+    text = _ENCODERS[fmt](rows, precision=precision, drop_null_columns=drop_null_columns, meta=extra_fields(result))
+    return replace_content(result, text)
@@ -0,0 +1,170 @@
+"""Vectorized player comparisons over stats tool rows (NumPy/pandas).
+
+The supervisor asks for comparison tables and leader callouts ("who leads
+in PPR?"). The model used to do that arithmetic itself over raw JSON,
+which was slow, cost reasoning tokens, and was sometimes wrong. `compare_rows()`
+turns the rows of a `get_advanced_*` result into one numeric matrix and
+computes, in a single pass over every player and metric:
+
+  - per-game rates (volume metrics divided by games; weekly rows are averaged)
+  - percentile rank and z-score against a reference pool (the league rows
+    when given, else the compared players themselves)
+  - the delta from a baseline player (the first one by default)
+  - the leader for each metric
+
+The result is one long-format row per (player, metric), ready for
+compact.encode_csv. NumPy and pandas are optional dependencies of this module only.
+
+Usage:
+  table, leaders = compare_rows(rows, ["targets", "receiving_yards"], pool_rows=league_rows,
+                                per_game_metrics=["targets", "receiving_yards"])
+"""
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+    import pandas as pd
+except Exception:
+    np = None
+    pd = None
+
+# column holding games played, by source table
+GAMES_COLUMNS = ("games", "g")
+_NAME_COLUMNS = ("player_name", "player_display_name", "pfr_player_name", "merge_name")
+# games played per player, kept next to the metric columns
+GAMES = "__games__"
+
+
+def available() -> bool:
+    return np is not None and pd is not None
+
+
+def _require() -> None:
+    if not available():
+        raise ImportError("numpy and pandas are required for player comparisons; pip install numpy pandas")
+
+
+def _first_column(frame: "pd.DataFrame", candidates: Sequence[str]) -> Optional[str]:
+    for c in candidates:
+        if c in frame.columns and frame[c].notna().any():
+            return c
+    return None
+
+
+def to_frame(
+    rows: List[Dict[str, Any]],
+    metrics: Sequence[str],
+    per_game_metrics: Sequence[str] = (),
+) -> "pd.DataFrame":
+    """One row per player (and season, when several appear), indexed by label; metric columns are floats.
+
+    Weekly rows (a `week` column with repeats) are averaged into per-game values.
+    Seasonal `per_game_metrics` are divided by the games column.
+    """
+    _require()
+    frame = pd.DataFrame(rows)
+    if frame.empty:
+        return pd.DataFrame(columns=list(metrics), dtype=float)
+    name_col = _first_column(frame, _NAME_COLUMNS)
+    names = frame[name_col].astype(str) if name_col else pd.Series([f"row {i}" for i in range(len(frame))])
+    multi_season = "season" in frame.columns and frame["season"].nunique() > 1
+    labels = names + (" " + frame["season"].astype(str) if multi_season else "")
+    values = frame.reindex(columns=list(metrics)).apply(pd.to_numeric, errors="coerce")
+    values.index = labels.to_numpy()
+
+    if "week" in frame.columns and frame["week"].notna().any():
+        grouped = values.groupby(level=0, sort=False)
+        games = grouped.size().astype(float)
+        out = grouped.mean()
+    else:
+        games_col = _first_column(frame, GAMES_COLUMNS)
+        games = pd.to_numeric(frame[games_col], errors="coerce") if games_col else pd.Series(np.nan, index=frame.index)
+        games.index = values.index
+        out = values[~values.index.duplicated()]
+        games = games[~games.index.duplicated()]
+        cols = [m for m in per_game_metrics if m in out.columns]
+        if cols:
+            out[cols] = out[cols].div(games.where(games > 0), axis=0)
+    out.insert(0, GAMES, games.reindex(out.index))
+    return out
+
+
+def compare_rows(
+    rows: List[Dict[str, Any]],
+    metrics: Sequence[str],
+    pool_rows: Optional[List[Dict[str, Any]]] = None,
+    per_game_metrics: Sequence[str] = (),
+    baseline: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+    """Return (table, leaders) for the players in `rows` over `metrics`.
+
+    table: [{"player", "games", "metric", "value", "pct", "z", "delta", "rank"}, ...]
+    leaders: {metric: {"player": ..., "value": ...}}
+    Raises ValueError when `baseline` names none of the compared players.
+    """
+    _require()
+    metrics = list(dict.fromkeys(metrics))
+    players = to_frame(rows, metrics, per_game_metrics)
+    if players.empty:
+        return [], {}
+    pool = to_frame(pool_rows, metrics, per_game_metrics) if pool_rows else players
+
+    V = players[metrics].to_numpy(dtype=float)  # players x metrics
+    P = pool[metrics].to_numpy(dtype=float)  # pool x metrics
+    valid = ~np.isnan(P)
+    n = valid.sum(axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # percentile: share of the pool below the value, ties counted half
+        below = (P[None, :, :] < V[:, None, :]).sum(axis=1)
+        ties = (P[None, :, :] == V[:, None, :]).sum(axis=1)
+        pct = np.where(n > 0, 100.0 * (below + 0.5 * ties) / n, np.nan)
+        mean = np.nanmean(np.where(valid, P, np.nan), axis=0) if P.size else np.full(len(metrics), np.nan)
+        std = np.nanstd(np.where(valid, P, np.nan), axis=0) if P.size else np.full(len(metrics), np.nan)
+        z = np.where(std > 0, (V - mean) / std, 0.0)
+    z = np.where(np.isnan(V), np.nan, z)
+    pct = np.where(np.isnan(V), np.nan, pct)
+
+    labels = list(players.index)
+    base_idx = _baseline_index(labels, baseline)
+    delta = V - V[base_idx]
+    # rank 1 = highest among the compared players
+    ranks = (-np.nan_to_num(V, nan=-np.inf)).argsort(axis=0, kind="stable").argsort(axis=0) + 1
+
+    table: List[Dict[str, Any]] = []
+    games = players[GAMES].to_numpy(dtype=float)
+    for j, metric in enumerate(metrics):
+        for i, label in enumerate(labels):
+            table.append({
+                "player": label,
+                "games": None if np.isnan(games[i]) else games[i],
+                "metric": metric,
+                "value": _num(V[i, j]),
+                "pct": _num(pct[i, j]),
+                "z": _num(z[i, j]),
+                "delta": _num(delta[i, j]),
+                "rank": int(ranks[i, j]) if not np.isnan(V[i, j]) else None,
+            })
+
+    leaders: Dict[str, Dict[str, Any]] = {}
+    for j, metric in enumerate(metrics):
+        column = V[:, j]
+        if np.isnan(column).all():
+            continue
+        i = int(np.nanargmax(column))
+        leaders[metric] = {"player": labels[i], "value": _num(column[i])}
+    return table, leaders
+
+
+def _baseline_index(labels: List[str], baseline: Optional[str]) -> int:
+    if baseline is None:
+        return 0
+    if baseline in labels:
+        return labels.index(baseline)
+    folded = [label.lower() for label in labels]
+    if baseline.lower() in folded:
+        return folded.index(baseline.lower())
+    raise ValueError(f"baseline {baseline!r} is not one of the compared players: {labels}")
+
+
+def _num(value: float) -> Optional[float]:
+    return None if value is None or np.isnan(value) else float(value)
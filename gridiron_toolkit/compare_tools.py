@@ -0,0 +1,114 @@
+"""ComparisonTools: a local agno Toolkit that precomputes player comparisons.
+
+One `compare_players` call fetches the players' rows through
+GridironTools (so the shared pool, result cache, local snapshot and
+coalescing all apply), optionally fetches a league pool for percentiles
+(falling back to the compared players when that fetch fails), and
+returns the table from compare.compare_rows() as compact CSV with the
+leaders in the trailing meta line. The model reads a finished comparison
+instead of doing the arithmetic over raw JSON.
+
+Usage:
+  agent = Agent(tools=[GridironTools(url=server_url, ...), *comparison_tools(server_url)])
+"""
+import json
+from typing import Any, List, Optional
+
+from agno.tools import Toolkit
+
+from gridiron_toolkit.compact import STATS_TOOLS, encode_csv
+from gridiron_toolkit.compare import GAMES_COLUMNS, available, compare_rows
+from gridiron_toolkit.info import GridironTools
+from gridiron_toolkit.schemas import documented_metrics
+
+DEFAULT_POOL_SIZE = 200
+
+
+class ComparisonTools(Toolkit):
+    """Registers `compare_players`; needs numpy and pandas."""
+
+    def __init__(self, url: str, stats: Optional[GridironTools] = None, pool_size: int = DEFAULT_POOL_SIZE):
+        if not available():
+            raise ImportError("ComparisonTools needs numpy and pandas; pip install numpy pandas")
+        # pool, cache and coalescing are process-wide, so a private reader shares them anyway;
+        # raw rows only (no projection/compaction)
+        self._stats = stats or GridironTools(url=url, include_tools=list(STATS_TOOLS))
+        self._pool_size = pool_size
+        super().__init__(name="comparison_tools", tools=[self.compare_players])
+
+    async def compare_players(
+        self,
+        stat_tool: str,
+        player_names: List[str],
+        metrics: List[str],
+        season_list: Optional[List[int]] = None,
+        per_game_metrics: Optional[List[str]] = None,
+        baseline: Optional[str] = None,
+        league_percentiles: bool = True,
+    ) -> str:
+        """Compare players on several metrics in one step: values, per-game rates,
+        percentiles, z-scores, deltas and leaders.
+
+        Use this instead of computing comparisons yourself from raw stats.
+
+        Args:
+            stat_tool: which stats tool to read, e.g. "get_advanced_receiving_stats" or
+                "get_advanced_rushing_stats_weekly".
+            player_names: players to compare (partial names are matched like the stats tools do).
+            metrics: metric names documented by that tool (see get_metrics_metadata).
+            season_list: seasons to include; several seasons give one line per player-season.
+            per_game_metrics: volume metrics to divide by games played (seasonal tools only;
+                weekly tools are always averaged per game).
+            baseline: player the deltas are measured from, exactly as labelled in the
+                output (default: the first one).
+            league_percentiles: rank against the top league players for the given
+                season_list instead of only the compared players.
+
+        Returns:
+            CSV with one row per player and metric: player, games, metric, value, pct
+            (0-100 percentile), z, delta (vs baseline), rank. The last "meta:" line holds
+            the leader for each metric.
+        """
+        if stat_tool not in STATS_TOOLS:
+            return json.dumps({"error": f"stat_tool must be one of {list(STATS_TOOLS)}"})
+        if not metrics or not player_names:
+            return json.dumps({"error": "pass at least one player name and one metric"})
+        documented = documented_metrics(stat_tool) or frozenset()
+        games_col = next((c for c in GAMES_COLUMNS if c in documented), None)
+        requested = list(dict.fromkeys([*metrics, *([games_col] if games_col else [])]))
+        query: dict = {"metrics": requested}
+        if season_list:
+            query["season_list"] = season_list
+        try:
+            rows = await self._stats.fetch_rows(stat_tool, player_names=player_names, limit=self._pool_size, **query)
+        except Exception as e:
+            return json.dumps({"error": f"{type(e).__name__}: {e}"})
+        if not rows:
+            return json.dumps({"error": "no rows matched those players/seasons"})
+
+        # a league pool only means something for named seasons; without one, rank among the players
+        pool: Optional[List[Any]] = None
+        pool_error = None
+        if league_percentiles and season_list and "week" not in rows[0]:
+            try:
+                pool = await self._stats.fetch_rows(
+                    stat_tool, order_by_metric=metrics[0], limit=self._pool_size, **query
+                )
+            except Exception as e:
+                pool_error = f"{type(e).__name__}: {e}"
+        try:
+            table, leaders = compare_rows(
+                rows, metrics, pool_rows=pool, per_game_metrics=per_game_metrics or (), baseline=baseline
+            )
+        except ValueError as e:
+            return json.dumps({"error": str(e)})
+        percentiles_vs = f"top {len(pool)} by {metrics[0]}" if pool else "compared players"
+        meta = {"leaders": leaders, "percentiles_vs": percentiles_vs}
+        if pool_error:
+            meta["pool_error"] = pool_error
+        return encode_csv(table, meta=meta)
+
+
+def comparison_tools(url: str) -> List[Toolkit]:
+    """[ComparisonTools(url)] when numpy and pandas are installed, else [] (the agent just goes without)."""
+    return [ComparisonTools(url)] if available() else []
@@ -0,0 +1,156 @@
+"""Per-call deadlines and per-request time budgets for remote tool calls.
+
+Two limits bound every remote call:
+
+  - a per-tool default timeout (TOOL_TIMEOUTS, GRIDIRON_TOOL_TIMEOUT_SECONDS
+    for everything else), applied to each attempt;
+  - an overall budget for the current request. It lives in a ContextVar,
+    so every task the team run spawns (members, tool calls) inherits it
+    without threading it through agno. `request_budget()` sets it, and
+    `install_request_budget(app)` does that for every HTTP request.
+
+An attempt gets whichever limit is shorter. Once the request budget is
+spent, calls raise DeadlineExceeded straight away instead of queuing more
+work on the server. Timeouts cancel the awaiting coroutine, which is what
+cancels the underlying MCP request.
+
+RequestBudgetMiddleware (installed by `install_request_budget`) also watches
+for the client going away. On `http.disconnect` it cancels the request's
+handler task, and with it the team run and every MCP call still in flight.
+It is plain ASGI on purpose: BaseHTTPMiddleware (`@app.middleware("http")`)
+runs the handler in a separate task and does not propagate that
+cancellation cleanly.
+"""
+import asyncio
+import contextlib
+import contextvars
+import os
+import time
+from typing import Any, Awaitable, Dict, Iterator, Optional
+
+
+DEFAULT_TOOL_TIMEOUT = float(os.getenv("GRIDIRON_TOOL_TIMEOUT_SECONDS", "20"))
+DEFAULT_REQUEST_BUDGET = float(os.getenv("GRIDIRON_REQUEST_BUDGET_SECONDS", "120"))
+
+# seconds per attempt, by remote tool name
+TOOL_TIMEOUTS: Dict[str, float] = {
+    "get_metrics_metadata": 10.0,
+    "get_stats_metadata": 10.0,
+    "get_dictionary_info": 10.0,
+    "get_fantasy_rank_page_types": 10.0,
+    "get_player_info_tool": 10.0,
+    "get_players_by_sleeper_id_tool": 15.0,
+    "get_advanced_receiving_stats": 30.0,
+    "get_advanced_passing_stats": 30.0,
+    "get_advanced_rushing_stats": 30.0,
+    "get_advanced_defense_stats": 30.0,
+    "get_advanced_receiving_stats_weekly": 30.0,
+    "get_advanced_passing_stats_weekly": 30.0,
+    "get_advanced_rushing_stats_weekly": 30.0,
+    "get_advanced_defense_stats_weekly": 30.0,
+    "get_offensive_players_game_stats": 30.0,
+    "get_defensive_players_game_stats": 30.0,
+    "get_sleeper_league_transactions": 15.0,
+}
+
+# absolute time.monotonic() by which the current request must be done (None = unbounded)
+_DEADLINE: "contextvars.ContextVar[Optional[float]]" = contextvars.ContextVar("gridiron_deadline", default=None)
+
+
+class DeadlineExceeded(asyncio.TimeoutError):
+    """The current request's time budget is used up."""
+
+
+def remaining() -> Optional[float]:
+    """Seconds left in the current request budget, or None if there is none."""
+    deadline = _DEADLINE.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+@contextlib.contextmanager
+def request_budget(seconds: Optional[float]) -> Iterator[None]:
+    """Bound everything awaited inside the block (and tasks it spawns) to `seconds`.
+
+    Nested budgets can only shorten the deadline, never extend it.
+    """
+    if seconds is None:
+        yield
+        return
+    deadline = time.monotonic() + seconds
+    outer = _DEADLINE.get()
+    if outer is not None:
+        deadline = min(deadline, outer)
+    token = _DEADLINE.set(deadline)
+    try:
+        yield
+    finally:
+        _DEADLINE.reset(token)
+
+
+def timeout_for(tool_name: str, default: Optional[float] = None) -> float:
+    return TOOL_TIMEOUTS.get(tool_name, DEFAULT_TOOL_TIMEOUT if default is None else default)
+
+
+async def with_deadline(tool_name: str, awaitable: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+    """Await `awaitable` within the tool's timeout and the request budget, whichever ends first."""
+    limit = timeout_for(tool_name) if timeout is None else timeout
+    left = remaining()
+    if left is not None:
+        if left <= 0:
+            if asyncio.iscoroutine(awaitable):
+                awaitable.close()
+            raise DeadlineExceeded(f"{tool_name}: request time budget exhausted")
+        if left < limit:
+            try:
+                return await asyncio.wait_for(awaitable, left)
+            except asyncio.TimeoutError:
+                raise DeadlineExceeded(f"{tool_name}: request time budget exhausted") from None
+    return await asyncio.wait_for(awaitable, limit)
+
+
+class RequestBudgetMiddleware:
+    """ASGI middleware: a time budget per HTTP request, cancelled when the client disconnects."""
+
+    def __init__(self, app: Any, seconds: float = DEFAULT_REQUEST_BUDGET):
+        self.app = app
+        self.seconds = seconds
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope.get("type") != "http":
+            await self.app(scope, receive, send)
+            return
+        with request_budget(self.seconds):
+            await self._run(scope, receive, send)
+
+    async def _run(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        # the watcher is the only reader of `receive`; the handler reads what it relays
+        inbox: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue()
+        handler = asyncio.ensure_future(self.app(scope, inbox.get, send))
+        disconnected = False
+
+        async def watch() -> None:
+            nonlocal disconnected
+            while True:
+                message = await receive()
+                inbox.put_nowait(message)
+                if message.get("type") == "http.disconnect":
+                    disconnected = True
+                    handler.cancel()
+                    return
+
+        watcher = asyncio.ensure_future(watch())
+        try:
+            await handler
+        except asyncio.CancelledError:
+            if not disconnected:
+                raise
+            # the client is gone; there is nobody left to send an error to
+        finally:
+            watcher.cancel()
+
+
+def install_request_budget(app: Any, seconds: float = DEFAULT_REQUEST_BUDGET) -> None:
+    """Give every HTTP request on `app` a `seconds` budget and cancel it on client disconnect."""
+    app.add_middleware(RequestBudgetMiddleware, seconds=seconds)
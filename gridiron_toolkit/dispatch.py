@@ -0,0 +1,79 @@
+"""Prebuilt name -> entrypoint dispatch tables for connected MCP clients.
+
+Resolving a remote tool used to mean re-reading `client.functions`, checking
+whether it was a dict or a list, scanning it linearly, then falling back to
+`client.tools`, on every call. Instead the mapping is built once per client
+(after connect/initialize) as a read-only dict and reused until the client's
+tool list changes, so lookups stay O(1) however many tools the server adds.
+"""
+import weakref
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Optional, Tuple
+
+
+def _signature(client: Any) -> Tuple[int, int, int, int]:
+    # cheap change detector: a re-listed catalog replaces or resizes these containers
+    funcs = getattr(client, "functions", None)
+    tools = getattr(client, "tools", None)
+    return (
+        id(funcs),
+        len(funcs) if hasattr(funcs, "__len__") else 0,
+        id(tools),
+        len(tools) if hasattr(tools, "__len__") else 0,
+    )
+
+
+def build_dispatch_table(client: Any) -> Mapping[str, Callable[..., Any]]:
+    """Build an immutable tool name -> callable mapping from a connected client."""
+    table = {}
+    tools_map = getattr(client, "tools", None) or {}
+    if isinstance(tools_map, dict):
+        for name, obj in tools_map.items():
+            table[name] = getattr(obj, "entrypoint", None) or obj
+
+    # .functions wins over .tools, matching the old resolution order
+    funcs = getattr(client, "functions", None) or {}
+    items = funcs.items() if isinstance(funcs, dict) else ((getattr(f, "name", None), f) for f in funcs)
+    for name, obj in items:
+        if name is None:
+            continue
+        table[name] = getattr(obj, "entrypoint", None) or obj
+    return MappingProxyType(table)
+
+
+class _Entry:
+    __slots__ = ("signature", "table")
+
+    def __init__(self, signature: Tuple[int, int, int, int], table: Mapping[str, Callable[..., Any]]):
+        self.signature = signature
+        self.table = table
+
+
+# per-client tables; pooled clients are shared by many toolkits, so share the table too
+_TABLES: "weakref.WeakKeyDictionary[Any, _Entry]" = weakref.WeakKeyDictionary()
+
+
+def dispatch_table_for(client: Any) -> Mapping[str, Callable[..., Any]]:
+    """Return the dispatch table for `client`, rebuilding it only when its tool list changed."""
+    sig = _signature(client)
+    try:
+        entry = _TABLES.get(client)
+    except TypeError:
+        # not weak-referenceable; build without caching
+        return build_dispatch_table(client)
+    if entry is None or entry.signature != sig:
+        entry = _Entry(sig, build_dispatch_table(client))
+        _TABLES[client] = entry
+    return entry.table
+
+
+def resolve(client: Any, tool_name: str) -> Optional[Callable[..., Any]]:
+    """Look up `tool_name` on `client`, forcing one rebuild before reporting a miss."""
+    target = dispatch_table_for(client).get(tool_name)
+    if target is None:
+        try:
+            _TABLES.pop(client, None)
+        except TypeError:
+            pass
+        target = dispatch_table_for(client).get(tool_name)
+    return target
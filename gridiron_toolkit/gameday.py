@@ -0,0 +1,349 @@
+"""Game-day prefetch: warm the result caches before kickoff windows.
+
+Load spikes on Thursday night, Sunday and Monday night, and it is the same
+few hundred players and the active leagues of returning users every time.
+A PrefetchScheduler reads the recent team sessions from agno's
+PostgresStorage (`session_storage`). It pulls the tool calls out of each
+run, the coordinator's and its members', and ranks:
+
+  - tool + argument combinations, replayed as they were asked;
+  - players, warmed through get_player_info_tool, which also feeds the
+    name index and the identity map;
+  - league_ids, warmed as the league snapshot: rosters, users, settings
+    and this week's matchups.
+
+Calls pinned to another week of the season in progress are dropped;
+weekly stats from closed seasons are kept. Shortly before each kickoff
+window the top of that ranking is fetched through a GridironTools: each
+call GRIDIRON_PREFETCH_LEAD_MINUTES ahead, or half its result cache TTL
+ahead when that is shorter, so nothing has expired when the window opens.
+The shared result cache, league snapshots and identity map are then warm
+when the rush starts. A budget caps the spend: at most `budget` calls,
+`concurrency` at a time, and the run gives up after `max_errors`
+failures. The MCP server is never flooded, and it is left alone while it
+is struggling.
+
+Usage:
+  install_gameday_prefetch(app, server_url, storage_db)     # FastAPI startup/shutdown hooks
+  report = await PrefetchScheduler(tools, storage_db).run_once()
+"""
+import asyncio
+import datetime
+import json
+import logging
+import os
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from zoneinfo import ZoneInfo
+
+from gridiron_toolkit.cache import canonical_args, get_cache
+from gridiron_toolkit.league import nfl_week
+from gridiron_toolkit.localstore import current_season
+from gridiron_toolkit.schemas import get_tool
+from gridiron_toolkit.trending import TRENDING_TOOL
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUDGET = int(os.getenv("GRIDIRON_PREFETCH_BUDGET", "150"))
+DEFAULT_CONCURRENCY = int(os.getenv("GRIDIRON_PREFETCH_CONCURRENCY", "4"))
+DEFAULT_LEAD = float(os.getenv("GRIDIRON_PREFETCH_LEAD_MINUTES", "10")) * 60.0
+DEFAULT_LOOKBACK = float(os.getenv("GRIDIRON_PREFETCH_LOOKBACK_DAYS", "7")) * 24 * 3600.0
+DEFAULT_MAX_SESSIONS = 500
+DEFAULT_MAX_ERRORS = 10
+
+EASTERN = ZoneInfo("America/New_York")
+# weekday (Mon=0) -> kickoff times, US/Eastern
+KICKOFFS: Dict[int, Tuple[Tuple[int, int], ...]] = {
+    3: ((20, 15),),                     # Thursday night
+    6: ((13, 0), (16, 5), (20, 20)),    # Sunday early, late, night
+    0: ((20, 15),),                     # Monday night
+}
+
+PLAYER_INFO = "get_player_info_tool"
+# fetched per hot league; matchups also take the current week
+LEAGUE_TOOLS = ("get_sleeper_league_rosters", "get_sleeper_league_users", "get_sleeper_league_by_id")
+MATCHUPS_TOOL = "get_sleeper_league_matchups"
+MULTI_CALL = "multi_call"
+# kept fresh by the trending poller instead
+_SKIP_TOOLS = frozenset({TRENDING_TOOL})
+
+
+def next_kickoff(now: Optional[datetime.datetime] = None) -> datetime.datetime:
+    """The next kickoff window start after `now` (timezone-aware, US/Eastern)."""
+    now = (now or datetime.datetime.now(EASTERN)).astimezone(EASTERN)
+    for days in range(8):
+        day = (now + datetime.timedelta(days=days)).date()
+        for hour, minute in KICKOFFS.get(day.weekday(), ()):
+            kickoff = datetime.datetime(day.year, day.month, day.day, hour, minute, tzinfo=EASTERN)
+            if kickoff > now:
+                return kickoff
+    raise AssertionError("no kickoff within a week")
+
+
+def _field(obj: Any, name: str) -> Any:
+    return obj.get(name) if isinstance(obj, dict) else getattr(obj, name, None)
+
+
+def _args(raw: Any) -> Optional[Dict[str, Any]]:
+    if isinstance(raw, str):
+        try:
+            raw = json.loads(raw)
+        except ValueError:
+            return None
+    return raw if isinstance(raw, dict) else None
+
+
+def _tool_calls(node: Any, seen: set) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    # a run stores each call twice (message tool_calls and the run's tool executions); dedupe by call id
+    if isinstance(node, list):
+        for item in node:
+            yield from _tool_calls(item, seen)
+        return
+    if not isinstance(node, dict):
+        return
+    name, args, call_id = None, None, None
+    if "tool_name" in node and "tool_args" in node:
+        name, args, call_id = node.get("tool_name"), _args(node.get("tool_args")), node.get("tool_call_id")
+    elif isinstance(node.get("function"), dict) and "name" in node["function"]:
+        name, args, call_id = node["function"].get("name"), _args(node["function"].get("arguments")), node.get("id")
+    if name and args is not None and (call_id is None or call_id not in seen):
+        if call_id is not None:
+            seen.add(call_id)
+        if name == MULTI_CALL:
+            for call in args.get("calls") or ():
+                inner = _args(call.get("args") or call.get("arguments") or {}) if isinstance(call, dict) else None
+                tool = (call.get("tool") or call.get("name")) if isinstance(call, dict) else None
+                if tool and inner is not None:
+                    yield tool, inner
+        else:
+            yield name, args
+    for value in node.values():
+        if isinstance(value, (dict, list)):
+            yield from _tool_calls(value, seen)
+
+
+def harvest_calls(sessions: Iterable[Any], since: float = 0.0) -> List[Tuple[str, Dict[str, Any]]]:
+    """(tool, kwargs) for every remote tool call recorded in sessions updated after `since`."""
+    calls: List[Tuple[str, Dict[str, Any]]] = []
+    for session in sessions:
+        updated = _field(session, "updated_at") or _field(session, "created_at") or 0
+        if isinstance(updated, datetime.datetime):
+            updated = updated.timestamp()
+        if updated and float(updated) < since:
+            continue
+        memory = _field(session, "memory")
+        if isinstance(memory, str):
+            memory = _args(memory)
+        seen: set = set()
+        calls.extend((t, a) for t, a in _tool_calls(memory or {}, seen) if get_tool(t) is not None)
+    return calls
+
+
+class PrefetchPlan:
+    """Ranked (tool, kwargs) calls, most requested first, plus the tallies behind them."""
+
+    def __init__(self, calls: List[Tuple[str, Dict[str, Any]]], players: Counter, leagues: Counter, combos: Counter):
+        self.calls = calls
+        self.players = players
+        self.leagues = leagues
+        self.combos = combos
+
+    def as_dict(self, top: int = 10) -> Dict[str, Any]:
+        return {
+            "calls": len(self.calls),
+            "top_players": self.players.most_common(top),
+            "top_leagues": self.leagues.most_common(top),
+        }
+
+
+def _other_week(kwargs: Dict[str, Any], week: int, season: int) -> bool:
+    # last week's matchups, or this season's weekly stats without this week, won't be what
+    # this window asks for; a closed season's weeks never change, so those stay worth warming
+    if kwargs.get("week") not in (None, "") and str(kwargs["week"]) != str(week):
+        return True
+    weeks = kwargs.get("weekly_list")
+    if not isinstance(weeks, list) or not weeks or str(week) in {str(w) for w in weeks}:
+        return False
+    seasons = kwargs.get("season_list")
+    if not isinstance(seasons, list) or not seasons:
+        # no season filter means "all seasons", which includes the current one
+        return True
+    return str(season) in {str(s) for s in seasons}
+
+
+def plan_prefetch(
+    calls: Sequence[Tuple[str, Dict[str, Any]]],
+    budget: int = DEFAULT_BUDGET,
+    week: Optional[int] = None,
+    cacheable: Any = None,
+    season: Optional[int] = None,
+) -> PrefetchPlan:
+    """Rank harvested calls into at most `budget` distinct calls worth warming.
+
+    Combos pinned to a week other than `week` (by `week`, or by a `weekly_list` that
+    covers `season`, the one in progress) are dropped.
+    """
+    cacheable = cacheable or get_cache().cacheable
+    week = nfl_week() if week is None else week
+    season = current_season() if season is None else season
+    combos: Counter = Counter()
+    players: Counter = Counter()
+    leagues: Counter = Counter()
+    first: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    for tool, kwargs in calls:
+        names = kwargs.get("player_names")
+        for name in names if isinstance(names, list) else [names] if isinstance(names, str) else ():
+            players[str(name)] += 1
+        if kwargs.get("league_id") not in (None, ""):
+            leagues[str(kwargs["league_id"])] += 1
+        if tool in _SKIP_TOOLS or not cacheable(tool) or _other_week(kwargs, week, season):
+            continue
+        key = (tool, canonical_args((), kwargs))
+        combos[key] += 1
+        first.setdefault(key, kwargs)
+
+    # one candidate list, scored by how often it was asked for; exact combos win ties
+    scored: Dict[Tuple[str, str], Tuple[int, int, str, Dict[str, Any]]] = {}
+
+    def offer(count: int, rank: int, tool: str, kwargs: Dict[str, Any]) -> None:
+        key = (tool, canonical_args((), kwargs))
+        if key not in scored or scored[key][:2] < (count, rank):
+            scored[key] = (count, rank, tool, kwargs)
+
+    for key, count in combos.items():
+        offer(count, 2, key[0], first[key])
+    for name, count in players.items():
+        offer(count, 1, PLAYER_INFO, {"player_names": [name]})
+    for league_id, count in leagues.items():
+        for tool in LEAGUE_TOOLS:
+            offer(count, 0, tool, {"league_id": league_id})
+        if week > 0:
+            offer(count, 0, MATCHUPS_TOOL, {"league_id": league_id, "week": week})
+
+    ranked = sorted(scored.values(), key=lambda s: (-s[0], -s[1], s[2]))
+    return PrefetchPlan([(tool, kwargs) for _, _, tool, kwargs in ranked[:max(0, budget)]], players, leagues, combos)
+
+
+async def load_sessions(storage: Any, limit: int = DEFAULT_MAX_SESSIONS) -> List[Any]:
+    """Most recent sessions from an agno storage; the driver is synchronous, so off the loop."""
+    recent = getattr(storage, "get_recent_sessions", None)
+    if recent is not None:
+        return list(await asyncio.to_thread(recent, limit=limit) or [])
+    sessions = list(await asyncio.to_thread(storage.get_all_sessions) or [])
+    sessions.sort(key=lambda s: _field(s, "updated_at") or 0, reverse=True)
+    return sessions[:limit]
+
+
+class PrefetchScheduler:
+    """Warms the caches from session history ahead of each kickoff window."""
+
+    def __init__(
+        self,
+        toolkit: Any,
+        storage: Any,
+        budget: int = DEFAULT_BUDGET,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        lead: float = DEFAULT_LEAD,
+        lookback: float = DEFAULT_LOOKBACK,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        max_errors: int = DEFAULT_MAX_ERRORS,
+        ttl_for: Optional[Callable[[str], float]] = None,
+    ):
+        self.toolkit = toolkit
+        self.storage = storage
+        self.budget = budget
+        self.concurrency = max(1, concurrency)
+        self.lead = lead
+        self.lookback = lookback
+        self.max_sessions = max_sessions
+        self.max_errors = max_errors
+        # the result cache's per-tool TTL; a call is warmed no earlier than half of it before kickoff
+        self._ttl_for = ttl_for
+        self._task: Optional["asyncio.Task[None]"] = None
+        self.last_run: Optional[Dict[str, Any]] = None
+
+    def lead_for(self, tool_name: str) -> float:
+        """Seconds before kickoff to fetch `tool_name`: the lead, capped at half its cache TTL."""
+        ttl = (self._ttl_for or get_cache().ttl_for)(tool_name)
+        return min(self.lead, ttl / 2.0) if ttl > 0 else self.lead
+
+    async def run_once(self, kickoff: Optional[datetime.datetime] = None) -> Dict[str, Any]:
+        """Plan from the current session history and fetch it within the budget.
+
+        With a `kickoff`, each call waits until lead_for(tool) before it; otherwise all run now.
+        """
+        started = time.monotonic()
+        sessions = await load_sessions(self.storage, self.max_sessions)
+        plan = plan_prefetch(harvest_calls(sessions, since=time.time() - self.lookback), budget=self.budget)
+        sem = asyncio.Semaphore(self.concurrency)
+        done = 0
+        errors: List[str] = []
+
+        async def one(tool: str, kwargs: Dict[str, Any]) -> None:
+            nonlocal done
+            if kickoff is not None:
+                start = kickoff - datetime.timedelta(seconds=self.lead_for(tool))
+                await asyncio.sleep(max(0.0, (start - datetime.datetime.now(EASTERN)).total_seconds()))
+            async with sem:
+                if len(errors) >= self.max_errors:
+                    return  # the server is struggling; stop adding load
+                try:
+                    await self.toolkit.call(tool, **kwargs)
+                    done += 1
+                except Exception as e:
+                    errors.append(f"{tool}: {type(e).__name__}: {e}")
+
+        await asyncio.gather(*(one(t, kw) for t, kw in plan.calls))
+        self.last_run = {
+            "sessions": len(sessions),
+            **plan.as_dict(),
+            "fetched": done,
+            "errors": errors[: self.max_errors],
+            "duration_seconds": round(time.monotonic() - started, 3),
+        }
+        logger.info("game-day prefetch: %d/%d calls warmed, %d errors", done, len(plan.calls), len(errors))
+        return self.last_run
+
+    async def _run(self) -> None:
+        while True:
+            kickoff = next_kickoff()
+            delay = (kickoff - datetime.datetime.now(EASTERN)).total_seconds() - self.lead
+            await asyncio.sleep(max(0.0, delay))
+            if nfl_week() > 0:
+                try:
+                    await self.run_once(kickoff)
+                except Exception as e:
+                    logger.warning("game-day prefetch failed: %s: %s", type(e).__name__, e)
+            # wait out this window before planning the next one
+            await asyncio.sleep(max(0.0, (kickoff - datetime.datetime.now(EASTERN)).total_seconds()) + 1.0)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+
+def install_gameday_prefetch(app: Any, url: str, storage: Any, **options: Any) -> PrefetchScheduler:
+    """Run a PrefetchScheduler from `app` startup until shutdown."""
+    from gridiron_toolkit.info import GridironTools
+
+    scheduler = PrefetchScheduler(GridironTools(url=url), storage, **options)
+
+    @app.on_event("startup")
+    async def _gridiron_gameday_start():
+        scheduler.start()
+
+    @app.on_event("shutdown")
+    async def _gridiron_gameday_stop():
+        await scheduler.stop()
+
+    return scheduler
@@ -0,0 +1,193 @@
+"""Sleeper id -> player identity map, kept in memory and persisted to disk.
+
+Every roster question expands `get_sleeper_league_rosters` player ids with
+`get_players_by_sleeper_id_tool`. A dynasty roster has 300+ ids, and
+they were all resolved remotely on every turn. IdentityMap keeps the
+rows those lookups return, keyed by sleeper id, with gsis id, pfr id and
+merge_name cross-references. A roster expansion is then a dictionary join.
+Only ids the map has never seen, or whose row is older than `max_age`
+(teams change), go to the server.
+
+The map is written to GRIDIRON_IDENTITY_PATH as JSON, at most once per
+`save_interval` seconds and again on shutdown, so a restart comes up warm.
+Set the variable to an empty string to keep it memory-only.
+
+Usage:
+  ids = get_identity_map()
+  found, missing = ids.lookup(["4046", "6794"])
+  ids.add_rows(remote_rows)
+"""
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_IDENTITY_PATH = os.getenv(
+    "GRIDIRON_IDENTITY_PATH", os.path.join(os.path.expanduser("~"), ".cache", "gridiron", "sleeper_identity.json")
+)
+DEFAULT_MAX_AGE = float(os.getenv("GRIDIRON_IDENTITY_MAX_AGE_HOURS", "24")) * 3600.0
+DEFAULT_SAVE_INTERVAL = 60.0
+
+# cross-reference columns -> secondary index
+XREF_FIELDS = ("gsis_id", "pfr_id", "merge_name")
+
+
+class IdentityMap:
+    """Rows by sleeper id, plus gsis/pfr/merge_name -> sleeper id indexes."""
+
+    def __init__(
+        self,
+        path: Optional[str] = DEFAULT_IDENTITY_PATH,
+        max_age: float = DEFAULT_MAX_AGE,
+        save_interval: float = DEFAULT_SAVE_INTERVAL,
+    ):
+        self.path = path or None
+        self.max_age = max_age
+        self.save_interval = save_interval
+        # sleeper id -> (fetched_at wall clock, row)
+        self._rows: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._xref: Dict[str, Dict[str, str]] = {f: {} for f in XREF_FIELDS}
+        self._dirty = False
+        self._saved_at = 0.0
+        self.hits = 0
+        self.misses = 0
+        if self.path:
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def _index(self, sleeper_id: str, row: Dict[str, Any]) -> None:
+        for field in XREF_FIELDS:
+            value = row.get(field)
+            if value not in (None, ""):
+                self._xref[field][str(value).lower() if field == "merge_name" else str(value)] = sleeper_id
+
+    def add_rows(self, rows: Iterable[Dict[str, Any]], fetched_at: Optional[float] = None) -> int:
+        """Upsert rows that carry a sleeper_id; returns how many were stored."""
+        now = time.time() if fetched_at is None else fetched_at
+        n = 0
+        for row in rows:
+            if not isinstance(row, dict) or row.get("sleeper_id") in (None, ""):
+                continue
+            sid = str(row["sleeper_id"])
+            self._rows[sid] = (now, row)
+            self._index(sid, row)
+            n += 1
+        if n:
+            self._dirty = True
+        return n
+
+    def get(self, sleeper_id: str) -> Optional[Dict[str, Any]]:
+        entry = self._rows.get(str(sleeper_id))
+        return entry[1] if entry is not None else None
+
+    def lookup(self, sleeper_ids: Iterable[Any]) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """(rows we hold fresh, in request order; ids that must be fetched)."""
+        cutoff = time.time() - self.max_age
+        found: List[Dict[str, Any]] = []
+        missing: List[str] = []
+        for raw in sleeper_ids:
+            sid = str(raw)
+            entry = self._rows.get(sid)
+            if entry is None or entry[0] < cutoff:
+                missing.append(sid)
+            else:
+                found.append(entry[1])
+        self.hits += len(found)
+        self.misses += len(missing)
+        return found, list(dict.fromkeys(missing))
+
+    def sleeper_id_for(self, gsis_id: Optional[str] = None, pfr_id: Optional[str] = None,
+                       merge_name: Optional[str] = None) -> Optional[str]:
+        """Cross-reference another id (or merge_name) back to a sleeper id."""
+        if gsis_id:
+            return self._xref["gsis_id"].get(str(gsis_id))
+        if pfr_id:
+            return self._xref["pfr_id"].get(str(pfr_id))
+        if merge_name:
+            return self._xref["merge_name"].get(str(merge_name).lower())
+        return None
+
+    def load(self) -> int:
+        if not self.path or not os.path.exists(self.path):
+            return 0
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.warning("ignoring unreadable identity map %s: %s", self.path, e)
+            return 0
+        for sid, (fetched_at, row) in (data.get("players") or {}).items():
+            self._rows[str(sid)] = (float(fetched_at), row)
+            self._index(str(sid), row)
+        self._saved_at = time.monotonic()
+        return len(self._rows)
+
+    def _due(self, force: bool) -> bool:
+        if not self.path or not self._dirty:
+            return False
+        return force or time.monotonic() - self._saved_at >= self.save_interval
+
+    def _snapshot(self) -> Dict[str, Any]:
+        # copied on the caller's thread so the write never iterates a map that is still changing
+        payload = {"version": 1, "players": {k: list(v) for k, v in self._rows.items()}}
+        self._dirty = False
+        self._saved_at = time.monotonic()
+        return payload
+
+    def _write(self, payload: Dict[str, Any]) -> bool:
+        folder = os.path.dirname(self.path) or "."
+        tmp = None
+        try:
+            os.makedirs(folder, exist_ok=True)
+            # write-then-rename so a crash never leaves half a file behind
+            fd, tmp = tempfile.mkstemp(dir=folder, prefix=".identity-", suffix=".json")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, default=str, separators=(",", ":"))
+            os.replace(tmp, self.path)
+        except Exception as e:
+            logger.warning("could not persist identity map to %s: %s", self.path, e)
+            if tmp is not None and os.path.exists(tmp):
+                os.remove(tmp)
+            self._dirty = True
+            return False
+        return True
+
+    def save(self, force: bool = False) -> bool:
+        """Write the map if it changed (and, unless forced, the save interval has passed)."""
+        if not self._due(force):
+            return False
+        return self._write(self._snapshot())
+
+    async def save_async(self, force: bool = False) -> bool:
+        """save() for the event loop: the map is copied in place, the file written on a worker thread."""
+        if not self._due(force):
+            return False
+        payload = self._snapshot()
+        return await asyncio.to_thread(self._write, payload)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"players": len(self._rows), "hits": self.hits, "misses": self.misses}
+
+
+_IDENTITY: Optional[IdentityMap] = None
+
+
+def get_identity_map() -> IdentityMap:
+    """Return the process-wide identity map shared by every GridironTools instance."""
+    global _IDENTITY
+    if _IDENTITY is None:
+        _IDENTITY = IdentityMap()
+    return _IDENTITY
+
+
+def save_identity_map() -> None:
+    """Flush the process-wide map to disk (call on shutdown)."""
+    if _IDENTITY is not None:
+        _IDENTITY.save(force=True)
@@ -1,10 +1,48 @@
 import asyncio
-from typing import Any, List, Optional, Dict, Callable
-from collections import OrderedDict
+import inspect
+import json
+import re
+import time
+from typing import Any, AsyncIterator, Deque, List, Optional, Dict, Callable, Iterable, Tuple, Union
+from collections import OrderedDict, deque
 
 from agno.tools import Toolkit
 from agno.tools.mcp import MCPTools
 
+from gridiron_toolkit.answers import note_tool, note_tool_error
+from gridiron_toolkit.batching import BATCHABLE_TOOLS, MicroBatcher, batch_values
+from gridiron_toolkit.cache import DEFAULT_TTL_POLICY, ResultCache, canonical_args, get_cache
+from gridiron_toolkit.compact import FORMATS, compact_result
+from gridiron_toolkit.deadline import DeadlineExceeded, with_deadline
+from gridiron_toolkit.dispatch import dispatch_table_for, resolve
+from gridiron_toolkit.identity import IdentityMap, get_identity_map
+from gridiron_toolkit.league import (
+    SNAPSHOT_TOOLS,
+    TRANSACTIONS_TOOL,
+    LeagueSnapshotCache,
+    get_league_snapshots,
+    nfl_week,
+)
+from gridiron_toolkit.localstore import LocalStatsStore, get_local_store
+from gridiron_toolkit.metrics import ToolMetrics, get_metrics, payload_size
+from gridiron_toolkit.names import PlayerNameIndex, get_name_index
+from gridiron_toolkit.normalize import check_metrics, metric_names_in, normalize_args
+from gridiron_toolkit.paging import (
+    DEFAULT_PAGE_SIZE,
+    DEFAULT_PREFETCH,
+    DEFAULT_WEEKS_PER_PAGE,
+    STREAMABLE_TOOLS,
+    Page,
+    plan_pages,
+)
+from gridiron_toolkit.pool import MCPSessionPool, get_pool, is_connection_error
+from gridiron_toolkit.projection import project_result
+from gridiron_toolkit.resilience import RetryPolicy, call_with_retry, get_breaker, is_idempotent
+from gridiron_toolkit.results import add_fields, empty_like, extra_fields, extract_rows, replace_rows
+from gridiron_toolkit.schemas import apply_schema, validate_args
+from gridiron_toolkit.singleflight import SingleFlight, get_singleflight
+from gridiron_toolkit.trending import TRENDING_TOOL, TrendingSnapshot, get_trending_snapshot
+
 
 # All known remote MCP tool names (expand if you add more)
 ALL_TOOL_NAMES = [
@@ -34,6 +72,45 @@ ALL_TOOL_NAMES = [
     "get_defensive_players_game_stats",
 ]
 
+# name of the local fan-out tool (see GridironTools.gather)
+MULTI_CALL = "multi_call"
+DEFAULT_GATHER_CONCURRENCY = 4
+DEFAULT_GATHER_TIMEOUT = 30.0
+
+# get_advanced_<category>_stats[_weekly] -> get_metrics_metadata(category=<category>)
+_STATS_CATEGORY = re.compile(r"^get_advanced_(receiving|passing|rushing|defense)_stats")
+
+_NO_RETRY = RetryPolicy(max_attempts=1)
+
+SLEEPER_LOOKUP = "get_players_by_sleeper_id_tool"
+# tools whose rows teach the name index and the identity map
+_NAME_SOURCES = ("get_player_info_tool", SLEEPER_LOOKUP)
+
+
+def _retryable(exc: BaseException) -> bool:
+    # broken transport or a timed-out attempt; tool-level errors and a spent request budget are not
+    if isinstance(exc, DeadlineExceeded):
+        return False
+    return is_connection_error(exc) or isinstance(exc, asyncio.TimeoutError)
+
+
+def _opt(instance: Any, enabled: bool, default_factory: Callable[[], Any]) -> Any:
+    # an optional layer: None when disabled, else the instance passed in or the process-wide one.
+    # Checked with `is not None`: an empty cache or index is falsy through __len__
+    if not enabled:
+        return None
+    return instance if instance is not None else default_factory()
+
+
+def _takes_agent(target: Any) -> bool:
+    # agno's MCP entrypoints are partial(call_tool, tool_name=...) with a leading `agent`
+    # parameter; code-path calls (agent=None) still have to fill it
+    try:
+        params = list(inspect.signature(target).parameters)
+    except (TypeError, ValueError):
+        return False
+    return bool(params) and params[0] == "agent"
+
 
 class GridironTools(Toolkit):
     """
@@ -43,6 +120,29 @@ class GridironTools(Toolkit):
       - In an agent: tools=[GridironTools(include_tools=["get_player_info_tool"])]
       - If include_tools is None, the toolkit registers wrappers for ALL_TOOL_NAMES.
       - Callbacks are async and awaited by the Agent.
+      - By default every instance borrows sessions from the process-wide pool for
+        its url (see gridiron_toolkit.pool); pass use_pool=False for a private client.
+      - multi_call=True also registers a "multi_call" tool that runs several of the
+        exposed tools concurrently in one agent step (see gather()).
+      - Remote calls are bounded by per-tool timeouts and the current request's
+        budget (see gridiron_toolkit.deadline); `timeouts` overrides per tool.
+      - For multi-season weekly pulls in code, `async for page in tools.stream(...)`
+        pages the query instead of buffering it (see gridiron_toolkit.paging).
+      - `player_names` that exactly match a known player once normalized ("Jamarr Chase")
+        or an alias ("cmc") are corrected from a local index of players seen so far
+        (see gridiron_toolkit.names); fuzzy corrections are only tried when a call
+        comes back empty, and the result then lists them under "names_changed".
+        resolve_names=False opts out.
+      - get_players_by_sleeper_id_tool only asks the server for ids the identity map
+        (gridiron_toolkit.identity) doesn't already hold.
+      - Sleeper league rosters/users/settings/matchups are served from a per-league
+        snapshot until the NFL week turns or a new transaction shows up
+        (gridiron_toolkit.league). A part older than its result cache TTL is only
+        served after a transactions call for the league shows no new moves.
+      - get_sleeper_trending_players is answered from the snapshot a background
+        TrendingPoller keeps fresh (gridiron_toolkit.trending), when one is running.
+      - Closed seasons come from the local DuckDB snapshot when GRIDIRON_LOCAL_STORE
+        is set (see gridiron_toolkit.localstore); use_local_store=False opts out.
     """
 
     def __init__(
@@ -51,12 +151,37 @@ class GridironTools(Toolkit):
         transport: str = "streamable-http",
         include_tools: Optional[List[str]] = None,
         exclude_tools: Optional[List[str]] = None,
+        use_pool: bool = True,
+        pool_size: Optional[int] = None,
+        pool: Optional[MCPSessionPool] = None,
+        cache: Optional[ResultCache] = None,
+        use_cache: bool = True,
+        coalesce: bool = True,
+        batch_lookups: bool = True,
+        metrics: Optional[ToolMetrics] = None,
+        compact_tools: Optional[Union[Iterable[str], Dict[str, str]]] = None,
+        project_results: bool = False,
+        validate: bool = True,
+        multi_call: bool = False,
+        retry: Optional[RetryPolicy] = None,
+        circuit_breaker: bool = True,
+        timeouts: Optional[Dict[str, float]] = None,
+        local_store: Optional[LocalStatsStore] = None,
+        use_local_store: bool = True,
+        resolve_names: bool = True,
+        name_index: Optional[PlayerNameIndex] = None,
+        use_identity_map: bool = True,
+        identity_map: Optional[IdentityMap] = None,
+        use_league_snapshots: bool = True,
+        league_snapshots: Optional[LeagueSnapshotCache] = None,
+        use_trending_snapshot: bool = True,
+        trending_snapshot: Optional[TrendingSnapshot] = None,
     ):
         # decide which remote tool names to expose
         if include_tools is None:
             tool_names = list(ALL_TOOL_NAMES)
         else:
-            tool_names = list(include_tools)
+            tool_names = [t for t in include_tools if t != MULTI_CALL]
 
         # dynamically create async wrapper callables named after remote tools
         wrappers: List[Callable[..., Any]] = []
@@ -64,28 +189,88 @@ class GridironTools(Toolkit):
         def make_wrapper(tname: str) -> Callable[..., Any]:
             # Agent passes itself as the first arg for tool calls; preserve and forward it.
             async def _wrapper(agent, *args, **kwargs):
-                return await self._call_remote(tname, agent, *args, **kwargs)
+                return await self._call(tname, agent, args, kwargs)
 
             # set the function name so Toolkit registration & introspection work
             try:
                 _wrapper.__name__ = tname
             except Exception:
                 pass
-            return _wrapper
+            # typed signature + description from tool_list.py, so agno builds a real
+            # parameter schema without asking the server (see schemas.py)
+            return apply_schema(_wrapper, tname)
 
         for tn in tool_names:
             wrappers.append(make_wrapper(tn))
 
+        if multi_call:
+            wrappers.append(self._make_multi_call())
+            if include_tools is not None and MULTI_CALL not in include_tools:
+                include_tools = list(include_tools) + [MULTI_CALL]
+
         # register the wrapper callables with Toolkit so Agents can use them
         super().__init__(name="gridiron_tools", tools=wrappers, include_tools=include_tools, exclude_tools=exclude_tools)
 
-        # underlying MCP client; pass include_tools so the MCP client only registers those remote tools
-        self._mcp = MCPTools(transport=transport, url=url, include_tools=include_tools, exclude_tools=exclude_tools)
+        # underlying MCP client. Pooled clients are shared and unfiltered (the wrappers above
+        # already limit what the agent sees); a private client only registers include_tools.
+        self._pool: Optional[MCPSessionPool] = _opt(pool, use_pool, lambda: get_pool(url, transport, size=pool_size))
+        self._mcp: Optional[MCPTools] = None
+        if self._pool is None:
+            self._mcp = MCPTools(transport=transport, url=url, include_tools=include_tools, exclude_tools=exclude_tools)
         self._connected = False
+        # results are shared process-wide unless a dedicated cache is passed in
+        self._cache: Optional[ResultCache] = _opt(cache, use_cache, get_cache)
+        # concurrent identical calls (same server, tool and args) share one in-flight request
+        self._url = url
+        self._flight: Optional[SingleFlight] = get_singleflight() if coalesce else None
+        # player lookups from concurrent chats are merged into one remote call (see batching.py)
+        self._batch_lookups = batch_lookups
+        self._batchers: Dict[str, MicroBatcher] = {}
+        # per-tool latency / payload / error histograms (served at /metrics)
+        self._metrics: ToolMetrics = metrics or get_metrics()
+        # tool -> compact table format ("csv" / "columns") applied to row results before the LLM sees them
+        if isinstance(compact_tools, dict):
+            self._compact: Dict[str, str] = dict(compact_tools)
+        else:
+            self._compact = {t: "csv" for t in (compact_tools or ())}
+        bad = sorted(set(self._compact.values()) - set(FORMATS))
+        if bad:
+            raise ValueError(f"Unknown compact format(s) {bad}; expected one of {FORMATS}")
+        # trim stats rows to the requested metrics + identity columns (see projection.py)
+        self._project = project_results
+        # coerce and check arguments against the tool's inputSchema before the network hop
+        self._validate = validate
+        # read tools are retried with jittered backoff; a per-tool breaker fails fast while
+        # the backend struggles and the cache's stale-if-error window covers the gap
+        self._retry = retry or RetryPolicy()
+        self._circuit_breaker = circuit_breaker
+        # per-attempt timeouts override deadline.TOOL_TIMEOUTS; the request budget still applies
+        self._timeouts: Dict[str, float] = dict(timeouts or {})
+        # closed seasons answered in-process when a snapshot is configured (see localstore.py)
+        self._local: Optional[LocalStatsStore] = _opt(local_store, use_local_store, get_local_store)
+        # player_names the server would miss are corrected from a local index (see names.py)
+        self._names: Optional[PlayerNameIndex] = _opt(name_index, resolve_names, get_name_index)
+        # sleeper id lookups are answered from the in-process identity map (see identity.py)
+        self._identity: Optional[IdentityMap] = _opt(identity_map, use_identity_map, get_identity_map)
+        # an empty copy of the last good remote sleeper lookup: the container all-hit
+        # expansions are answered in (never its other keys, such as an error)
+        self._sleeper_shape: Any = None
+        # one consistent per-league view of rosters/users/settings/matchups (see league.py)
+        self._league: Optional[LeagueSnapshotCache] = _opt(league_snapshots, use_league_snapshots, get_league_snapshots)
+        # trending adds/drops polled on a schedule, shared by every session (see trending.py)
+        self._trending: Optional[TrendingSnapshot] = _opt(
+            trending_snapshot, use_trending_snapshot, get_trending_snapshot
+        )
         # keep a mapping of wrapper callables so callers can look them up if needed
         self._wrappers_map = {getattr(w, "__name__", f"wrapper_{i}"): w for i, w in enumerate(wrappers)}
 
     async def connect(self) -> None:
+        if self._pool is not None:
+            # the pool health-checks and reconnects for us; this only makes sure a session is up.
+            # Calls take their own client from acquire() (see _client), never shared state.
+            await self._pool.acquire()
+            self._connected = True
+            return
         if self._connected:
             return
         await self._mcp.connect()
@@ -94,9 +279,14 @@ class GridironTools(Toolkit):
                 await self._mcp.initialize()
             except Exception:
                 pass
+        dispatch_table_for(self._mcp)
         self._connected = True
 
     async def close(self) -> None:
+        if self._pool is not None:
+            # pooled sessions are shared with other toolkits; close_all_pools() owns them
+            self._connected = False
+            return
         # best-effort close — swallow expected errors coming from async generators / event-loop teardown
         try:
             await self._mcp.close()
@@ -114,44 +304,358 @@ class GridironTools(Toolkit):
         finally:
             self._connected = False
 
+    async def _client(self) -> MCPTools:
+        # pooled: each call holds the slot it was handed in a local, since concurrent
+        # calls on this toolkit (and close()) must not swap the client under one another
+        if self._pool is not None:
+            return await self._pool.acquire()
+        await self.connect()
+        return self._mcp
+
     async def _call_remote(self, tool_name: str, /, *args, **kwargs) -> Any:
         # accept optional agent as first positional param
         agent = None
         if len(args) and getattr(args[0], "__class__", None):
             # caller likely passed agent as first arg
             agent, args = args[0], args[1:]
+        return await self._call(tool_name, agent, args, kwargs)
 
-        await self.connect()
-        funcs = getattr(self._mcp, "functions", {}) or {}
-        # normalize funcs whether dict or list
-        if isinstance(funcs, dict):
-            func_obj = funcs.get(tool_name)
+    async def call(self, tool_name: str, /, **kwargs) -> Any:
+        """Fast path for code (not agents): call a remote tool with keyword args only."""
+        return await self._call(tool_name, None, (), kwargs)
+
+    async def _call(self, tool_name: str, agent: Any, args: tuple, kwargs: Dict[str, Any]) -> Any:
+        kwargs, result = await self._fetch(tool_name, agent, args, kwargs)
+        return self._postprocess(tool_name, kwargs, result)
+
+    async def _fetch(
+        self, tool_name: str, agent: Any, args: tuple, kwargs: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], Any]:
+        # (normalized kwargs, raw result): cache, coalescing and resilience, but no shaping
+        try:
+            kwargs, result = await self._fetch_once(tool_name, agent, args, kwargs)
+            if self._names is not None and not args and isinstance(kwargs.get("player_names"), list) \
+                    and extract_rows(result) == []:
+                # nothing matched as asked: retry once with fuzzy corrections, and say so in the result
+                names, changed = self._names.rewrite(kwargs["player_names"], fuzzy=True)
+                if changed:
+                    kwargs, result = await self._fetch_once(tool_name, agent, args, {**kwargs, "player_names": names})
+                    result = add_fields(result, names_changed=changed)
+        except Exception:
+            # the answer cache won't keep a reply built around a failed call
+            note_tool_error(tool_name)
+            raise
+        return kwargs, result
+
+    async def _fetch_once(
+        self, tool_name: str, agent: Any, args: tuple, kwargs: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], Any]:
+        # the answer cache expires a team answer with the data it was built from
+        note_tool(tool_name)
+        if self._validate and not args:
+            # wrap scalars, expand "2023-2024"-style ranges, then fail fast on bad shapes or metric names
+            kwargs = normalize_args(tool_name, kwargs)
+            validate_args(tool_name, kwargs)
+            check_metrics(tool_name, kwargs, self._cached_metric_names(tool_name))
+
+        if self._names is not None and not args and isinstance(kwargs.get("player_names"), list):
+            names, changed = self._names.rewrite(kwargs["player_names"])
+            if changed:
+                kwargs = {**kwargs, "player_names": names}
+
+        if self._local is not None and not args and self._local.answers(tool_name, kwargs):
+            return kwargs, self._local.query(tool_name, kwargs)
+
+        if self._identity is not None and tool_name == SLEEPER_LOOKUP and not args and set(kwargs) == {"sleeper_ids"}:
+            return kwargs, await self._expand_sleeper_ids(agent, kwargs["sleeper_ids"])
+
+        if self._trending is not None and tool_name == TRENDING_TOOL and not args:
+            hit, polled = self._trending.get(kwargs)
+            if hit:
+                self._metrics.record_cache_hit(tool_name)
+                return kwargs, polled
+
+        league = self._league if not args else None
+        if league is not None and tool_name in SNAPSHOT_TOOLS:
+            hit, held = league.get(tool_name, kwargs)
+            if hit and league.age(tool_name, kwargs) >= self._snapshot_ttl(tool_name):
+                # older than the result cache would keep it: one transactions call confirms nothing moved
+                try:
+                    await self._fetch_once(TRANSACTIONS_TOOL, agent, (), {
+                        "league_id": str(kwargs["league_id"]), "week": max(1, nfl_week()),
+                    })
+                    hit, held = league.get(tool_name, kwargs)
+                except Exception:
+                    hit = False
+            if hit:
+                self._metrics.record_cache_hit(tool_name)
+                return kwargs, held
+
+        result = await self._fetch_remote(tool_name, agent, args, kwargs)
+        if league is not None and tool_name in SNAPSHOT_TOOLS:
+            league.put(tool_name, kwargs, result)
+        elif league is not None and tool_name == TRANSACTIONS_TOOL:
+            if league.observe_transactions(kwargs.get("league_id"), result, kwargs) and self._cache is not None:
+                # the short-TTL result cache may still hold the pre-trade roster
+                self._cache.invalidate("get_sleeper_league_rosters", self._url)
+                self._cache.invalidate("get_sleeper_league_matchups", self._url)
+        return kwargs, result
+
+    def _snapshot_ttl(self, tool_name: str) -> float:
+        return self._cache.ttl_for(tool_name) if self._cache is not None else DEFAULT_TTL_POLICY.get(tool_name, 0.0)
+
+    async def _fetch_remote(self, tool_name: str, agent: Any, args: tuple, kwargs: Dict[str, Any]) -> Any:
+        cache = self._cache
+        if cache is not None and cache.cacheable(tool_name):
+            hit, cached = cache.get(tool_name, kwargs, args, self._url)
+            if hit:
+                self._metrics.record_cache_hit(tool_name)
+                return cached
+
+        try:
+            values = batch_values(tool_name, args, kwargs) if self._batch_lookups else None
+            if values is not None:
+                result = await self._batcher(tool_name).submit(values)
+            elif self._flight is None:
+                result = await self._invoke_resilient(tool_name, agent, args, kwargs)
+            else:
+                key = (self._url, tool_name, canonical_args(args, kwargs))
+                result = await self._flight.do(key, lambda: self._invoke_resilient(tool_name, agent, args, kwargs))
+        except Exception:
+            # server failing or breaker open: fall back to the last known good value if policy allows
+            if cache is not None:
+                found, stale = cache.get_stale(tool_name, kwargs, args, self._url)
+                if found:
+                    return stale
+            raise
+        if cache is not None:
+            cache.put(tool_name, kwargs, result, args, self._url)
+        if tool_name in _NAME_SOURCES:
+            rows = extract_rows(result) or ()
+            if self._names is not None:
+                self._names.add_rows(rows)
+            if self._identity is not None and self._identity.add_rows(rows):
+                await self._identity.save_async()
+        return result
+
+    def _batcher(self, tool_name: str) -> MicroBatcher:
+        batcher = self._batchers.get(tool_name)
+        if batcher is None:
+            arg_name = BATCHABLE_TOOLS[tool_name][0]
+            # merged calls serve many chats, so they run without any one caller's agent
+            batcher = self._batchers[tool_name] = MicroBatcher(
+                tool_name, lambda merged: self._invoke_resilient(tool_name, None, (), {arg_name: merged})
+            )
+        return batcher
+
+    async def _expand_sleeper_ids(self, agent: Any, sleeper_ids: List[Any]) -> Any:
+        # roster expansion: join against the identity map, fetch only ids it lacks
+        requested = list(dict.fromkeys(str(s) for s in sleeper_ids))
+        found, missing = self._identity.lookup(requested)
+        if missing:
+            result = await self._fetch_remote(SLEEPER_LOOKUP, agent, (), {"sleeper_ids": missing})
+            if extract_rows(result) is not None and "error" not in extra_fields(result):
+                self._sleeper_shape = empty_like(result)
+            if not found:
+                return result
+        elif self._sleeper_shape is not None:
+            # answer in the same container the remote tool returns
+            result = self._sleeper_shape
         else:
-            func_obj = next((f for f in funcs if getattr(f, "name", None) == tool_name), None)
+            # nothing fetched yet this process: the tool's JSON text
+            result = json.dumps({"result": []})
+        rows = {str(r.get("sleeper_id")): r for r in found}
+        for r in (extract_rows(result) or ()) if missing else ():
+            rows.setdefault(str(r.get("sleeper_id")), r)
+        return replace_rows(result, [rows[s] for s in requested if s in rows])
 
-        # fallback to .tools mapping if present
-        if func_obj is None:
-            tools_map = getattr(self._mcp, "tools", {}) or {}
-            func_obj = tools_map.get(tool_name)
+    async def fetch_rows(self, tool_name: str, /, **kwargs) -> List[Dict[str, Any]]:
+        """Call a tool from code and return its raw rows (no projection or compaction)."""
+        _, result = await self._fetch(tool_name, None, (), kwargs)
+        return extract_rows(result) or []
 
-        if func_obj is None:
-            raise RuntimeError(f"Remote MCP tool '{tool_name}' is not available")
+    async def stream(
+        self,
+        tool_name: str,
+        /,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        weeks_per_page: int = DEFAULT_WEEKS_PER_PAGE,
+        prefetch: int = DEFAULT_PREFETCH,
+        agent: Any = None,
+        **kwargs,
+    ) -> AsyncIterator[Page]:
+        """Yield a large weekly stats query as row pages, oldest season/week first.
+
+        Each page is an ordinary (cached, coalesced, retried) call limited to
+        `page_size` rows; up to `prefetch` later pages are fetched while the
+        caller works on the current one. Rows are raw (not projected or
+        compacted). Feed them to paging.RunningTotals to aggregate on the fly.
+        """
+        if tool_name not in STREAMABLE_TOOLS:
+            raise ValueError(f"{tool_name} does not support streaming; use call()")
+        if self._validate:
+            kwargs = normalize_args(tool_name, kwargs)
+            validate_args(tool_name, kwargs)
+        plans = plan_pages(kwargs, page_size, weeks_per_page)
+        pending: "Deque[asyncio.Task[Tuple[Dict[str, Any], Any]]]" = deque()
+        next_plan = 0
+        try:
+            for index in range(len(plans)):
+                while next_plan < len(plans) and len(pending) <= max(0, int(prefetch)):
+                    pending.append(asyncio.ensure_future(self._fetch(tool_name, agent, (), plans[next_plan])))
+                    next_plan += 1
+                page_kwargs, result = await pending.popleft()
+                rows = extract_rows(result) or []
+                yield Page(index, page_kwargs, rows, truncated=len(rows) >= int(page_size))
+        finally:
+            # consumer stopped early (break, cancel, deadline): drop the read-ahead
+            for task in pending:
+                task.cancel()
+
+    def _cached_metric_names(self, tool_name: str) -> set:
+        # metric names from a get_metrics_metadata result we already hold; never fetches
+        m = _STATS_CATEGORY.match(tool_name)
+        if m is None or self._cache is None:
+            return set()
+        names: set = set()
+        for kw in ({"category": m.group(1)}, {}):
+            cached = self._cache.peek("get_metrics_metadata", kw, url=self._url)
+            if cached is not None:
+                names |= metric_names_in(cached)
+        return names
+
+    def _postprocess(self, tool_name: str, kwargs: Dict[str, Any], result: Any) -> Any:
+        # the cache keeps raw results; shaping for the model happens per toolkit on the way out
+        if self._project:
+            result = project_result(tool_name, kwargs, result)
+        fmt = self._compact.get(tool_name)
+        if fmt is not None:
+            result = compact_result(result, fmt)
+        return result
+
+    async def _invoke_resilient(self, tool_name: str, agent: Any, args: tuple, kwargs: Dict[str, Any]) -> Any:
+        breaker = get_breaker(self._url, tool_name) if self._circuit_breaker else None
+        policy = self._retry if is_idempotent(tool_name) else _NO_RETRY
+        timeout = self._timeouts.get(tool_name)
+        return await call_with_retry(
+            # each attempt gets its own timeout, all of them share the request budget
+            lambda: with_deadline(tool_name, self._invoke_remote(tool_name, agent, args, kwargs), timeout),
+            policy,
+            _retryable,
+            breaker=breaker,
+            label=tool_name,
+        )
 
-        # preferred callable is entrypoint (Function.entrypoint) else object itself
-        call_target = getattr(func_obj, "entrypoint", None) or func_obj
+    async def _invoke_remote(self, tool_name: str, agent: Any, args: tuple, kwargs: Dict[str, Any]) -> Any:
+        client = await self._client()
+        # O(1) lookup in the client's prebuilt name -> entrypoint table (see dispatch.py)
+        call_target = resolve(client, tool_name)
+        if call_target is None:
+            raise RuntimeError(f"Remote MCP tool '{tool_name}' is not available")
 
         # forward agent if entrypoint expects it
-        if agent is not None:
-            result = call_target(agent, *args, **kwargs)
-        else:
-            result = call_target(*args, **kwargs)
-        if asyncio.iscoroutine(result):
-            return await result
+        started = time.perf_counter()
+        try:
+            if agent is not None or _takes_agent(call_target):
+                result = call_target(agent, *args, **kwargs)
+            else:
+                result = call_target(*args, **kwargs)
+            if asyncio.iscoroutine(result):
+                result = await result
+        except Exception as e:
+            self._metrics.record(tool_name, time.perf_counter() - started, payload_size(kwargs), 0, error=e)
+            if self._pool is not None and is_connection_error(e):
+                # drop the broken session so the next call reconnects
+                await self._pool.report_failure(client)
+            raise
+        self._metrics.record(tool_name, time.perf_counter() - started, payload_size(kwargs), payload_size(result))
+        if self._pool is not None:
+            self._pool.mark_ok(client)
         return result
 
+    async def gather(
+        self,
+        calls: List[Dict[str, Any]],
+        max_concurrency: int = DEFAULT_GATHER_CONCURRENCY,
+        timeout: Optional[float] = DEFAULT_GATHER_TIMEOUT,
+        agent: Any = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Run independent tool calls concurrently and return results keyed by call id.
+
+        Each call is {"id": ..., "tool": <tool name>, "args": {...}}; "id" defaults to
+        the call's position. At most `max_concurrency` calls are in flight and each
+        one gets `timeout` seconds. Failures are reported per call, never raised:
+        {"<id>": {"ok": True, "result": ...} | {"ok": False, "error": "..."}}.
+        """
+        sem = asyncio.Semaphore(max(1, int(max_concurrency)))
+
+        async def _one(index: int, call: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+            call_id = str(call.get("id", index))
+            tool = call.get("tool") or call.get("name")
+            args = call.get("args") or call.get("arguments") or {}
+            if tool == MULTI_CALL or tool not in self._wrappers_map:
+                return call_id, {"ok": False, "error": f"tool '{tool}' is not available here"}
+            if not isinstance(args, dict):
+                return call_id, {"ok": False, "error": "args must be an object of keyword arguments"}
+            async with sem:
+                try:
+                    result = await asyncio.wait_for(self._call(tool, agent, (), dict(args)), timeout)
+                except asyncio.TimeoutError:
+                    return call_id, {"ok": False, "error": f"timed out after {timeout}s"}
+                except Exception as e:
+                    return call_id, {"ok": False, "error": f"{type(e).__name__}: {e}"}
+            return call_id, {"ok": True, "result": result}
+
+        pairs = await asyncio.gather(*(_one(i, c) for i, c in enumerate(calls or [])))
+        return dict(pairs)
+
+    def _make_multi_call(self) -> Callable[..., Any]:
+        async def multi_call(
+            agent,
+            calls: List[Dict[str, Any]],
+            max_concurrency: int = DEFAULT_GATHER_CONCURRENCY,
+            timeout: float = DEFAULT_GATHER_TIMEOUT,
+        ) -> str:
+            """Run several independent tool calls at once and get all results in one step.
+
+            Use this when the calls don't depend on each other (e.g. league rosters,
+            player info and advanced stats for the same question).
+
+            Args:
+                calls: list of {"id": "<your label>", "tool": "<tool name>", "args": {<tool arguments>}}.
+                max_concurrency: how many calls may run at the same time.
+                timeout: seconds allowed per call.
+
+            Returns:
+                JSON object keyed by call id; each value is {"ok": true, "result": ...}
+                or {"ok": false, "error": "..."}.
+            """
+            results = await self.gather(calls, max_concurrency=max_concurrency, timeout=timeout, agent=agent)
+            for entry in results.values():
+                value = entry.get("result")
+                content = getattr(value, "content", None)
+                if content is not None and not isinstance(value, (dict, list, str)):
+                    value = content
+                if isinstance(value, str):
+                    # embed JSON payloads as objects rather than escaped strings
+                    try:
+                        value = json.loads(value)
+                    except ValueError:
+                        pass
+                if "result" in entry:
+                    entry["result"] = value
+            return json.dumps(results, default=str)
+
+        return multi_call
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters of the result cache (empty when caching is disabled)."""
+        return self._cache.stats() if self._cache is not None else {}
+
     # helper: produce a name->Function mapping for callers who want to inspect remote functions
     def available_functions(self) -> Dict[str, Any]:
-        funcs = getattr(self._mcp, "functions", {}) or {}
+        client = self._mcp if self._mcp is not None else (self._pool.peek() if self._pool is not None else None)
+        funcs = getattr(client, "functions", {}) or {}
         if isinstance(funcs, dict):
             return dict(funcs)
         return OrderedDict((getattr(f, "name", getattr(f, "__name__", str(i))), f) for i, f in enumerate(funcs))
@@ -0,0 +1,218 @@
+"""Per-league snapshot cache for the Sleeper league tools.
+
+Rosters, users, league settings and matchups were fetched fresh for every
+fantasy question, yet most of them change only a few times a week. A
+LeagueSnapshot holds those results for one league together, so follow-up
+questions in a session read one consistent view of the league. They
+don't mix a roster from before a trade with matchups from after it. The
+whole snapshot is dropped when:
+
+  - the NFL week rolls over (weeks turn over on Tuesday);
+  - a `get_sleeper_league_transactions` result shows a transaction the
+    snapshot hasn't seen (trades, waivers, free-agent moves);
+  - a part outlives its max age. That is a day for rosters, users and
+    settings. Matchups carry live scores, so on game days they last
+    LIVE_MATCHUP_TTL seconds and otherwise a few hours.
+
+Within that max age, `age()` says how long ago a part was last known
+current: when it was fetched, or when a later transactions check found no
+new moves. GridironTools re-checks a part older than the result cache's
+TTL for its tool with one transactions call before serving it.
+
+Usage:
+  snapshots = get_league_snapshots()
+  hit, rosters = snapshots.get("get_sleeper_league_rosters", {"league_id": "123"})
+  snapshots.put("get_sleeper_league_rosters", {"league_id": "123"}, rosters)
+  snapshots.observe_transactions("123", transactions_result)
+"""
+import datetime
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+
+from gridiron_toolkit.cache import canonical_args
+from gridiron_toolkit.localstore import current_season
+from gridiron_toolkit.results import extract_rows
+
+
+SNAPSHOT_TOOLS = frozenset({
+    "get_sleeper_league_rosters",
+    "get_sleeper_league_users",
+    "get_sleeper_league_by_id",
+    "get_sleeper_league_matchups",
+})
+TRANSACTIONS_TOOL = "get_sleeper_league_transactions"
+
+DEFAULT_MAX_LEAGUES = int(os.getenv("GRIDIRON_LEAGUE_SNAPSHOTS", "256"))
+SNAPSHOT_MAX_AGE = 24 * 3600.0
+MATCHUP_TTL = 6 * 3600.0
+LIVE_MATCHUP_TTL = float(os.getenv("GRIDIRON_LIVE_MATCHUP_TTL_SECONDS", "120"))
+
+# Thursday, Sunday, Monday
+_GAME_DAYS = (3, 6, 0)
+
+
+def season_kickoff(season: int) -> datetime.date:
+    """Thursday after Labor Day (the first Monday of September)."""
+    first = datetime.date(season, 9, 1)
+    labor_day = first + datetime.timedelta(days=(0 - first.weekday()) % 7)
+    return labor_day + datetime.timedelta(days=3)
+
+
+def nfl_week(today: Optional[datetime.date] = None) -> int:
+    """Current NFL week (1-based; 0 before kickoff). GRIDIRON_NFL_WEEK overrides.
+
+    Weeks run Tuesday to Monday, so Monday night still counts as the
+    finishing week.
+    """
+    override = os.getenv("GRIDIRON_NFL_WEEK")
+    if override:
+        return int(override)
+    today = today or datetime.date.today()
+    kickoff = season_kickoff(current_season(today))
+    week_start = kickoff - datetime.timedelta(days=2)  # the Tuesday before kickoff
+    if today < week_start:
+        return 0
+    return (today - week_start).days // 7 + 1
+
+
+def _league_id(kwargs: Dict[str, Any]) -> Optional[str]:
+    league_id = kwargs.get("league_id")
+    return str(league_id) if league_id not in (None, "") else None
+
+
+def _txn_marks(result: Any) -> Tuple[FrozenSet[Tuple[str, str]], float]:
+    """(transaction id + status pairs, newest status_updated/created in epoch seconds)."""
+    marks = set()
+    newest = 0.0
+    for row in extract_rows(result) or ():
+        marks.add((str(row.get("transaction_id")), str(row.get("status"))))
+        for field in ("status_updated", "created"):
+            value = row.get(field)
+            if isinstance(value, (int, float)):
+                # Sleeper timestamps are epoch milliseconds
+                newest = max(newest, value / 1000.0 if value > 1e11 else float(value))
+    return frozenset(marks), newest
+
+
+class LeagueSnapshot:
+    __slots__ = ("league_id", "week", "created_at", "checked_at", "parts", "transactions")
+
+    def __init__(self, league_id: str, week: int):
+        self.league_id = league_id
+        self.week = week
+        self.created_at = time.time()
+        # last time a transactions result showed nothing newer than the snapshot
+        self.checked_at = self.created_at
+        # (tool, canonical args) -> (stored_at, result)
+        self.parts: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+        # transaction marks per transactions-call args, as last observed
+        self.transactions: Dict[str, FrozenSet[Tuple[str, str]]] = {}
+
+
+class LeagueSnapshotCache:
+    """LRU of per-league snapshots with week- and transaction-driven invalidation."""
+
+    def __init__(self, max_leagues: int = DEFAULT_MAX_LEAGUES):
+        self.max_leagues = max(1, int(max_leagues))
+        self._leagues: "OrderedDict[str, LeagueSnapshot]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations: Dict[str, int] = {}
+
+    def _ttl(self, tool_name: str, now: float) -> float:
+        if tool_name != "get_sleeper_league_matchups":
+            return SNAPSHOT_MAX_AGE
+        day = datetime.datetime.fromtimestamp(now)
+        if nfl_week(day.date()) > 0 and day.weekday() in _GAME_DAYS:
+            return LIVE_MATCHUP_TTL
+        return MATCHUP_TTL
+
+    def _snapshot(self, league_id: str, create: bool) -> Optional[LeagueSnapshot]:
+        snap = self._leagues.get(league_id)
+        week = nfl_week()
+        if snap is not None and snap.week != week:
+            self.invalidate(league_id, "week")
+            snap = None
+        if snap is None and create:
+            snap = self._leagues[league_id] = LeagueSnapshot(league_id, week)
+            while len(self._leagues) > self.max_leagues:
+                self._leagues.popitem(last=False)
+        if snap is not None:
+            self._leagues.move_to_end(league_id)
+        return snap
+
+    def get(self, tool_name: str, kwargs: Dict[str, Any]) -> Tuple[bool, Any]:
+        league_id = _league_id(kwargs)
+        if tool_name not in SNAPSHOT_TOOLS or league_id is None:
+            return False, None
+        snap = self._snapshot(league_id, create=False)
+        part = snap.parts.get((tool_name, canonical_args((), kwargs))) if snap is not None else None
+        now = time.time()
+        if part is None or now - part[0] >= self._ttl(tool_name, now):
+            self.misses += 1
+            return False, None
+        self.hits += 1
+        return True, part[1]
+
+    def age(self, tool_name: str, kwargs: Dict[str, Any]) -> Optional[float]:
+        """Seconds since a held part was fetched or last confirmed by a transactions check, or None."""
+        league_id = _league_id(kwargs)
+        snap = self._leagues.get(league_id) if league_id is not None else None
+        part = snap.parts.get((tool_name, canonical_args((), kwargs))) if snap is not None else None
+        if part is None:
+            return None
+        return time.time() - max(part[0], snap.checked_at)
+
+    def put(self, tool_name: str, kwargs: Dict[str, Any], result: Any) -> None:
+        league_id = _league_id(kwargs)
+        if tool_name not in SNAPSHOT_TOOLS or league_id is None:
+            return
+        snap = self._snapshot(league_id, create=True)
+        snap.parts[(tool_name, canonical_args((), kwargs))] = (time.time(), result)
+
+    def observe_transactions(self, league_id: Any, result: Any, kwargs: Optional[Dict[str, Any]] = None) -> bool:
+        """Drop the league's snapshot if `result` shows moves it predates; returns True if it did."""
+        if league_id in (None, ""):
+            return False
+        snap = self._leagues.get(str(league_id))
+        if snap is None:
+            return False
+        marks, newest = _txn_marks(result)
+        key = canonical_args((), kwargs or {})
+        seen = snap.transactions.get(key)
+        if (seen is not None and marks != seen) or newest > snap.created_at:
+            self.invalidate(str(league_id), "transactions")
+            return True
+        snap.transactions[key] = marks
+        snap.checked_at = time.time()
+        return False
+
+    def invalidate(self, league_id: Optional[str] = None, reason: str = "manual") -> None:
+        """Forget one league's snapshot, or all of them."""
+        if league_id is None:
+            dropped = len(self._leagues)
+            self._leagues.clear()
+        else:
+            dropped = 1 if self._leagues.pop(str(league_id), None) is not None else 0
+        if dropped:
+            self.invalidations[reason] = self.invalidations.get(reason, 0) + dropped
+
+    def __len__(self) -> int:
+        return len(self._leagues)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"leagues": len(self._leagues), "hits": self.hits, "misses": self.misses,
+                "invalidations": dict(self.invalidations)}
+
+
+_SNAPSHOTS: Optional[LeagueSnapshotCache] = None
+
+
+def get_league_snapshots() -> LeagueSnapshotCache:
+    """Return the process-wide league snapshot cache shared by every GridironTools instance."""
+    global _SNAPSHOTS
+    if _SNAPSHOTS is None:
+        _SNAPSHOTS = LeagueSnapshotCache()
+    return _SNAPSHOTS
@@ -0,0 +1,335 @@
+"""Optional local, read-only snapshot of closed-season stats (DuckDB).
+
+Historical seasons never change, yet every "compare 2019 and 2021" question
+still went over the network. When GRIDIRON_LOCAL_STORE points at a DuckDB
+file and the `duckdb` package is installed, GridironTools answers stats
+calls in-process if every season they ask for is closed and synced. The
+arguments are the same as for the remote tool (player_names as partial,
+case-insensitive matches, season_list, weekly_list, positions, metrics,
+order_by_metric, limit), and so is the `{"result": [...]}` shape. Anything
+touching the current season, or a season that was never synced, still goes
+to the MCP server.
+
+The snapshot is filled from the MCP tools themselves, with every
+documented metric requested, one (tool, season) at a time:
+
+  python -m gridiron_toolkit.localstore --seasons 2018-2024
+
+Run the sync while the app is stopped. DuckDB lets a file have one writer
+or any number of read-only readers, and the app opens it read-only.
+
+Usage:
+  store = get_local_store()          # None when disabled
+  if store is not None and store.answers(tool, kwargs):
+      result = store.query(tool, kwargs)
+"""
+import datetime
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from gridiron_toolkit.compact import STATS_TOOLS
+from gridiron_toolkit.schemas import basic_info_fields, default_positions, documented_metrics, input_properties
+
+# DuckDB is optional; without it the store is simply disabled
+try:
+    import duckdb
+except Exception:
+    duckdb = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_PATH = os.getenv("GRIDIRON_LOCAL_STORE", "")
+DEFAULT_LIMIT = 100
+
+STORABLE_TOOLS = STATS_TOOLS
+
+# the same concept goes by different column names depending on the source table
+_NAME_COLUMNS = ("player_name", "merge_name", "player_display_name", "pfr_player_name")
+_POSITION_COLUMNS = ("position", "ff_position", "player_position", "pos")
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS stats_rows ("
+    " tool VARCHAR, season INTEGER, week INTEGER, position VARCHAR, names VARCHAR, data VARCHAR)",
+    "CREATE TABLE IF NOT EXISTS synced (tool VARCHAR, season INTEGER, rows INTEGER, synced_at TIMESTAMP)",
+)
+
+
+def current_season(today: Optional[datetime.date] = None) -> int:
+    """The NFL season still in play (GRIDIRON_CURRENT_SEASON overrides).
+
+    A season runs from September to its February playoffs. From March on, the
+    next season counts as current, so last year's season is already closed.
+    """
+    override = os.getenv("GRIDIRON_CURRENT_SEASON")
+    if override:
+        return int(override)
+    today = today or datetime.date.today()
+    return today.year if today.month >= 3 else today.year - 1
+
+
+def _first(row: Dict[str, Any], columns: Sequence[str]) -> Any:
+    for c in columns:
+        if row.get(c) is not None:
+            return row[c]
+    return None
+
+
+def _as_int(value: Any) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _sort_key(metric: str):
+    def key(row: Dict[str, Any]) -> Tuple[bool, float]:
+        value = row.get(metric)
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return (True, 0.0)
+        return (False, -float(value))
+
+    return key
+
+
+class LocalStatsStore:
+    """Read-only query layer over a DuckDB snapshot of stats tool rows."""
+
+    def __init__(self, path: str, read_only: bool = True):
+        if duckdb is None:
+            raise RuntimeError("duckdb is not installed; pip install duckdb to use the local stats store")
+        self.path = path
+        self.read_only = read_only
+        if not read_only:
+            self._conn = duckdb.connect(path)
+            for stmt in _SCHEMA:
+                self._conn.execute(stmt)
+        else:
+            self._conn = duckdb.connect(path, read_only=True)
+        self._lock = threading.Lock()
+        self._synced: Set[Tuple[str, int]] = set()
+        self.hits = 0
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Re-read which (tool, season) pairs the snapshot holds."""
+        with self._lock:
+            try:
+                pairs = self._conn.execute("SELECT tool, season FROM synced").fetchall()
+            except Exception:
+                pairs = []
+        self._synced = {(t, int(s)) for t, s in pairs}
+
+    def seasons(self, tool_name: str) -> List[int]:
+        return sorted(s for t, s in self._synced if t == tool_name)
+
+    def answers(self, tool_name: str, kwargs: Dict[str, Any], season: Optional[int] = None) -> bool:
+        """True when `kwargs` only touch closed seasons this snapshot holds."""
+        if tool_name not in STORABLE_TOOLS:
+            return False
+        seasons = kwargs.get("season_list")
+        if not seasons or not isinstance(seasons, list):
+            # no season filter means "all seasons", which includes the current one
+            return False
+        current = current_season() if season is None else season
+        if any(_as_int(s) is None or int(s) >= current or (tool_name, int(s)) not in self._synced for s in seasons):
+            return False
+        positions = kwargs.get("positions")
+        defaults = set(default_positions(tool_name))
+        # the snapshot holds the server's default positions only
+        if positions and defaults and not {str(p).upper() for p in positions} <= defaults:
+            return False
+        return True
+
+    def query(self, tool_name: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a stats query against the snapshot; same arguments and shape as the remote tool."""
+        where = ["tool = ?"]
+        params: List[Any] = [tool_name]
+        seasons = [int(s) for s in kwargs.get("season_list") or []]
+        if seasons:
+            where.append(f"season IN ({', '.join('?' * len(seasons))})")
+            params.extend(seasons)
+        weeks = [int(w) for w in kwargs.get("weekly_list") or []]
+        if weeks:
+            where.append(f"week IN ({', '.join('?' * len(weeks))})")
+            params.extend(weeks)
+        positions = [str(p).upper() for p in kwargs.get("positions") or []]
+        if positions:
+            where.append(f"upper(position) IN ({', '.join('?' * len(positions))})")
+            params.extend(positions)
+        names = [str(n) for n in kwargs.get("player_names") or [] if str(n).strip()]
+        if names:
+            where.append("(" + " OR ".join("names ILIKE ?" for _ in names) + ")")
+            params.extend(f"%{n.strip()}%" for n in names)
+        sql = f"SELECT data FROM stats_rows WHERE {' AND '.join(where)} ORDER BY season, week"
+        with self._lock:
+            raw = self._conn.execute(sql, params).fetchall()
+        rows = [json.loads(r[0]) for r in raw]
+
+        order_by = kwargs.get("order_by_metric")
+        if order_by:
+            rows.sort(key=_sort_key(order_by))
+        limit = kwargs.get("limit")
+        if limit is None:
+            limit = (input_properties(tool_name).get("limit") or {}).get("default", DEFAULT_LIMIT)
+        if limit is not None:
+            rows = rows[: int(limit)]
+        metrics = kwargs.get("metrics")
+        if metrics:
+            keep = list(dict.fromkeys([*basic_info_fields(tool_name), *metrics, *([order_by] if order_by else [])]))
+            rows = [{k: row[k] for k in keep if k in row} for row in rows]
+        self.hits += 1
+        return {"result": rows}
+
+    def write_season(self, tool_name: str, season: int, rows: Iterable[Dict[str, Any]]) -> int:
+        """Replace the snapshot of (tool, season) with `rows`; returns the row count."""
+        if self.read_only:
+            raise RuntimeError("local stats store was opened read-only")
+        records = []
+        for row in rows:
+            names = " | ".join(str(row[c]) for c in _NAME_COLUMNS if row.get(c))
+            records.append((
+                tool_name,
+                _as_int(row.get("season")) or int(season),
+                _as_int(row.get("week")),
+                _first(row, _POSITION_COLUMNS),
+                names,
+                json.dumps(row, default=str),
+            ))
+        with self._lock:
+            self._conn.execute("BEGIN TRANSACTION")
+            try:
+                self._conn.execute("DELETE FROM stats_rows WHERE tool = ? AND season = ?", [tool_name, int(season)])
+                self._conn.execute("DELETE FROM synced WHERE tool = ? AND season = ?", [tool_name, int(season)])
+                if records:
+                    self._conn.executemany("INSERT INTO stats_rows VALUES (?, ?, ?, ?, ?, ?)", records)
+                self._conn.execute(
+                    "INSERT INTO synced VALUES (?, ?, ?, current_timestamp)", [tool_name, int(season), len(records)]
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        self._synced.add((tool_name, int(season)))
+        return len(records)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+async def _fetch_season(
+    tools: Any, tool_name: str, season: int, base: Dict[str, Any], sync_limit: int,
+) -> Tuple[List[Dict[str, Any]], bool]:
+    """Fetch one (tool, season); return (rows, complete).
+
+    A streamed page or a plain fetch that comes back at its row limit may have
+    been cut off by the server, so the result is marked incomplete.
+    """
+    from gridiron_toolkit.paging import STREAMABLE_TOOLS
+
+    rows: List[Dict[str, Any]] = []
+    complete = True
+    if tool_name in STREAMABLE_TOOLS:
+        async for page in tools.stream(tool_name, season_list=[season], **base):
+            if page.truncated:
+                logger.warning("%s %s: page %s hit the row limit", tool_name, season, page.kwargs.get("weekly_list"))
+                complete = False
+            rows.extend(page.rows)
+    else:
+        rows = await tools.fetch_rows(tool_name, season_list=[season], limit=sync_limit, **base)
+        if len(rows) >= sync_limit:
+            logger.warning("%s %s hit the row limit", tool_name, season)
+            complete = False
+    return rows, complete
+
+
+async def sync_store(
+    store: LocalStatsStore,
+    tools: Any,
+    seasons: Iterable[int],
+    tool_names: Optional[Iterable[str]] = None,
+    sync_limit: int = 5000,
+) -> Dict[str, int]:
+    """Pull closed `seasons` of each stats tool through `tools` (a GridironTools) into `store`.
+
+    A season that hits a row limit is fetched again one position at a time;
+    if that is still cut off, the season is left unsynced so it keeps going
+    to the MCP server. `tools` should not itself read from the store.
+    Returns {"tool season": rows} for the seasons written.
+    """
+    current = current_season()
+    written: Dict[str, int] = {}
+    for tool_name in tool_names or sorted(STORABLE_TOOLS):
+        metrics = sorted(documented_metrics(tool_name) or ())
+        base: Dict[str, Any] = {"metrics": metrics} if metrics else {}
+        for season in sorted(set(int(s) for s in seasons)):
+            if season >= current:
+                logger.info("skipping %s %s: season is not closed", tool_name, season)
+                continue
+            rows, complete = await _fetch_season(tools, tool_name, season, base, sync_limit)
+            positions = default_positions(tool_name)
+            if not complete and positions:
+                rows = []
+                complete = True
+                for position in positions:
+                    part, ok = await _fetch_season(tools, tool_name, season, {**base, "positions": [position]}, sync_limit)
+                    rows.extend(part)
+                    complete = complete and ok
+            if not complete:
+                logger.warning("%s %s not synced: the server's row limit cut it off", tool_name, season)
+                continue
+            written[f"{tool_name} {season}"] = store.write_season(tool_name, season, rows)
+    return written
+
+
+_STORE: Optional[LocalStatsStore] = None
+_STORE_LOADED = False
+
+
+def get_local_store() -> Optional[LocalStatsStore]:
+    """Return the process-wide read-only store, or None when GRIDIRON_LOCAL_STORE/duckdb is missing."""
+    global _STORE, _STORE_LOADED
+    if not _STORE_LOADED:
+        _STORE_LOADED = True
+        if DEFAULT_STORE_PATH and duckdb is not None and os.path.exists(DEFAULT_STORE_PATH):
+            try:
+                _STORE = LocalStatsStore(DEFAULT_STORE_PATH)
+            except Exception as e:
+                logger.warning("local stats store %s unavailable: %s", DEFAULT_STORE_PATH, e)
+                _STORE = None
+    return _STORE
+
+
+def _main() -> None:
+    import argparse
+    import asyncio
+
+    from gridiron_toolkit.info import GridironTools
+    from gridiron_toolkit.normalize import normalize_args
+
+    parser = argparse.ArgumentParser(description="Sync closed NFL seasons from the MCP server into a DuckDB snapshot.")
+    parser.add_argument("--seasons", required=True, help='e.g. "2018-2024" or "2021,2023"')
+    parser.add_argument("--path", default=DEFAULT_STORE_PATH or "gridiron_stats.duckdb")
+    parser.add_argument("--url", default="http://192.168.68.66:8002/mcp/")
+    parser.add_argument("--tools", nargs="*", default=None)
+    opts = parser.parse_args()
+    seasons = normalize_args("get_advanced_receiving_stats", {"season_list": opts.seasons})["season_list"]
+
+    async def run() -> None:
+        store = LocalStatsStore(opts.path, read_only=False)
+        tools = GridironTools(url=opts.url, use_cache=False, use_local_store=False)
+        try:
+            for key, n in (await sync_store(store, tools, seasons, opts.tools)).items():
+                print(f"{key}: {n} rows")
+        finally:
+            store.close()
+
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    _main()
@@ -0,0 +1,242 @@
+"""Per-tool latency, payload-size and error metrics for GridironTools.
+
+Every remote tool call records its latency, the size of its arguments and
+of its result, and whether it failed. Numbers are kept in-process as
+fixed-bucket histograms so `render_prometheus()` can serve a Prometheus text
+exposition (mounted at /metrics by the FastAPI app), and are mirrored to
+OpenTelemetry instruments when the OTel API is installed (Phoenix's
+`register()` sets up the provider in bill_api.py).
+
+Usage:
+  metrics = get_metrics()
+  metrics.record("get_advanced_receiving_stats", seconds, req_bytes, resp_bytes, error=None)
+  text = render_prometheus()
+"""
+import bisect
+import json
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+LATENCY_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+SIZE_BUCKETS: Tuple[float, ...] = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+# OpenTelemetry is optional; without it metrics are only served from /metrics
+try:
+    from opentelemetry import metrics as _otel_metrics
+except Exception:
+    _otel_metrics = None
+
+
+def payload_size(value: Any) -> int:
+    """Approximate size of a tool argument set or result.
+
+    MCP results arrive as text (or a ToolResult wrapping it), so this is
+    normally just the text length, with no copy or encode on the hot path. Only
+    structured values are serialized to be measured.
+    """
+    if value is None:
+        return 0
+    content = getattr(value, "content", None)
+    if content is not None and not isinstance(value, (dict, list, str)):
+        value = content
+    if isinstance(value, (str, bytes, bytearray)):
+        return len(value)
+    try:
+        return len(json.dumps(value, default=str, separators=(",", ":")).encode("utf-8"))
+    except Exception:
+        return len(str(value))
+
+
+class Histogram:
+    """Cumulative fixed-bucket histogram (Prometheus semantics)."""
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts: List[int] = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        out = []
+        running = 0
+        for bound, n in zip(self.buckets, self.counts):
+            running += n
+            out.append((_fmt(bound), running))
+        out.append(("+Inf", running + self.counts[-1]))
+        return out
+
+
+class _ToolStats:
+    __slots__ = ("latency", "request_bytes", "response_bytes", "calls", "errors", "cache_hits")
+
+    def __init__(self) -> None:
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.request_bytes = Histogram(SIZE_BUCKETS)
+        self.response_bytes = Histogram(SIZE_BUCKETS)
+        self.calls = 0
+        self.errors: Dict[str, int] = {}
+        self.cache_hits = 0
+
+
+class ToolMetrics:
+    """Registry of per-tool histograms and counters."""
+
+    def __init__(self) -> None:
+        self._tools: Dict[str, _ToolStats] = {}
+        self._lock = threading.Lock()
+        self._otel = None
+        if _otel_metrics is not None:
+            try:
+                meter = _otel_metrics.get_meter("gridiron_toolkit")
+                self._otel = (
+                    meter.create_histogram("gridiron.tool.duration", unit="s", description="MCP tool call latency"),
+                    meter.create_histogram("gridiron.tool.request.size", unit="By", description="MCP tool argument size"),
+                    meter.create_histogram("gridiron.tool.response.size", unit="By", description="MCP tool result size"),
+                    meter.create_counter("gridiron.tool.errors", description="Failed MCP tool calls"),
+                )
+            except Exception:
+                self._otel = None
+
+    def _stats(self, tool_name: str) -> _ToolStats:
+        stats = self._tools.get(tool_name)
+        if stats is None:
+            stats = self._tools.setdefault(tool_name, _ToolStats())
+        return stats
+
+    def record(
+        self,
+        tool_name: str,
+        seconds: float,
+        request_bytes: int,
+        response_bytes: int,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        with self._lock:
+            stats = self._stats(tool_name)
+            stats.calls += 1
+            stats.latency.observe(seconds)
+            stats.request_bytes.observe(request_bytes)
+            if error is None:
+                stats.response_bytes.observe(response_bytes)
+            else:
+                kind = type(error).__name__
+                stats.errors[kind] = stats.errors.get(kind, 0) + 1
+        if self._otel is not None:
+            attrs = {"tool": tool_name}
+            duration, req, resp, errors = self._otel
+            try:
+                duration.record(seconds, attrs)
+                req.record(request_bytes, attrs)
+                if error is None:
+                    resp.record(response_bytes, attrs)
+                else:
+                    errors.add(1, {**attrs, "error.type": type(error).__name__})
+            except Exception:
+                pass
+
+    def record_cache_hit(self, tool_name: str) -> None:
+        with self._lock:
+            self._stats(tool_name).cache_hits += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Plain-dict summary per tool (calls, errors, mean latency/sizes)."""
+        with self._lock:
+            out = {}
+            for name, s in self._tools.items():
+                out[name] = {
+                    "calls": s.calls,
+                    "errors": sum(s.errors.values()),
+                    "cache_hits": s.cache_hits,
+                    "mean_seconds": (s.latency.sum / s.latency.count) if s.latency.count else 0.0,
+                    "mean_request_bytes": (s.request_bytes.sum / s.request_bytes.count) if s.request_bytes.count else 0.0,
+                    "mean_response_bytes": (s.response_bytes.sum / s.response_bytes.count) if s.response_bytes.count else 0.0,
+                }
+            return out
+
+    def render(self) -> List[str]:
+        lines: List[str] = []
+        with self._lock:
+            items = sorted(self._tools.items())
+            for metric, attr, help_text in (
+                ("gridiron_tool_duration_seconds", "latency", "MCP tool call latency in seconds."),
+                ("gridiron_tool_request_bytes", "request_bytes", "Serialized size of MCP tool arguments."),
+                ("gridiron_tool_response_bytes", "response_bytes", "Serialized size of MCP tool results."),
+            ):
+                lines.append(f"# HELP {metric} {help_text}")
+                lines.append(f"# TYPE {metric} histogram")
+                for name, s in items:
+                    h: Histogram = getattr(s, attr)
+                    for le, n in h.cumulative():
+                        lines.append(f'{metric}_bucket{{tool="{name}",le="{le}"}} {n}')
+                    lines.append(f'{metric}_sum{{tool="{name}"}} {_fmt(h.sum)}')
+                    lines.append(f'{metric}_count{{tool="{name}"}} {h.count}')
+            lines.append("# HELP gridiron_tool_calls_total Remote MCP tool calls (cache hits excluded).")
+            lines.append("# TYPE gridiron_tool_calls_total counter")
+            for name, s in items:
+                lines.append(f'gridiron_tool_calls_total{{tool="{name}"}} {s.calls}')
+            lines.append("# HELP gridiron_tool_errors_total Failed MCP tool calls by exception type.")
+            lines.append("# TYPE gridiron_tool_errors_total counter")
+            for name, s in items:
+                for kind, n in sorted(s.errors.items()):
+                    lines.append(f'gridiron_tool_errors_total{{tool="{name}",error="{kind}"}} {n}')
+            lines.append("# HELP gridiron_tool_cache_hits_total Tool calls answered from the result cache.")
+            lines.append("# TYPE gridiron_tool_cache_hits_total counter")
+            for name, s in items:
+                lines.append(f'gridiron_tool_cache_hits_total{{tool="{name}"}} {s.cache_hits}')
+        return lines
+
+
+def _fmt(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+_METRICS: Optional[ToolMetrics] = None
+
+
+def get_metrics() -> ToolMetrics:
+    """Return the process-wide ToolMetrics shared by every GridironTools instance."""
+    global _METRICS
+    if _METRICS is None:
+        _METRICS = ToolMetrics()
+    return _METRICS
+
+
+def render_prometheus() -> str:
+    """Prometheus text exposition of tool metrics plus cache, breaker and pool state."""
+    from gridiron_toolkit.cache import get_cache
+
+    lines = get_metrics().render()
+    cache = get_cache().stats()
+    for key in ("hits", "misses", "evictions", "entries"):
+        kind = "gauge" if key == "entries" else "counter"
+        name = f"gridiron_result_cache_{key}" + ("" if kind == "gauge" else "_total")
+        lines.append(f"# TYPE {name} {kind}")
+        lines.append(f"{name} {cache[key]}")
+    from gridiron_toolkit.resilience import breaker_stats
+
+    breakers = breaker_stats()
+    if breakers:
+        lines.append("# HELP gridiron_tool_circuit_open 1 while the tool's circuit breaker rejects calls.")
+        lines.append("# TYPE gridiron_tool_circuit_open gauge")
+        for b in breakers:
+            lines.append(f'gridiron_tool_circuit_open{{url="{b["url"]}",tool="{b["tool"]}"}} {int(b["state"] == "open")}')
+    try:
+        from gridiron_toolkit.pool import pool_stats
+
+        pools = pool_stats()
+    except Exception:
+        pools = []
+    if pools:
+        lines.append("# TYPE gridiron_mcp_pool_connects_total counter")
+        for p in pools:
+            lines.append(f'gridiron_mcp_pool_connects_total{{url="{p["url"]}"}} {p["connects"]}')
+        lines.append("# TYPE gridiron_mcp_pool_reconnects_total counter")
+        for p in pools:
+            lines.append(f'gridiron_mcp_pool_reconnects_total{{url="{p["url"]}"}} {p["reconnects"]}')
+    return "\n".join(lines) + "\n"
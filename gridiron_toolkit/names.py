@@ -0,0 +1,281 @@
+"""In-memory fuzzy index of player names.
+
+Agents pass partial or misspelled names ("Puka", "Jamarr Chase") straight to
+the tools. The server matches names as a case-insensitive substring, so a
+misspelling returns nothing and the agent has to spend another LLM round
+retrying. This index resolves such names locally:
+
+  - names are normalized (accents, punctuation, Jr./III suffixes dropped),
+    so "Jamarr Chase" and "Ja'Marr Chase" share the key "jamarr chase";
+  - an alias table maps nicknames ("cmc", "arsb") to full names;
+  - everything else is scored by trigram similarity through an inverted
+    index, and a query whose words prefix-match a player's name words
+    ("puka") counts as a strong match.
+
+The index learns from player rows as they pass through GridironTools
+(get_player_info_tool, get_players_by_sleeper_id_tool), one upsert per row
+keyed by the player's canonical id, so it refreshes incrementally without
+a bulk reload. GridironTools rewrites `player_names` in two steps. Before
+the remote call only exact matches are applied (`exact()`: the same
+normalized key, or an alias), since a fuzzy guess could swap one real player
+for another. Fuzzy matches (`suggest()`) are tried only when the call comes
+back empty, and the result then says which names were changed. Either way a name
+the server's substring match already finds is left alone.
+
+Usage:
+  index = get_name_index()
+  index.add_rows(rows)
+  index.resolve("jamarr chase")    # -> PlayerName("00-0036900", "Ja'Marr Chase", ...)
+"""
+import re
+import unicodedata
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+
+DEFAULT_MIN_SCORE = 0.5
+# best candidate must beat the runner-up by this much to count as unambiguous
+DEFAULT_MARGIN = 0.1
+MAX_CANDIDATES = 5
+
+# canonical id columns, most stable first
+ID_FIELDS = ("gsis_id", "player_id", "sleeper_id", "pfr_id", "pfr_player_id")
+NAME_FIELDS = ("player_name", "display_name", "full_name", "player_display_name", "football_name", "name")
+
+_SUFFIXES = {"jr", "sr", "ii", "iii", "iv", "v"}
+_NON_ALNUM = re.compile(r"[^a-z0-9 ]+")
+
+# nickname -> full name; applied before fuzzy matching
+DEFAULT_ALIASES: Dict[str, str] = {
+    "cmc": "Christian McCaffrey",
+    "arsb": "Amon-Ra St. Brown",
+    "jsn": "Jaxon Smith-Njigba",
+    "btj": "Brian Thomas",
+    "mhj": "Marvin Harrison",
+    "kw3": "Kenneth Walker",
+    "tjh": "T.J. Hockenson",
+    "dk": "DK Metcalf",
+    "aj brown": "A.J. Brown",
+    "hollywood brown": "Marquise Brown",
+    "scary terry": "Terry McLaurin",
+    "saquon": "Saquon Barkley",
+    "mahomes": "Patrick Mahomes",
+}
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase ASCII key: accents, apostrophes, periods, hyphens and suffixes removed."""
+    text = unicodedata.normalize("NFKD", str(name)).encode("ascii", "ignore").decode("ascii").lower()
+    # "ja'marr" -> "jamarr", "t.j." -> "tj", "smith-njigba" -> "smith njigba"
+    text = text.replace("'", "").replace(".", "").replace("-", " ")
+    tokens = [t for t in _NON_ALNUM.sub(" ", text).split() if t not in _SUFFIXES]
+    return " ".join(tokens)
+
+
+def trigrams(key: str) -> Set[str]:
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class PlayerName:
+    """One indexed player."""
+
+    __slots__ = ("id", "name", "key", "position", "team", "grams")
+
+    def __init__(self, id: str, name: str, position: Optional[str] = None, team: Optional[str] = None):
+        self.id = id
+        self.name = name
+        self.key = normalize_name(name)
+        self.position = position
+        self.team = team
+        self.grams = trigrams(self.key)
+
+    def __repr__(self) -> str:
+        return f"PlayerName({self.id!r}, {self.name!r}, {self.position!r}, {self.team!r})"
+
+
+def _first(row: Dict[str, Any], fields: Iterable[str]) -> Optional[str]:
+    for f in fields:
+        v = row.get(f)
+        if v not in (None, ""):
+            return str(v)
+    return None
+
+
+class PlayerNameIndex:
+    """Trigram-indexed player names with an alias table; upserts are incremental."""
+
+    def __init__(self, aliases: Optional[Dict[str, str]] = None, min_score: float = DEFAULT_MIN_SCORE):
+        self.min_score = min_score
+        self.aliases: Dict[str, str] = {normalize_name(k): v for k, v in (DEFAULT_ALIASES if aliases is None else aliases).items()}
+        self._players: Dict[str, PlayerName] = {}
+        self._by_key: Dict[str, Set[str]] = {}
+        self._by_gram: Dict[str, Set[str]] = {}
+        self.lookups = 0
+        self.rewrites = 0
+
+    def __len__(self) -> int:
+        return len(self._players)
+
+    def get(self, player_id: str) -> Optional[PlayerName]:
+        return self._players.get(player_id)
+
+    def add(self, player_id: str, name: str, position: Optional[str] = None, team: Optional[str] = None) -> PlayerName:
+        """Insert or update one player; re-indexes only when the name changed."""
+        old = self._players.get(player_id)
+        if old is not None and old.name == name:
+            old.position = position or old.position
+            old.team = team or old.team
+            return old
+        if old is not None:
+            self._unindex(old)
+        entry = PlayerName(player_id, name, position, team)
+        self._players[player_id] = entry
+        self._by_key.setdefault(entry.key, set()).add(player_id)
+        for g in entry.grams:
+            self._by_gram.setdefault(g, set()).add(player_id)
+        return entry
+
+    def _unindex(self, entry: PlayerName) -> None:
+        ids = self._by_key.get(entry.key)
+        if ids is not None:
+            ids.discard(entry.id)
+            if not ids:
+                del self._by_key[entry.key]
+        for g in entry.grams:
+            ids = self._by_gram.get(g)
+            if ids is not None:
+                ids.discard(entry.id)
+                if not ids:
+                    del self._by_gram[g]
+
+    def add_rows(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """Upsert every row that carries a name; rows without an id are keyed by their name."""
+        n = 0
+        for row in rows:
+            if not isinstance(row, dict):
+                continue
+            name = _first(row, NAME_FIELDS)
+            if not name:
+                continue
+            player_id = _first(row, ID_FIELDS) or f"name:{normalize_name(name)}"
+            self.add(
+                player_id,
+                name,
+                _first(row, ("position", "ff_position", "fantasy_positions")),
+                _first(row, ("latest_team", "team", "team_abbr", "ff_team")),
+            )
+            n += 1
+        return n
+
+    def search(self, query: str, limit: int = MAX_CANDIDATES) -> List[Tuple[PlayerName, float]]:
+        """Candidates for `query`, best first, each with a 0..1 score."""
+        self.lookups += 1
+        key = normalize_name(query)
+        if not key:
+            return []
+        alias = self.aliases.get(key)
+        if alias is not None:
+            key = normalize_name(alias)
+        exact = self._by_key.get(key)
+        if exact:
+            return [(self._players[i], 1.0) for i in sorted(exact)][:limit]
+
+        grams = trigrams(key)
+        shared: Dict[str, int] = {}
+        for g in grams:
+            for pid in self._by_gram.get(g, ()):
+                shared[pid] = shared.get(pid, 0) + 1
+        words = key.split()
+        scored = []
+        for pid, common in shared.items():
+            entry = self._players[pid]
+            score = 2.0 * common / (len(grams) + len(entry.grams))
+            name_words = entry.key.split()
+            # "puka" -> "puka nacua", "jefferson" -> "justin jefferson"
+            if all(any(nw.startswith(w) for nw in name_words) for w in words):
+                score = max(score, 0.9 if len(words) < len(name_words) else 0.95)
+            scored.append((entry, score))
+        scored.sort(key=lambda pair: (-pair[1], pair[0].name))
+        return [(e, s) for e, s in scored[:limit] if s >= self.min_score]
+
+    def resolve(self, query: str, margin: float = DEFAULT_MARGIN) -> Optional[PlayerName]:
+        """The single confident match for `query`, or None when unknown or ambiguous."""
+        found = self.search(query, limit=2)
+        if not found:
+            return None
+        if len(found) > 1 and found[0][1] - found[1][1] < margin:
+            return None
+        return found[0][0]
+
+    def exact(self, query: str) -> Optional[str]:
+        """The alias or same-key indexed name for `query`, when the server would miss it as typed."""
+        needle = str(query).strip().lower()
+        key = normalize_name(query)
+        if not needle or not key:
+            return None
+        name = self.aliases.get(key)
+        if name is None:
+            names = {self._players[i].name for i in self._by_key.get(key, ())}
+            if len(names) != 1:
+                return None
+            name = names.pop()
+        return None if needle in name.lower() else name
+
+    def suggest(self, query: str) -> Optional[str]:
+        """A fuzzy replacement for a name the server's substring match would miss, else None."""
+        needle = str(query).strip().lower()
+        if not needle:
+            return None
+        alias = self.aliases.get(normalize_name(query))
+        if alias is not None and needle not in alias.lower():
+            return alias
+        if any(needle in p.name.lower() for p in self._containing(needle)):
+            # the server will find it as typed
+            return None
+        match = self.resolve(query)
+        if match is None or needle in match.name.lower():
+            return None
+        return match.name
+
+    def _containing(self, needle: str) -> List[PlayerName]:
+        # players whose key holds every inner trigram of the needle: a superset of the substring matches
+        key = normalize_name(needle)
+        inner = [key[i:i + 3] for i in range(len(key) - 2)]
+        if not inner:
+            return []
+        ids: Optional[Set[str]] = None
+        for g in sorted(inner, key=lambda g: len(self._by_gram.get(g, ()))):
+            ids = set(self._by_gram.get(g, ())) if ids is None else ids & self._by_gram.get(g, set())
+            if not ids:
+                return []
+        return [self._players[i] for i in ids or ()]
+
+    def rewrite(self, names: Iterable[str], fuzzy: bool = False) -> Tuple[List[str], Dict[str, str]]:
+        """Apply exact() (or suggest() when `fuzzy`) to a player_names list; returns (names, {original: replacement})."""
+        lookup = self.suggest if fuzzy else self.exact
+        out: List[str] = []
+        changed: Dict[str, str] = {}
+        for name in names:
+            better = lookup(name) if isinstance(name, str) else None
+            if better is not None:
+                changed[name] = better
+                out.append(better)
+            else:
+                out.append(name)
+        if changed:
+            self.rewrites += len(changed)
+        return out, changed
+
+    def stats(self) -> Dict[str, Any]:
+        return {"players": len(self._players), "lookups": self.lookups, "rewrites": self.rewrites}
+
+
+_INDEX: Optional[PlayerNameIndex] = None
+
+
+def get_name_index() -> PlayerNameIndex:
+    """Return the process-wide name index shared by every GridironTools instance."""
+    global _INDEX
+    if _INDEX is None:
+        _INDEX = PlayerNameIndex()
+    return _INDEX
@@ -0,0 +1,180 @@
+"""Argument normalization for the analytics tools, driven by their inputSchema.
+
+Agents often send `player_names="Josh Allen"`, `season_list="2023-2024"`,
+`weekly_list="1-3"` or metric names that don't exist. Each of those used to
+cost a remote round trip plus an LLM retry. `normalize_args()` fixes the
+shape locally before validation:
+
+  - scalars are wrapped into arrays where the schema expects an array;
+  - integer arrays accept "2023", "2023-2024", "2021..2023", "1,3,5" and
+    expand the ranges;
+  - array values are de-duplicated, keeping their order.
+
+`check_metrics()` then compares `metrics` / `order_by_metric` with the
+metric names from a cached `get_metrics_metadata` result and fails fast with
+the valid choices. The names scraped from the tool descriptions are only a
+partial list (weekly receiving documents 19 metrics and has no targets or
+receptions). Without metadata, unknown names are therefore only logged and
+the server decides.
+"""
+import json
+import logging
+import re
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from gridiron_toolkit.schemas import (
+    ToolArgumentError,
+    basic_info_fields,
+    documented_metrics,
+    input_properties,
+)
+
+
+logger = logging.getLogger(__name__)
+
+_RANGE = re.compile(r"^\s*(-?\d+)\s*(?:-|\.\.|to)\s*(-?\d+)\s*$")
+# stop a typo like "2023-20240" from producing a huge list
+_MAX_RANGE = 64
+
+
+def _expects(prop: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """The array variant of a property's schema, if it accepts arrays."""
+    for v in prop.get("anyOf") or [prop]:
+        if v.get("type") == "array":
+            return v
+    return None
+
+
+def _scalar_type(prop: Dict[str, Any]) -> Optional[str]:
+    for v in prop.get("anyOf") or [prop]:
+        if v.get("type") not in (None, "null", "array"):
+            return v.get("type")
+    return None
+
+
+def _to_int(value: Any) -> Any:
+    if isinstance(value, str) and value.strip().lstrip("-").isdigit():
+        return int(value.strip())
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _expand_ints(value: Any) -> List[Any]:
+    if isinstance(value, str):
+        out: List[Any] = []
+        for part in value.split(","):
+            m = _RANGE.match(part)
+            if m:
+                lo, hi = sorted((int(m.group(1)), int(m.group(2))))
+                if hi - lo > _MAX_RANGE:
+                    raise ToolArgumentError(f"range '{part.strip()}' is too wide")
+                out.extend(range(lo, hi + 1))
+            elif part.strip():
+                out.append(_to_int(part))
+        return out
+    return [_to_int(value)]
+
+
+def _dedupe(values: Iterable[Any]) -> List[Any]:
+    seen: Set[Any] = set()
+    out = []
+    for v in values:
+        key = v if isinstance(v, (str, int, float, bool, type(None))) else repr(v)
+        if key not in seen:
+            seen.add(key)
+            out.append(v)
+    return out
+
+
+def normalize_args(tool_name: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of `kwargs` coerced towards the tool's inputSchema.
+
+    Unknown tools and unknown arguments are passed through untouched;
+    validation decides what to do with them.
+    """
+    props = input_properties(tool_name)
+    if not props:
+        return dict(kwargs)
+    out = dict(kwargs)
+    for name, value in kwargs.items():
+        prop = props.get(name)
+        if prop is None or value is None:
+            continue
+        array = _expects(prop)
+        if array is not None:
+            item_type = (array.get("items") or {}).get("type")
+            values = value if isinstance(value, (list, tuple)) else [value]
+            if item_type == "integer":
+                expanded: List[Any] = []
+                for v in values:
+                    expanded.extend(_expand_ints(v))
+                values = expanded
+            elif item_type == "string":
+                values = [v.strip() if isinstance(v, str) else str(v) for v in values]
+            out[name] = _dedupe(values)
+        elif _scalar_type(prop) == "integer":
+            out[name] = _to_int(value)
+    return out
+
+
+def known_metrics(tool_name: str, extra: Iterable[str] = ()) -> Optional[Set[str]]:
+    """Metric names valid for `tool_name`, or None if the tool doesn't enumerate any."""
+    documented = documented_metrics(tool_name)
+    if documented is None:
+        return None
+    return set(documented) | set(basic_info_fields(tool_name)) | set(extra)
+
+
+def check_metrics(tool_name: str, kwargs: Dict[str, Any], metadata_names: Iterable[str] = ()) -> None:
+    """Raise ToolArgumentError listing the valid choices if any metric name is unknown.
+
+    Only `metadata_names` (from get_metrics_metadata) make the check strict;
+    without them unknown names are logged and passed through.
+    """
+    requested = list(kwargs.get("metrics") or [])
+    if kwargs.get("order_by_metric"):
+        requested.append(kwargs["order_by_metric"])
+    if not requested:
+        return
+    metadata = set(metadata_names)
+    valid = known_metrics(tool_name, metadata)
+    if valid is None:
+        return
+    bad = [m for m in requested if m not in valid]
+    if not bad:
+        return
+    if not metadata:
+        logger.info("%s: metric(s) %s are not in the tool description; leaving them to the server", tool_name, bad)
+        return
+    raise ToolArgumentError(
+        f"{tool_name}: unknown metric(s) {bad}. Valid choices: {', '.join(sorted(valid))}"
+    )
+
+
+def metric_names_in(metadata: Any) -> Set[str]:
+    """Collect metric-looking names (dict keys and list strings) from a metadata payload."""
+    content = getattr(metadata, "content", None)
+    if content is not None and not isinstance(metadata, (dict, list, str)):
+        metadata = content
+    if isinstance(metadata, str):
+        try:
+            metadata = json.loads(metadata)
+        except ValueError:
+            return set()
+    names: Set[str] = set()
+    stack = [metadata]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            for k, v in node.items():
+                if isinstance(k, str) and re.fullmatch(r"[a-z0-9_]+", k):
+                    names.add(k)
+                stack.append(v)
+        elif isinstance(node, (list, tuple)):
+            for v in node:
+                if isinstance(v, str) and re.fullmatch(r"[a-z0-9_]+", v):
+                    names.add(v)
+                else:
+                    stack.append(v)
+    return names
@@ -0,0 +1,145 @@
+"""Paginated, streaming reads of the large per-game stats tools.
+
+A multi-season `get_offensive_players_game_stats` pull used to come back as
+one buffered payload, capped by the server's `limit`, before the agent saw
+any of it. The MCP tools have no offset or cursor argument, so pages are cut
+along the query's own filters instead: one page per season and block of
+`weeks_per_page` weeks, each asked for with `limit=page_size`. Pages are
+fetched in order with a little read-ahead, so the first rows arrive after
+one round trip and at most `prefetch + 1` pages are held at once.
+
+A page that comes back with exactly `page_size` rows may have been cut off
+by the server; it is flagged `truncated` rather than silently trusted.
+`order_by_metric` orders rows within a page, not across the whole stream.
+
+RunningTotals folds pages into per-player sums as they arrive, so a season
+total or per-game average never needs every row in memory.
+
+Usage:
+  totals = RunningTotals()
+  async for page in tools.stream("get_offensive_players_game_stats", season_list=[2022, 2023, 2024]):
+      totals.add(page.rows)
+  rows = totals.rows()
+"""
+import os
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+
+DEFAULT_PAGE_SIZE = int(os.getenv("GRIDIRON_PAGE_SIZE", "500"))
+DEFAULT_WEEKS_PER_PAGE = int(os.getenv("GRIDIRON_WEEKS_PER_PAGE", "3"))
+DEFAULT_PREFETCH = 1
+
+# regular season plus playoffs
+SEASON_WEEKS: Tuple[int, ...] = tuple(range(1, 23))
+
+STREAMABLE_TOOLS = frozenset({
+    "get_offensive_players_game_stats",
+    "get_defensive_players_game_stats",
+    "get_advanced_receiving_stats_weekly",
+    "get_advanced_passing_stats_weekly",
+    "get_advanced_rushing_stats_weekly",
+    "get_advanced_defense_stats_weekly",
+})
+
+
+class Page:
+    """One chunk of a streamed query."""
+
+    __slots__ = ("index", "kwargs", "rows", "truncated")
+
+    def __init__(self, index: int, kwargs: Dict[str, Any], rows: List[Dict[str, Any]], truncated: bool):
+        self.index = index
+        self.kwargs = kwargs
+        self.rows = rows
+        self.truncated = truncated
+
+    def __repr__(self) -> str:
+        flag = ", truncated" if self.truncated else ""
+        return f"Page({self.index}, {len(self.rows)} rows{flag})"
+
+
+def _chunks(values: Sequence[int], size: int) -> Iterator[List[int]]:
+    size = max(1, int(size))
+    for i in range(0, len(values), size):
+        yield list(values[i:i + size])
+
+
+def plan_pages(
+    kwargs: Dict[str, Any],
+    page_size: int = DEFAULT_PAGE_SIZE,
+    weeks_per_page: int = DEFAULT_WEEKS_PER_PAGE,
+) -> List[Dict[str, Any]]:
+    """Split one query into per-(season, week block) argument sets, oldest first.
+
+    Without a season_list there is nothing to split on and the query is one page.
+    """
+    base = {k: v for k, v in kwargs.items() if k not in ("season_list", "weekly_list", "limit")}
+    base["limit"] = int(page_size)
+    seasons = kwargs.get("season_list")
+    if not seasons:
+        return [{**base, **({"weekly_list": kwargs["weekly_list"]} if kwargs.get("weekly_list") else {})}]
+    weeks = sorted(set(kwargs.get("weekly_list") or SEASON_WEEKS))
+    pages = []
+    for season in sorted(set(seasons)):
+        for block in _chunks(weeks, weeks_per_page):
+            pages.append({**base, "season_list": [season], "weekly_list": block})
+    return pages
+
+
+def _number(value: Any) -> Optional[float]:
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    return None
+
+
+class RunningTotals:
+    """Per-key sums and counts of numeric columns, updated one page at a time."""
+
+    def __init__(
+        self,
+        key_fields: Sequence[str] = ("player_name",),
+        fields: Optional[Iterable[str]] = None,
+        skip_fields: Iterable[str] = ("season", "week", "height", "weight", "age"),
+    ):
+        self.key_fields = tuple(key_fields)
+        self.fields = set(fields) if fields is not None else None
+        self.skip_fields = set(skip_fields) | set(self.key_fields)
+        # key -> [games, {field: sum}, {field: non-null count}]
+        self._groups: Dict[Tuple[Any, ...], List[Any]] = {}
+        self.rows_seen = 0
+
+    def add(self, rows: Iterable[Dict[str, Any]]) -> None:
+        for row in rows:
+            self.rows_seen += 1
+            key = tuple(row.get(f) for f in self.key_fields)
+            group = self._groups.get(key)
+            if group is None:
+                group = self._groups[key] = [0, {}, {}]
+            group[0] += 1
+            sums, counts = group[1], group[2]
+            for field, value in row.items():
+                if field in self.skip_fields or (self.fields is not None and field not in self.fields):
+                    continue
+                n = _number(value)
+                if n is None:
+                    continue
+                sums[field] = sums.get(field, 0.0) + n
+                counts[field] = counts.get(field, 0) + 1
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+    def rows(self, per_game: bool = False, order_by: Optional[str] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """One row per key: `games` plus the sum (or per-game mean) of each numeric column."""
+        out = []
+        for key, (games, sums, counts) in self._groups.items():
+            row: Dict[str, Any] = dict(zip(self.key_fields, key))
+            row["games"] = games
+            for field, total in sums.items():
+                row[field] = total / counts[field] if per_game else total
+            out.append(row)
+        if order_by is not None:
+            out.sort(key=lambda r: (r.get(order_by) is None, -(r.get(order_by) or 0.0)))
+        return out[:limit] if limit is not None else out
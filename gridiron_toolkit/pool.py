@@ -0,0 +1,231 @@
+"""Process-wide MCP session pool shared by every GridironTools instance.
+
+Each team builds several GridironTools toolkits that all talk to the same MCP
+server. Instead of every toolkit opening its own streamable-http session (and
+paying its own handshake), toolkits borrow a session from a pool keyed by
+(url, transport). Sessions are connected lazily, health-checked with an MCP
+ping once they have been idle for a while, and reconnected when a call fails
+with a transport error.
+
+Usage:
+  pool = get_pool("http://host:8002/mcp/")
+  client = await pool.acquire()          # connected MCPTools instance
+  ...
+  await pool.report_failure(client)      # on transport errors -> reconnect
+  await close_all_pools()                # on application shutdown
+"""
+import asyncio
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from agno.tools.mcp import MCPTools
+
+from gridiron_toolkit.dispatch import dispatch_table_for
+
+
+DEFAULT_POOL_SIZE = int(os.getenv("GRIDIRON_MCP_POOL_SIZE", "2"))
+DEFAULT_HEALTH_CHECK_INTERVAL = float(os.getenv("GRIDIRON_MCP_HEALTH_CHECK_SECONDS", "30"))
+
+# Exceptions that mean the underlying session is unusable (as opposed to a tool
+# returning an error payload). anyio / httpx are transitive deps of the MCP
+# client; import them best-effort so this module never fails to load.
+_CONNECTION_ERRORS: Tuple[type, ...] = (ConnectionError, OSError, EOFError)
+try:
+    import anyio
+
+    _CONNECTION_ERRORS += (anyio.ClosedResourceError, anyio.BrokenResourceError, anyio.EndOfStream)
+except Exception:
+    pass
+try:
+    import httpx
+
+    _CONNECTION_ERRORS += (httpx.TransportError,)
+except Exception:
+    pass
+
+
+def is_connection_error(exc: BaseException) -> bool:
+    """True when `exc` indicates a broken transport rather than a tool-level error."""
+    return isinstance(exc, _CONNECTION_ERRORS)
+
+
+class _PoolSlot:
+    """One pooled MCP client plus its connection bookkeeping."""
+
+    def __init__(self) -> None:
+        self.client: Optional[MCPTools] = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.last_ok: float = 0.0
+        self.lock = asyncio.Lock()
+
+
+class MCPSessionPool:
+    """A fixed-size set of MCP client sessions to a single server.
+
+    Sessions are shared, not checked out exclusively: MCP multiplexes
+    concurrent requests over one session, so `acquire()` simply hands out the
+    next healthy session round-robin.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        transport: str = "streamable-http",
+        size: int = DEFAULT_POOL_SIZE,
+        health_check_interval: float = DEFAULT_HEALTH_CHECK_INTERVAL,
+    ):
+        self.url = url
+        self.transport = transport
+        self.size = max(1, int(size))
+        self.health_check_interval = health_check_interval
+        self._slots: List[_PoolSlot] = [_PoolSlot() for _ in range(self.size)]
+        self._next = 0
+        # simple counters, handy when debugging socket growth
+        self.connects = 0
+        self.reconnects = 0
+
+    def _new_client(self) -> MCPTools:
+        # pooled clients are unfiltered; each GridironTools decides what it exposes
+        return MCPTools(transport=self.transport, url=self.url)
+
+    async def _connect_slot(self, slot: _PoolSlot) -> MCPTools:
+        if slot.client is not None:
+            self.reconnects += 1
+            await _close_quietly(slot.client)
+            slot.client = None
+
+        client = self._new_client()
+        await client.connect()
+        if hasattr(client, "initialize"):
+            try:
+                await client.initialize()
+            except Exception:
+                pass
+        # build the name -> entrypoint table now rather than on the first call
+        dispatch_table_for(client)
+        slot.client = client
+        slot.loop = asyncio.get_running_loop()
+        slot.last_ok = time.monotonic()
+        self.connects += 1
+        return client
+
+    async def _healthy(self, slot: _PoolSlot) -> bool:
+        if slot.client is None or slot.loop is not asyncio.get_running_loop():
+            return False
+        if time.monotonic() - slot.last_ok < self.health_check_interval:
+            return True
+        session = getattr(slot.client, "session", None)
+        ping = getattr(session, "send_ping", None)
+        if ping is None:
+            # nothing to probe with; trust the session until a call fails
+            return True
+        try:
+            await ping()
+        except Exception:
+            return False
+        slot.last_ok = time.monotonic()
+        return True
+
+    async def acquire(self) -> MCPTools:
+        """Return a connected client, connecting or reconnecting as required."""
+        slot = self._slots[self._next % self.size]
+        self._next = (self._next + 1) % self.size
+
+        if await self._healthy(slot):
+            return slot.client  # type: ignore[return-value]
+        async with slot.lock:
+            # another task may have reconnected while we waited for the lock
+            if await self._healthy(slot):
+                return slot.client  # type: ignore[return-value]
+            return await self._connect_slot(slot)
+
+    async def warm(self) -> List[BaseException]:
+        """Connect every slot concurrently; returns the errors of the slots that failed."""
+
+        async def _warm_slot(slot: _PoolSlot) -> None:
+            async with slot.lock:
+                if not await self._healthy(slot):
+                    await self._connect_slot(slot)
+
+        results = await asyncio.gather(*(_warm_slot(s) for s in self._slots), return_exceptions=True)
+        return [r for r in results if isinstance(r, BaseException)]
+
+    def mark_ok(self, client: Any) -> None:
+        """Record a successful call so the next health check can be skipped."""
+        for slot in self._slots:
+            if slot.client is client:
+                slot.last_ok = time.monotonic()
+                return
+
+    async def report_failure(self, client: Any) -> None:
+        """Drop a client whose transport failed; the slot reconnects on next use."""
+        for slot in self._slots:
+            if slot.client is client:
+                async with slot.lock:
+                    if slot.client is client:
+                        await _close_quietly(client)
+                        slot.client = None
+                return
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "url": self.url,
+            "transport": self.transport,
+            "size": self.size,
+            "connected": sum(1 for s in self._slots if s.client is not None),
+            "connects": self.connects,
+            "reconnects": self.reconnects,
+        }
+
+    def peek(self) -> Optional[MCPTools]:
+        """Return any currently connected client without connecting (may be None)."""
+        for slot in self._slots:
+            if slot.client is not None:
+                return slot.client
+        return None
+
+    async def close(self) -> None:
+        for slot in self._slots:
+            if slot.client is not None:
+                await _close_quietly(slot.client)
+                slot.client = None
+
+
+async def _close_quietly(client: Any) -> None:
+    # closing streamable-http sessions from another task raises anyio cancel-scope
+    # noise during teardown; none of it is actionable
+    try:
+        await client.close()
+    except Exception:
+        pass
+
+
+_POOLS: Dict[Tuple[str, str], MCPSessionPool] = {}
+
+
+def get_pool(url: str, transport: str = "streamable-http", size: Optional[int] = None) -> MCPSessionPool:
+    """Return the process-wide pool for (url, transport), creating it on first use.
+
+    `size` only applies when the pool is created; later callers share the
+    existing pool regardless of the size they ask for.
+    """
+    key = (url, transport)
+    pool = _POOLS.get(key)
+    if pool is None:
+        pool = MCPSessionPool(url, transport=transport, size=size or DEFAULT_POOL_SIZE)
+        _POOLS[key] = pool
+    return pool
+
+
+def pool_stats() -> List[Dict[str, Any]]:
+    """stats() of every process-wide pool (for /metrics)."""
+    return [pool.stats() for pool in _POOLS.values()]
+
+
+async def close_all_pools() -> None:
+    """Close every pooled session (call from application shutdown)."""
+    pools = list(_POOLS.values())
+    _POOLS.clear()
+    for pool in pools:
+        await pool.close()
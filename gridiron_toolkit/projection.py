@@ -0,0 +1,71 @@
+"""Client-side projection of stats results down to the requested metrics.
+
+When an agent passes `metrics=[...]` to a stats tool the server still adds
+its "basic player info" block, and some tools send back far more columns
+than were asked for. `project_result()` keeps only the requested metrics,
+the `order_by_metric` column and a minimal identity set (player_name,
+season, week, team), so the payload shrinks before it is serialized into the
+conversation.
+
+The identity set is resolved per tool from the "Basic player info (...)"
+line in its schema (tool_list.py): seasonal receiving/rushing stats call
+the team column `ff_team`, weekly receiving stats have `ff_team` and
+`ff_position`, and so on. Calls without `metrics` are left untouched.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from gridiron_toolkit.compact import STATS_TOOLS
+from gridiron_toolkit.results import extract_rows, replace_rows
+from gridiron_toolkit.schemas import basic_info_fields
+
+
+MINIMAL_IDENTITY: Tuple[str, ...] = ("player_name", "season", "week", "team")
+
+# the team column goes by different names depending on the source table
+_TEAM_ALIASES = ("team", "ff_team", "team_abbr", "recent_team")
+
+PROJECTABLE_TOOLS = STATS_TOOLS
+
+
+def identity_fields(tool_name: str) -> Tuple[str, ...]:
+    """The minimal identity columns for `tool_name`, named as its schema names them."""
+    basic = basic_info_fields(tool_name)
+    if not basic:
+        return MINIMAL_IDENTITY
+    out = [f for f in basic if f in MINIMAL_IDENTITY or f in _TEAM_ALIASES]
+    return tuple(out) or MINIMAL_IDENTITY
+
+
+def _requested(kwargs: Dict[str, Any]) -> Optional[List[str]]:
+    metrics = kwargs.get("metrics")
+    if isinstance(metrics, str):
+        metrics = [metrics]
+    if not metrics:
+        return None
+    requested = [str(m) for m in metrics]
+    order_by = kwargs.get("order_by_metric")
+    if order_by and order_by not in requested:
+        requested.append(str(order_by))
+    return requested
+
+
+def project_rows(rows: Sequence[Dict[str, Any]], keep: Iterable[str]) -> List[Dict[str, Any]]:
+    keep = tuple(dict.fromkeys(keep))
+    return [{k: row[k] for k in keep if k in row} for row in rows]
+
+
+def project_result(tool_name: str, kwargs: Dict[str, Any], result: Any) -> Any:
+    """Trim a stats result to identity + requested metrics; other results pass through."""
+    if tool_name not in PROJECTABLE_TOOLS:
+        return result
+    requested = _requested(kwargs)
+    if requested is None:
+        return result
+    rows = extract_rows(result)
+    if not rows:
+        return result
+    identity = identity_fields(tool_name)
+    # fall back to whatever team alias the rows actually carry
+    if not any(f in rows[0] for f in identity if f in _TEAM_ALIASES):
+        identity = identity + tuple(a for a in _TEAM_ALIASES if a in rows[0])[:1]
+    return replace_rows(result, project_rows(rows, identity + tuple(requested)))
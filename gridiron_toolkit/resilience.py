@@ -0,0 +1,176 @@
+"""Retry with jittered exponential backoff and per-tool circuit breakers.
+
+When the MCP server is slow or restarting, a transport failure used to go
+straight back to the agent. Now:
+
+  - idempotent read tools (every `get_*` tool) are retried on transport
+    errors and timeouts, sleeping a random 0..min(max_delay, base * 2**n)
+    between attempts ("full jitter", so retries from many workers spread out);
+  - each (server, tool) pair has a CircuitBreaker. After `failure_threshold`
+    consecutive transport failures or timeouts (errors `retry_on` accepts;
+    tool errors and an exhausted request budget don't count) it opens and calls fail fast with CircuitOpenError
+    for `reset_timeout` seconds, then a single trial call (half-open)
+    decides whether it closes again. One struggling backend tool therefore
+    stops tying up every worker while the other tools keep working.
+
+GridironTools pairs this with the result cache's stale-if-error window, so
+an open breaker can still answer with the last known good value.
+"""
+import asyncio
+import os
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+
+DEFAULT_RETRY_ATTEMPTS = int(os.getenv("GRIDIRON_RETRY_ATTEMPTS", "3"))
+DEFAULT_RETRY_BASE_DELAY = float(os.getenv("GRIDIRON_RETRY_BASE_DELAY_SECONDS", "0.2"))
+DEFAULT_RETRY_MAX_DELAY = float(os.getenv("GRIDIRON_RETRY_MAX_DELAY_SECONDS", "2.0"))
+DEFAULT_BREAKER_THRESHOLD = int(os.getenv("GRIDIRON_BREAKER_THRESHOLD", "5"))
+DEFAULT_BREAKER_RESET = float(os.getenv("GRIDIRON_BREAKER_RESET_SECONDS", "30"))
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised without contacting the server while a tool's breaker is open."""
+
+
+def is_idempotent(tool_name: str) -> bool:
+    # every remote tool today is a read; anything else must opt in explicitly
+    return tool_name.startswith("get_")
+
+
+class RetryPolicy:
+    """How many attempts to make and how long to back off between them."""
+
+    def __init__(
+        self,
+        max_attempts: int = DEFAULT_RETRY_ATTEMPTS,
+        base_delay: float = DEFAULT_RETRY_BASE_DELAY,
+        max_delay: float = DEFAULT_RETRY_MAX_DELAY,
+    ):
+        self.max_attempts = max(1, int(max_attempts))
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt: int) -> float:
+        """Sleep before retry number `attempt` (1-based), with full jitter."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** (attempt - 1))))
+
+
+class CircuitBreaker:
+    """closed -> open after N consecutive failures -> half-open after a cool-down."""
+
+    def __init__(self, failure_threshold: int = DEFAULT_BREAKER_THRESHOLD, reset_timeout: float = DEFAULT_BREAKER_RESET):
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self.opens = 0
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half-open" and not self._trial_in_flight:
+            # let exactly one caller probe the backend
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def release_trial(self) -> None:
+        self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        was_trial = self._trial_in_flight
+        self._trial_in_flight = False
+        if was_trial or self.failures >= self.failure_threshold:
+            if self.opened_at is None or was_trial:
+                self.opens += 1
+            self.opened_at = time.monotonic()
+
+    def retry_after(self) -> float:
+        if self.opened_at is None:
+            return 0.0
+        return max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+
+
+async def call_with_retry(
+    fn: Callable[[], Awaitable[Any]],
+    policy: RetryPolicy,
+    retry_on: Callable[[BaseException], bool],
+    breaker: Optional[CircuitBreaker] = None,
+    label: str = "call",
+) -> Any:
+    """Await `fn()` under `breaker`, retrying errors that satisfy `retry_on`."""
+    attempt = 0
+    while True:
+        attempt += 1
+        if breaker is not None and not breaker.allow():
+            raise CircuitOpenError(f"{label}: circuit open, retry in {breaker.retry_after():.0f}s")
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            if breaker is not None:
+                # a cancelled probe proves nothing either way
+                breaker.release_trial()
+            raise
+        except Exception as e:
+            if not retry_on(e):
+                # a tool error for bad arguments or a spent request budget says nothing
+                # about the backend; the breaker is shared, so leave it alone
+                if breaker is not None:
+                    breaker.release_trial()
+                raise
+            if breaker is not None:
+                breaker.record_failure()
+            if attempt >= policy.max_attempts:
+                raise
+            await asyncio.sleep(policy.delay(attempt))
+            continue
+        if breaker is not None:
+            breaker.record_success()
+        return result
+
+
+_BREAKERS: Dict[Tuple[str, str], CircuitBreaker] = {}
+
+
+def get_breaker(url: str, tool_name: str) -> CircuitBreaker:
+    """Return the process-wide breaker for (url, tool_name), creating it on first use."""
+    key = (url, tool_name)
+    breaker = _BREAKERS.get(key)
+    if breaker is None:
+        breaker = CircuitBreaker()
+        _BREAKERS[key] = breaker
+    return breaker
+
+
+def breaker_stats() -> List[Dict[str, Any]]:
+    """One row per breaker (url, tool, state, failures, opens), sorted by url and tool."""
+    return [
+        {"url": url, "tool": tool, "state": b.state, "failures": b.failures, "opens": b.opens}
+        for (url, tool), b in sorted(_BREAKERS.items())
+    ]
+
+
+def breaker_states() -> Dict[str, Dict[str, Any]]:
+    """Snapshot of every breaker, keyed "url tool" (handy for health endpoints)."""
+    return {
+        f"{row['url']} {row['tool']}": {"state": row["state"], "failures": row["failures"], "opens": row["opens"]}
+        for row in breaker_stats()
+    }
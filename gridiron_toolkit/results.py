@@ -0,0 +1,123 @@
+"""Helpers for reading and rewriting row-shaped MCP tool results.
+
+Depending on the agno/MCP client version a tool result reaches us as a
+python list, a `{"result": [...]}` dict (fastmcp's wrapped result), a JSON
+string of either, or a ToolResult-like object whose `.content` is that JSON
+string. Post-processors (batching, projection, compact encoding) only care
+about the rows, so they go through `extract_rows()` and hand the new rows
+back with `replace_rows()`, which preserves whatever container came in.
+"""
+import copy
+import json
+from typing import Any, Dict, List, Optional
+
+
+def _rows_from(data: Any) -> Optional[List[Dict[str, Any]]]:
+    if isinstance(data, dict) and isinstance(data.get("result"), list):
+        data = data["result"]
+    if isinstance(data, list) and all(isinstance(r, dict) for r in data):
+        return data
+    return None
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, (bytes, bytearray)):
+        value = value.decode("utf-8", errors="replace")
+    if isinstance(value, str):
+        try:
+            return json.loads(value)
+        except ValueError:
+            return None
+    return value
+
+
+def extract_rows(result: Any) -> Optional[List[Dict[str, Any]]]:
+    """Return the list of row dicts inside `result`, or None if it isn't row-shaped."""
+    content = getattr(result, "content", None)
+    if content is not None and not isinstance(result, (dict, list, str)):
+        return _rows_from(_decode(content))
+    return _rows_from(_decode(result))
+
+
+def _rewrap(original: Any, rows: List[Dict[str, Any]]) -> Any:
+    decoded = _decode(original)
+    wrapped = {**decoded, "result": rows} if isinstance(decoded, dict) else rows
+    if isinstance(original, (str, bytes, bytearray)):
+        return json.dumps(wrapped, default=str)
+    return wrapped
+
+
+def replace_rows(result: Any, rows: List[Dict[str, Any]]) -> Any:
+    """Return a copy of `result` carrying `rows`, in the same container type."""
+    content = getattr(result, "content", None)
+    if content is not None and not isinstance(result, (dict, list, str)):
+        out = copy.copy(result)
+        try:
+            out.content = _rewrap(content, rows)
+        except Exception:
+            return _rewrap(content, rows)
+        return out
+    return _rewrap(result, rows)
+
+
+def empty_like(result: Any) -> Any:
+    """A row-less `result` in the same container, with none of its other keys (errors, notes)."""
+    content = getattr(result, "content", None)
+    if content is not None and not isinstance(result, (dict, list, str)):
+        out = copy.copy(result)
+        try:
+            out.content = empty_like(content)
+        except Exception:
+            return empty_like(content)
+        return out
+    decoded = _decode(result)
+    empty: Any = {"result": []} if isinstance(decoded, dict) else []
+    if isinstance(result, (str, bytes, bytearray)):
+        return json.dumps(empty)
+    return empty
+
+
+def add_fields(result: Any, **fields: Any) -> Any:
+    """Return a copy of `result` with extra top-level keys; a bare row list becomes `{"result": rows, ...}`."""
+    rows = extract_rows(result)
+    if rows is None:
+        return result
+    content = getattr(result, "content", None)
+    wrapped = content is not None and not isinstance(result, (dict, list, str))
+    decoded = _decode(content if wrapped else result)
+    payload = {**(decoded if isinstance(decoded, dict) else {"result": rows}), **fields}
+    if wrapped:
+        out = copy.copy(result)
+        text = json.dumps(payload, default=str)
+        try:
+            out.content = text
+        except Exception:
+            return text
+        return out
+    if isinstance(result, (str, bytes, bytearray)):
+        return json.dumps(payload, default=str)
+    return payload
+
+
+def replace_content(result: Any, text: str) -> Any:
+    """Return `result` with its payload swapped for `text` (keeps ToolResult wrappers)."""
+    content = getattr(result, "content", None)
+    if content is not None and not isinstance(result, (dict, list, str)):
+        out = copy.copy(result)
+        try:
+            out.content = text
+        except Exception:
+            return text
+        return out
+    return text
+
+
+def extra_fields(result: Any) -> Dict[str, Any]:
+    """Non-row keys of a wrapped `{"result": [...], ...}` payload (metadata, notes)."""
+    content = getattr(result, "content", None)
+    if content is not None and not isinstance(result, (dict, list, str)):
+        result = content
+    decoded = _decode(result)
+    if isinstance(decoded, dict):
+        return {k: v for k, v in decoded.items() if k != "result"}
+    return {}
@@ -0,0 +1,352 @@
+"""Deterministic intent router in front of the coordinator team.
+
+The `Team(mode="coordinate")` supervisor spends one or two full LLM round
+trips deciding that "basic info about Josh Allen" means
+get_player_info_tool. For the handful of intents that make up most
+traffic, the plan is obvious from the wording:
+
+  - player info        "basic info about Josh Allen", "who is Puka Nacua?"
+  - league rosters     "show the rosters for league 1180208512191082496"
+  - trending players   "top 10 trending drops this week", "who's hot on waivers?"
+
+"Who is ..." only counts when what follows looks like a player: two or more
+words, or a name the name index knows ("who is Puka"). "Who is available"
+and "who's Detroit's QB" go to the team, and so does "trending" outside a
+fantasy/waiver context ("what is trending on twitter about Jefferson").
+
+`match_intent()` recognizes those with regular expressions and returns the
+tool plan. IntentRouter runs the plan through GridironTools, so the pool,
+caches, identity map and trending snapshot all apply, and renders the
+answer as markdown. No model is called. Anything open-ended ("should I",
+"compare", "trade", ...) and any plan that comes back empty falls through
+to the team unchanged.
+
+Routed answers are written to the team's session storage as a run of
+their own (`record_turn()`), so a follow-up that needs context ("what
+about his stats?"), which never matches a rule, reaches the coordinator
+with the routed turn in its history.
+
+Usage:
+  install_intent_router(team, server_url)      # wraps team.arun
+  plan = match_intent("info on Josh Allen")     # -> Plan("player_info", [...])
+"""
+import asyncio
+import logging
+import re
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from gridiron_toolkit.names import NAME_FIELDS, PlayerNameIndex, get_name_index
+
+logger = logging.getLogger(__name__)
+
+PLAYER_INFO = "get_player_info_tool"
+SLEEPER_LOOKUP = "get_players_by_sleeper_id_tool"
+ROSTERS = "get_sleeper_league_rosters"
+USERS = "get_sleeper_league_users"
+TRENDING = "get_sleeper_trending_players"
+ROUTER_TOOLS = (PLAYER_INFO, SLEEPER_LOOKUP, ROSTERS, USERS, TRENDING)
+
+MAX_NAMES = 6
+MAX_TRENDING = 50
+
+# wording that asks for judgement, not a lookup: always the coordinator's job
+_OPEN_ENDED = re.compile(
+    r"\b(should|start|sit|compare|comparison|vs\.?|versus|better|best|worst|why|how|trade|recommend|"
+    r"worth|project\w*|predict\w*|advice|analy[sz]\w*|stats?|rank\w*|value|outlook|injur\w*)\b",
+    re.I,
+)
+_PLAYER_INFO = re.compile(
+    r"^(?:(?:can you |please )?(?:give me|show me|get|pull up|look up|what(?:'s| is))\s+)?(?:the\s+)?"
+    r"(?:basic\s+|player\s+)?(?:info|information|bio|profile|details)\s+(?:about|on|for)\s+(?P<names>.+?)\W*$",
+    re.I,
+)
+_WHO_IS = re.compile(r"^who(?:'s| is| are)\s+(?P<names>.+?)\W*$", re.I)
+_NAME_SPLIT = re.compile(r"\s*(?:,|&|\band\b)\s*", re.I)
+# a player name: 1-4 words of letters, apostrophes, periods and hyphens
+_NAME = re.compile(r"^[a-z][a-z.'\-]*(?:\s+[a-z][a-z.'\-]*){0,3}$", re.I)
+_NOT_NAMES = {"the", "a", "an", "my", "our", "your", "top", "hot", "trending", "leading", "playing", "starting",
+              "this", "that", "who", "team", "league", "roster", "rosters", "waiver", "waivers", "he", "she", "they",
+              "available", "next", "free", "agent", "agents", "starter", "starters", "backup", "coach", "owner",
+              "qb", "rb", "wr", "te", "k", "dst", "def", "quarterback", "kicker"}
+
+_LEAGUE_ID = re.compile(r"\b(\d{15,20})\b")
+_ROSTERS = re.compile(r"\brosters?\b", re.I)
+_TRENDING = re.compile(
+    r"\b(trending|most (?:added|dropped|picked up)|hot on (?:the )?waivers|waiver (?:adds|drops|pickups))\b", re.I
+)
+# "trending" alone could be about anything; the trending tool only answers the waiver kind
+_FANTASY_CONTEXT = re.compile(r"\b(waivers?|sleeper|fantasy|pick ?ups?|picked up|adds?|added|drops?|dropped)\b", re.I)
+_HOURS = re.compile(r"\b(\d{1,3})\s*(h|hrs?|hours?|d|days?)\b", re.I)
+_TOP = re.compile(r"\btop\s+(\d{1,2})\b", re.I)
+
+
+class Plan:
+    """A matched intent and the (tool, kwargs) calls that answer it."""
+
+    __slots__ = ("intent", "calls")
+
+    def __init__(self, intent: str, calls: List[Tuple[str, Dict[str, Any]]]):
+        self.intent = intent
+        self.calls = calls
+
+    def __repr__(self) -> str:
+        return f"Plan({self.intent!r}, {self.calls!r})"
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, Plan) and (self.intent, self.calls) == (other.intent, other.calls)
+
+
+def _player_names(text: str) -> Optional[List[str]]:
+    names = [n.strip(" .") for n in _NAME_SPLIT.split(text.strip()) if n.strip(" .")]
+    if not names or len(names) > MAX_NAMES:
+        return None
+    for name in names:
+        words = name.lower().split()
+        # "Detroit's QB" is a description, not a name
+        if not _NAME.match(name) or set(words) & _NOT_NAMES or any(w.endswith("'s") for w in words):
+            return None
+    return names
+
+
+def _known_player(name: str, name_index: Optional[PlayerNameIndex]) -> bool:
+    return len(name.split()) >= 2 or (name_index is not None and name_index.resolve(name) is not None)
+
+
+def _trending_args(text: str) -> Dict[str, Any]:
+    kwargs: Dict[str, Any] = {"add_drop": "drop" if re.search(r"\bdrop", text, re.I) else "add", "hours": 24}
+    hours = _HOURS.search(text)
+    if hours:
+        n = int(hours.group(1))
+        kwargs["hours"] = n * 24 if hours.group(2).lower().startswith("d") else n
+    elif re.search(r"\b(this|past|last) week\b", text, re.I):
+        kwargs["hours"] = 168
+    top = _TOP.search(text)
+    kwargs["limit"] = min(int(top.group(1)), MAX_TRENDING) if top else 25
+    return kwargs
+
+
+def match_intent(question: str, name_index: Optional[PlayerNameIndex] = None) -> Optional[Plan]:
+    """The tool plan for a simple lookup question, or None when the coordinator should handle it.
+
+    A one-word "who is" name only matches when `name_index` resolves it.
+    """
+    text = " ".join(str(question or "").split())
+    if not text or len(text) > 200 or _OPEN_ENDED.search(text):
+        return None
+    if _TRENDING.search(text) and _FANTASY_CONTEXT.search(text):
+        return Plan("trending", [(TRENDING, _trending_args(text))])
+    league = _LEAGUE_ID.search(text)
+    if league and _ROSTERS.search(text):
+        league_id = league.group(1)
+        return Plan("league_rosters", [(ROSTERS, {"league_id": league_id}), (USERS, {"league_id": league_id})])
+    found = _PLAYER_INFO.match(text)
+    names = _player_names(found.group("names")) if found else None
+    if names is None:
+        found = _WHO_IS.match(text)
+        names = _player_names(found.group("names")) if found else None
+        if names and not all(_known_player(n, name_index) for n in names):
+            names = None
+    if names:
+        return Plan("player_info", [(PLAYER_INFO, {"player_names": names})])
+    return None
+
+
+def _table(rows: Sequence[Dict[str, Any]], columns: Sequence[Tuple[str, str]]) -> str:
+    lines = ["| " + " | ".join(title for _, title in columns) + " |", "|" + "---|" * len(columns)]
+    for row in rows:
+        lines.append("| " + " | ".join("" if row.get(c) is None else str(row.get(c)) for c, _ in columns) + " |")
+    return "\n".join(lines)
+
+
+def _name(row: Dict[str, Any]) -> Optional[str]:
+    return next((str(row[f]) for f in NAME_FIELDS if row.get(f) not in (None, "")), None)
+
+
+_INFO_COLUMNS = (("position", "Pos"), ("latest_team", "Team"), ("height", "Ht"), ("weight", "Wt"),
+                 ("birth_date", "Born"), ("college_name", "College"), ("years_of_experience", "Exp"))
+
+
+class IntentRouter:
+    """Answers matched intents through a GridironTools without calling a model."""
+
+    def __init__(self, toolkit: Any, name_index: Optional[PlayerNameIndex] = None):
+        self.toolkit = toolkit
+        # players seen so far; lets "who is Puka" through
+        self.name_index = name_index if name_index is not None else get_name_index()
+        self.routed: Dict[str, int] = {}
+        self.fallbacks = 0
+
+    async def answer(self, question: str) -> Optional[Tuple[str, str]]:
+        """(intent, markdown answer), or None to hand the question to the team."""
+        plan = match_intent(question, self.name_index)
+        if plan is None:
+            self.fallbacks += 1
+            return None
+        try:
+            results = await asyncio.gather(*(self.toolkit.fetch_rows(t, **kw) for t, kw in plan.calls))
+            content = await getattr(self, f"_render_{plan.intent}")(plan, results)
+        except Exception as e:
+            logger.info("intent %s fell back to the team: %s: %s", plan.intent, type(e).__name__, e)
+            content = None
+        if not content:
+            self.fallbacks += 1
+            return None
+        self.routed[plan.intent] = self.routed.get(plan.intent, 0) + 1
+        return plan.intent, content
+
+    async def _names_by_sleeper_id(self, ids: Sequence[Any]) -> Dict[str, Dict[str, Any]]:
+        ids = list(dict.fromkeys(str(i) for i in ids if i not in (None, "")))
+        if not ids:
+            return {}
+        rows = await self.toolkit.fetch_rows(SLEEPER_LOOKUP, sleeper_ids=ids)
+        return {str(r.get("sleeper_id")): r for r in rows}
+
+    async def _render_player_info(self, plan: Plan, results: List[List[Dict[str, Any]]]) -> Optional[str]:
+        rows = results[0]
+        if not rows:
+            return None
+        columns = [c for c in _INFO_COLUMNS if any(r.get(c[0]) not in (None, "") for r in rows)]
+        table = [{"name": _name(r), **r} for r in rows]
+        return _table(table, [("name", "Player"), *columns])
+
+    async def _render_league_rosters(self, plan: Plan, results: List[List[Dict[str, Any]]]) -> Optional[str]:
+        rosters, users = results
+        if not rosters:
+            return None
+        owners = {str(u.get("user_id")): u.get("display_name") or u.get("username") for u in users}
+        players = await self._names_by_sleeper_id([p for r in rosters for p in r.get("players") or ()])
+        out = []
+        for roster in sorted(rosters, key=lambda r: r.get("roster_id") or 0):
+            settings = roster.get("settings") or {}
+            owner = owners.get(str(roster.get("owner_id"))) or f"Roster {roster.get('roster_id')}"
+            record = f" ({settings.get('wins', 0)}-{settings.get('losses', 0)})" if "wins" in settings else ""
+            starters = {str(s) for s in roster.get("starters") or ()}
+            names = []
+            for pid in roster.get("players") or ():
+                row = players.get(str(pid)) or {}
+                label = _name(row) or str(pid)
+                pos = row.get("position")
+                names.append(f"{'**' if str(pid) in starters else ''}{label}{f' ({pos})' if pos else ''}"
+                             f"{'**' if str(pid) in starters else ''}")
+            out.append(f"**{owner}**{record}: " + (", ".join(names) or "_empty_"))
+        return "\n\n".join(out) + "\n\n_Starters in bold._"
+
+    async def _render_trending(self, plan: Plan, results: List[List[Dict[str, Any]]]) -> Optional[str]:
+        rows = results[0]
+        if not rows:
+            return None
+        kwargs = plan.calls[0][1]
+        players = await self._names_by_sleeper_id([r.get("player_id") for r in rows])
+        verb = "drops" if kwargs["add_drop"] == "drop" else "adds"
+        lines = [f"Trending {verb} on Sleeper, last {kwargs['hours']} hours:", ""]
+        for i, r in enumerate(rows, 1):
+            row = players.get(str(r.get("player_id"))) or {}
+            name = _name(row) or str(r.get("player_id"))
+            detail = ", ".join(str(v) for v in (row.get("position"), row.get("latest_team") or row.get("team")) if v)
+            lines.append(f"{i}. {name}{f' ({detail})' if detail else ''}: {r.get('count', '?')} {verb}")
+        return "\n".join(lines)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"routed": dict(self.routed), "fallbacks": self.fallbacks}
+
+
+def record_turn(team: Any, question: str, response: Any, user_id: Optional[str] = None) -> bool:
+    """Write `question` and an answer produced outside the team into the team's session storage.
+
+    The turn is added the way agno adds a team run, so later runs in the
+    session see it as history. Returns False when there is nowhere to write.
+    """
+    session_id = getattr(response, "session_id", None)
+    if getattr(team, "storage", None) is None or not session_id:
+        return False
+    from agno.models.message import Message
+
+    team.initialize_team(session_id=session_id)
+    team.read_from_storage(session_id=session_id)
+    question_message = Message(role="user", content=question)
+    response.messages = [question_message, Message(role="assistant", content=response.content)]
+    memory = team.memory
+    if hasattr(memory, "add_team_run"):
+        # the older TeamMemory keeps messages and runs separately
+        from agno.memory.team import TeamRun
+
+        memory.add_messages(messages=response.messages)
+        run = TeamRun(response=response)
+        run.message = question_message
+        memory.add_team_run(run)
+    else:
+        memory.add_run(session_id=session_id, run=response)
+    team.write_to_storage(session_id=session_id, user_id=user_id)
+    return True
+
+
+def team_response(
+    team: Any,
+    content: str,
+    model: str,
+    session_id: Optional[str],
+    stream: bool,
+    metrics: Optional[Dict[str, Any]] = None,
+    question: Optional[str] = None,
+    user_id: Optional[str] = None,
+) -> Any:
+    """A TeamRunResponse (or a one-event stream of it) for an answer produced outside the team.
+
+    With `question`, the turn is also written to the team's session storage (record_turn()).
+    """
+    from agno.run.team import TeamRunResponse
+
+    response = TeamRunResponse(
+        content=content,
+        content_type="str",
+        run_id=str(uuid.uuid4()),
+        team_id=getattr(team, "team_id", None),
+        session_id=session_id or getattr(team, "session_id", None),
+        created_at=int(time.time()),
+    )
+    response.model = model
+    response.metrics = dict(metrics or {})
+    if question is not None:
+        try:
+            record_turn(team, question, response, user_id)
+        except Exception as e:
+            # the answer still goes out; only the follow-up loses this turn
+            logger.warning("could not store %s turn: %s: %s", model, type(e).__name__, e)
+    if not stream:
+        return response
+
+    async def _events():
+        try:
+            from agno.run.team import RunResponseContentEvent  # event-based streaming
+        except ImportError:
+            yield response
+            return
+        yield RunResponseContentEvent(content=content, content_type="str", run_id=response.run_id,
+                                      team_id=response.team_id, session_id=response.session_id)
+
+    return _events()
+
+
+def install_intent_router(team: Any, url: str, router: Optional[IntentRouter] = None) -> IntentRouter:
+    """Wrap `team.arun` so matched lookups skip the coordinator model."""
+    if router is None:
+        from gridiron_toolkit.info import GridironTools
+
+        router = IntentRouter(GridironTools(url=url, include_tools=list(ROUTER_TOOLS)))
+    team_arun = team.arun
+
+    async def arun(message: Any = None, *args: Any, stream: Optional[bool] = None, **kwargs: Any) -> Any:
+        question = message if isinstance(message, str) else getattr(message, "content", None)
+        answered = await router.answer(question) if isinstance(question, str) and not args else None
+        if answered is None:
+            return await team_arun(message, *args, stream=stream, **kwargs)
+        intent, content = answered
+        use_stream = getattr(team, "stream", False) if stream is None else stream
+        return team_response(team, content, f"intent-router:{intent}", kwargs.get("session_id"), bool(use_stream),
+                             metrics={"routed_intent": intent}, question=question, user_id=kwargs.get("user_id"))
+
+    team.arun = arun
+    team.intent_router = router
+    return router
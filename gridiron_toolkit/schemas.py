@@ -0,0 +1,219 @@
+"""Schema registry built from the tool catalog in tool_list.py.
+
+tool_list.py is a dump of the MCP server's `list_tools` output. It is
+imported lazily on first use and indexed by tool name. From each tool's
+`inputSchema` the registry derives:
+
+  - a typed `inspect.Signature` for the local wrapper, so agno registers a
+    real parameter schema without a live `list_tools` round trip;
+  - `validate_args()`, which rejects unknown, missing or wrongly typed
+    arguments before the network hop.
+
+The stats tools' descriptions are also mined for the metric names and the
+"basic player info" columns each one documents.
+"""
+import importlib
+import inspect
+import re
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+
+_REGISTRY: Optional[Dict[str, Dict[str, Any]]] = None
+
+# "Volume Metrics: (workhorse, ...)\n        games, targets, ..."
+_METRIC_SECTION = re.compile(r"^\s*[\w/ ]*Metrics:.*\n\s*([a-z0-9_, ]+)$", re.MULTILINE)
+# "Basic player info (season, player_name, ff_team, merge_name) is always included."
+_BASIC_INFO = re.compile(r"basic player info \(([^)]*)\)", re.IGNORECASE)
+# "positions (defaults to ['WR','TE','RB'])" / "defaults to typical offensive roles, e.g. ['QB', 'RB', 'WR', 'TE']"
+_DEFAULT_POSITIONS = re.compile(r"positions[^\n]*?defaults to[^\[\n]*\[([^\]]*)\]")
+
+
+class ToolArgumentError(ValueError):
+    """Arguments that don't match a tool's inputSchema (raised before any remote call)."""
+
+
+def _load() -> Dict[str, Dict[str, Any]]:
+    # the catalog is ~1000 lines of literals; only pay for it when something needs a schema
+    module = importlib.import_module("gridiron_toolkit.tool_list")
+    return {t["name"]: t for t in getattr(module, "tools", [])}
+
+
+def registry() -> Dict[str, Dict[str, Any]]:
+    """Return {tool name: tool definition}, parsing tool_list.py on first use."""
+    global _REGISTRY
+    if _REGISTRY is None:
+        _REGISTRY = _load()
+    return _REGISTRY
+
+
+def get_tool(name: str) -> Optional[Dict[str, Any]]:
+    return registry().get(name)
+
+
+def _split(names: str) -> List[str]:
+    return [n.strip() for n in names.split(",") if n.strip()]
+
+
+_METRICS_CACHE: Dict[str, Optional[FrozenSet[str]]] = {}
+_BASIC_CACHE: Dict[str, Tuple[str, ...]] = {}
+_POSITIONS_CACHE: Dict[str, Tuple[str, ...]] = {}
+
+
+def documented_metrics(name: str) -> Optional[FrozenSet[str]]:
+    """Metric names a stats tool's description enumerates, or None if it lists none."""
+    if name not in _METRICS_CACHE:
+        tool = get_tool(name) or {}
+        found = set()
+        for section in _METRIC_SECTION.findall(tool.get("description", "")):
+            found.update(_split(section))
+        _METRICS_CACHE[name] = frozenset(found) if found else None
+    return _METRICS_CACHE[name]
+
+
+def basic_info_fields(name: str) -> Tuple[str, ...]:
+    """Identity columns the tool says are always included (empty if undocumented)."""
+    if name not in _BASIC_CACHE:
+        tool = get_tool(name) or {}
+        m = _BASIC_INFO.search(tool.get("description", ""))
+        _BASIC_CACHE[name] = tuple(_split(m.group(1))) if m else ()
+    return _BASIC_CACHE[name]
+
+
+def default_positions(name: str) -> Tuple[str, ...]:
+    """Positions the server assumes when `positions` is omitted (empty if undocumented)."""
+    if name not in _POSITIONS_CACHE:
+        tool = get_tool(name) or {}
+        m = _DEFAULT_POSITIONS.search(tool.get("description", ""))
+        _POSITIONS_CACHE[name] = tuple(p.strip(" '\"") for p in m.group(1).split(",") if p.strip(" '\"")) if m else ()
+    return _POSITIONS_CACHE[name]
+
+
+_PY_TYPES: Dict[str, Any] = {
+    "string": str,
+    "integer": int,
+    "number": float,
+    "boolean": bool,
+    "object": Dict[str, Any],
+}
+
+
+def _variants(prop: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return list(prop.get("anyOf") or [prop])
+
+
+def annotation_for(prop: Dict[str, Any]) -> Any:
+    """Python type hint for one JSON-schema property (anyOf null -> Optional)."""
+    hints = []
+    nullable = False
+    for v in _variants(prop):
+        t = v.get("type")
+        if t == "null":
+            nullable = True
+        elif t == "array":
+            item = annotation_for(v.get("items") or {})
+            hints.append(List[item])  # type: ignore[valid-type]
+        elif t in _PY_TYPES:
+            hints.append(_PY_TYPES[t])
+    hint: Any = Any
+    if len(hints) == 1:
+        hint = hints[0]
+    if nullable and hint is not Any:
+        hint = Optional[hint]
+    return hint
+
+
+def input_properties(name: str) -> Dict[str, Dict[str, Any]]:
+    tool = get_tool(name) or {}
+    return dict((tool.get("inputSchema") or {}).get("properties") or {})
+
+
+def required_args(name: str) -> Tuple[str, ...]:
+    tool = get_tool(name) or {}
+    return tuple((tool.get("inputSchema") or {}).get("required") or ())
+
+
+def signature_for(name: str, agent_param: bool = True) -> Optional[inspect.Signature]:
+    """Typed signature `(agent, *, <schema params>)` for the wrapper of tool `name`."""
+    if get_tool(name) is None:
+        return None
+    required = set(required_args(name))
+    params = []
+    if agent_param:
+        params.append(inspect.Parameter("agent", inspect.Parameter.POSITIONAL_OR_KEYWORD))
+    props = input_properties(name)
+    # required parameters first so the signature reads like the server's function
+    for pname in sorted(props, key=lambda n: n not in required):
+        prop = props[pname]
+        default = inspect.Parameter.empty if pname in required else prop.get("default")
+        params.append(
+            inspect.Parameter(pname, inspect.Parameter.KEYWORD_ONLY, default=default, annotation=annotation_for(prop))
+        )
+    return inspect.Signature(params)
+
+
+def apply_schema(func: Any, name: str) -> Any:
+    """Give a `(agent, *args, **kwargs)` wrapper the typed signature and docstring of tool `name`."""
+    sig = signature_for(name)
+    if sig is None:
+        return func
+    func.__signature__ = sig
+    func.__annotations__ = {p.name: p.annotation for p in sig.parameters.values() if p.annotation is not inspect.Parameter.empty}
+    description = (get_tool(name) or {}).get("description")
+    if description:
+        func.__doc__ = inspect.cleandoc(description)
+    return func
+
+
+def _matches(value: Any, variant: Dict[str, Any]) -> bool:
+    t = variant.get("type")
+    if t is None:
+        return True
+    if t == "null":
+        return value is None
+    if t == "string":
+        return isinstance(value, str)
+    if t == "boolean":
+        return isinstance(value, bool)
+    if t == "integer":
+        return isinstance(value, int) and not isinstance(value, bool)
+    if t == "number":
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+    if t == "object":
+        return isinstance(value, dict)
+    if t == "array":
+        if not isinstance(value, (list, tuple)):
+            return False
+        items = variant.get("items")
+        return not items or all(any(_matches(v, iv) for iv in _variants(items)) for v in value)
+    return True
+
+
+def _type_label(prop: Dict[str, Any]) -> str:
+    labels = []
+    for v in _variants(prop):
+        t = v.get("type", "any")
+        if t == "array" and v.get("items", {}).get("type"):
+            t = f"array of {v['items']['type']}"
+        labels.append(t)
+    return " or ".join(labels)
+
+
+def validate_args(name: str, kwargs: Dict[str, Any]) -> None:
+    """Raise ToolArgumentError if `kwargs` don't fit tool `name`'s inputSchema.
+
+    Tools missing from the catalog are not checked (the server stays the
+    authority for anything tool_list.py doesn't describe).
+    """
+    if get_tool(name) is None:
+        return
+    props = input_properties(name)
+    unknown = sorted(set(kwargs) - set(props))
+    if unknown:
+        raise ToolArgumentError(f"{name}: unknown argument(s) {unknown}; expected some of {sorted(props)}")
+    missing = [r for r in required_args(name) if kwargs.get(r) is None]
+    if missing:
+        raise ToolArgumentError(f"{name}: missing required argument(s) {missing}")
+    for pname, value in kwargs.items():
+        prop = props[pname]
+        if not any(_matches(value, v) for v in _variants(prop)):
+            raise ToolArgumentError(f"{name}: argument '{pname}' must be {_type_label(prop)}, got {type(value).__name__}")
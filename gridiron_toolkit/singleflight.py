@@ -0,0 +1,80 @@
+"""Single-flight coalescing for concurrent identical remote calls.
+
+When several chats ask for the same thing at the same moment (the same hot
+player on a Sunday morning), only the first caller goes to the MCP server;
+everyone else arriving while that call is in flight awaits the same result.
+Keys are built by the caller, normally tool name + canonical arguments.
+
+The shared call runs in its own task and waiters await it through
+`asyncio.shield`, so one impatient caller being cancelled does not cancel the
+request the others are waiting on. When the last waiter goes away (client
+disconnected, deadline hit) the shared task is cancelled too, so abandoned
+requests stop using server capacity.
+
+Usage:
+  flight = get_singleflight()
+  result = await flight.do(key, lambda: remote_call(...))
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class SingleFlight:
+    """Deduplicates concurrent calls that share a key."""
+
+    def __init__(self) -> None:
+        self._inflight: Dict[Hashable, "asyncio.Task[Any]"] = {}
+        self._waiters: Dict[Hashable, int] = {}
+        # how many callers were served by someone else's request
+        self.calls = 0
+        self.shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        self.calls += 1
+        task = self._inflight.get(key)
+        # tasks are bound to their loop; never join one from another loop
+        if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            self.shared += 1
+        else:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            self._waiters[key] = 0
+            task.add_done_callback(lambda t, k=key: self._forget(k, t))
+        return await self._wait(key, task)
+
+    async def _wait(self, key: Hashable, task: "asyncio.Task[Any]") -> Any:
+        self._waiters[key] = self._waiters.get(key, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if self._inflight.get(key) is task:
+                self._waiters[key] -= 1
+                if self._waiters[key] <= 0 and not task.done():
+                    # nobody is left to read the answer
+                    task.cancel()
+            raise
+
+    def _forget(self, key: Hashable, task: "asyncio.Task[Any]") -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+            self._waiters.pop(key, None)
+        # consume the outcome so an abandoned failing call doesn't log "never retrieved"
+        if not task.cancelled():
+            task.exception()
+
+    def inflight(self) -> int:
+        return len(self._inflight)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"calls": self.calls, "shared": self.shared, "inflight": len(self._inflight)}
+
+
+_FLIGHT: Optional[SingleFlight] = None
+
+
+def get_singleflight() -> SingleFlight:
+    """Return the process-wide SingleFlight shared by every GridironTools instance."""
+    global _FLIGHT
+    if _FLIGHT is None:
+        _FLIGHT = SingleFlight()
+    return _FLIGHT
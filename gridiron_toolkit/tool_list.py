@@ -1,3 +1,10 @@
+"""Tool catalog as reported by the MCP server's `list_tools` (inputSchema/outputSchema per tool).
+
+Kept as a JSON dump, so bind the JSON literals it uses; gridiron_toolkit.schemas
+indexes it lazily.
+"""
+true, false, null = True, False, None
+
 tools = [
     {
         "name": "get_player_info_tool",
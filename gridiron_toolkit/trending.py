@@ -0,0 +1,184 @@
+"""Background poller and shared snapshot for Sleeper trending players.
+
+`get_sleeper_trending_players` is the same global feed for every user, yet
+each fantasy session asking "who's hot on waivers?" made its own remote
+call. A TrendingPoller started from the app lifespan refreshes the common
+(add_drop, hours, limit) variants every GRIDIRON_TRENDING_POLL_SECONDS and
+stores them, with their fetch time, in the process-wide TrendingSnapshot.
+GridironTools answers the tool from that snapshot. A request for fewer
+players than a polled variant gets a prefix of it, since the feed is
+ordered by count. The upstream call rate is then set by the schedule, not
+by user traffic. Variants nobody polls, or snapshots older than
+`max_stale`, fall through to the normal remote path.
+
+Usage:
+  install_trending_poller(app, server_url)          # FastAPI startup/shutdown hooks
+  hit, result = get_trending_snapshot().get({"add_drop": "add", "hours": 24, "limit": 10})
+"""
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from gridiron_toolkit.results import extract_rows, replace_rows
+from gridiron_toolkit.schemas import input_properties
+
+logger = logging.getLogger(__name__)
+
+TRENDING_TOOL = "get_sleeper_trending_players"
+DEFAULT_POLL_INTERVAL = float(os.getenv("GRIDIRON_TRENDING_POLL_SECONDS", "300"))
+
+# (add_drop, hours, limit) combinations agents actually ask for
+DEFAULT_VARIANTS: Tuple[Tuple[str, int, int], ...] = (
+    ("add", 24, 50),
+    ("drop", 24, 50),
+    ("add", 48, 50),
+    ("drop", 48, 50),
+    ("add", 168, 50),
+)
+
+
+def _defaults() -> Dict[str, Any]:
+    return {k: p.get("default") for k, p in input_properties(TRENDING_TOOL).items() if "default" in p}
+
+
+def trending_args(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """`kwargs` with the tool's schema defaults filled in (sport, add_drop, hours, limit)."""
+    out = _defaults()
+    out.update({k: v for k, v in kwargs.items() if v is not None})
+    return out
+
+
+class TrendingSnapshot:
+    """Latest result per (sport, add_drop, hours), with the limit it was fetched at."""
+
+    def __init__(self, max_stale: float = 3 * DEFAULT_POLL_INTERVAL):
+        self.max_stale = max_stale
+        # (sport, add_drop, hours) -> (fetched_at, limit, result)
+        self._entries: Dict[Tuple[str, str, int], Tuple[float, int, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(args: Dict[str, Any]) -> Tuple[str, str, int]:
+        return (str(args.get("sport") or "nfl"), str(args.get("add_drop") or "add"), int(args.get("hours") or 24))
+
+    def put(self, kwargs: Dict[str, Any], result: Any, fetched_at: Optional[float] = None) -> None:
+        args = trending_args(kwargs)
+        self._entries[self._key(args)] = (time.time() if fetched_at is None else fetched_at, int(args.get("limit") or 0), result)
+
+    def get(self, kwargs: Dict[str, Any]) -> Tuple[bool, Any]:
+        """(hit, result) for a request the snapshot can answer fresh enough."""
+        args = trending_args(kwargs)
+        entry = self._entries.get(self._key(args))
+        limit = int(args.get("limit") or 0)
+        if entry is None or time.time() - entry[0] > self.max_stale or limit > entry[1]:
+            self.misses += 1
+            return False, None
+        result = entry[2]
+        if limit < entry[1]:
+            rows = extract_rows(result)
+            if rows is None:
+                self.misses += 1
+                return False, None
+            result = replace_rows(result, rows[:limit])
+        self.hits += 1
+        return True, result
+
+    def age(self, kwargs: Dict[str, Any]) -> Optional[float]:
+        entry = self._entries.get(self._key(trending_args(kwargs)))
+        return None if entry is None else time.time() - entry[0]
+
+    def stats(self) -> Dict[str, Any]:
+        return {"variants": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+class TrendingPoller:
+    """Refreshes TRENDING_TOOL variants into a snapshot on a fixed schedule."""
+
+    def __init__(
+        self,
+        toolkit: Any,
+        snapshot: Optional[TrendingSnapshot] = None,
+        variants: Sequence[Tuple[str, int, int]] = DEFAULT_VARIANTS,
+        interval: float = DEFAULT_POLL_INTERVAL,
+    ):
+        # the toolkit must read the server, not this snapshot (use_trending_snapshot=False)
+        self.toolkit = toolkit
+        self.snapshot = snapshot or get_trending_snapshot()
+        self.variants = tuple(variants)
+        self.interval = interval
+        self._task: Optional["asyncio.Task[None]"] = None
+        self.polls = 0
+        self.errors = 0
+
+    async def poll_once(self) -> int:
+        """Fetch every variant concurrently; returns how many were refreshed."""
+
+        async def one(add_drop: str, hours: int, limit: int) -> bool:
+            kwargs = {"add_drop": add_drop, "hours": hours, "limit": limit}
+            try:
+                result = await self.toolkit.call(TRENDING_TOOL, **kwargs)
+            except Exception as e:
+                self.errors += 1
+                logger.warning("trending poll %s failed: %s: %s", kwargs, type(e).__name__, e)
+                return False
+            self.snapshot.put(kwargs, result)
+            return True
+
+        done = await asyncio.gather(*(one(*v) for v in self.variants))
+        self.polls += 1
+        return sum(done)
+
+    async def _run(self) -> None:
+        while True:
+            await self.poll_once()
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+
+_SNAPSHOT: Optional[TrendingSnapshot] = None
+
+
+def get_trending_snapshot() -> TrendingSnapshot:
+    """Return the process-wide trending snapshot shared by every GridironTools instance."""
+    global _SNAPSHOT
+    if _SNAPSHOT is None:
+        _SNAPSHOT = TrendingSnapshot()
+    return _SNAPSHOT
+
+
+def install_trending_poller(
+    app: Any,
+    url: str,
+    variants: Sequence[Tuple[str, int, int]] = DEFAULT_VARIANTS,
+    interval: float = DEFAULT_POLL_INTERVAL,
+) -> TrendingPoller:
+    """Poll trending players from `app` startup until shutdown."""
+    from gridiron_toolkit.info import GridironTools
+
+    toolkit = GridironTools(url=url, include_tools=[TRENDING_TOOL], use_cache=False, use_trending_snapshot=False)
+    poller = TrendingPoller(toolkit, variants=variants, interval=interval)
+
+    @app.on_event("startup")
+    async def _gridiron_trending_start():
+        poller.start()
+
+    @app.on_event("shutdown")
+    async def _gridiron_trending_stop():
+        await poller.stop()
+
+    return poller
@@ -0,0 +1,168 @@
+"""Eager MCP warm-up for application startup.
+
+`GridironTools.connect()` otherwise runs lazily inside the first chat turn of
+each agent, so the first user pays the MCP handshake and `initialize()`.
+`warm_up(team)` finds every GridironTools on a team (members, nested teams and
+team.tools), connects them concurrently, builds their dispatch tables (which
+pre-lists the remote tools) and optionally prefetches the metadata tools into
+the result cache.
+
+Progress is kept in a WarmupState so an app can report readiness. For a
+FastAPI app, `install_warmup(app, team)` wires both the startup hook and a
+`/health/ready` endpoint (503 until the warm-up has finished).
+"""
+import asyncio
+import os
+import time
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from gridiron_toolkit.info import GridironTools
+
+
+DEFAULT_WARMUP_TIMEOUT = float(os.getenv("GRIDIRON_WARMUP_TIMEOUT_SECONDS", "30"))
+
+# metadata calls worth having in the cache before the first analytics question
+DEFAULT_PREFETCH: Tuple[Tuple[str, Dict[str, Any]], ...] = (
+    ("get_metrics_metadata", {}),
+    ("get_metrics_metadata", {"category": "receiving"}),
+    ("get_metrics_metadata", {"category": "passing"}),
+    ("get_metrics_metadata", {"category": "rushing"}),
+    ("get_metrics_metadata", {"category": "defense"}),
+    ("get_stats_metadata", {"category": "offense"}),
+    ("get_stats_metadata", {"category": "defense"}),
+    ("get_fantasy_rank_page_types", {}),
+)
+
+
+class WarmupState:
+    """Readiness of the MCP warm-up, suitable for a health endpoint."""
+
+    def __init__(self) -> None:
+        self.status = "pending"  # pending -> warming -> ready | degraded
+        self.started_at: Optional[float] = None
+        self.duration: Optional[float] = None
+        self.toolkits = 0
+        self.connected = 0
+        self.prefetched = 0
+        self.errors: List[str] = []
+
+    @property
+    def ready(self) -> bool:
+        return self.status in ("ready", "degraded")
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "ready": self.ready,
+            "toolkits": self.toolkits,
+            "connected": self.connected,
+            "prefetched": self.prefetched,
+            "duration_seconds": self.duration,
+            "errors": list(self.errors),
+        }
+
+
+def iter_toolkits(team: Any) -> Iterator[GridironTools]:
+    """Yield each GridironTools reachable from a team or agent, once."""
+    seen = set()
+    stack = [team]
+    while stack:
+        node = stack.pop()
+        for t in getattr(node, "tools", None) or []:
+            if isinstance(t, GridironTools) and id(t) not in seen:
+                seen.add(id(t))
+                yield t
+        stack.extend(getattr(node, "members", None) or [])
+
+
+def _record(state: WarmupState, what: str, e: BaseException) -> None:
+    state.errors.append(f"{what}: {type(e).__name__}: {e}")
+
+
+async def _warm_pool(pool: Any, state: WarmupState) -> None:
+    # a slot that fails here is a connect failure like any other, not a silent short count
+    try:
+        errors = await pool.warm()
+    except Exception as e:
+        errors = [e]
+    for e in errors:
+        _record(state, f"connect {pool.url}", e)
+
+
+async def _connect(toolkit: GridironTools, state: WarmupState) -> None:
+    try:
+        await toolkit.connect()
+        state.connected += 1
+    except Exception as e:
+        _record(state, f"connect {toolkit._url}", e)
+
+
+async def _prefetch(toolkit: GridironTools, tool_name: str, kwargs: Dict[str, Any], state: WarmupState) -> None:
+    try:
+        await toolkit.call(tool_name, **kwargs)
+        state.prefetched += 1
+    except Exception as e:
+        _record(state, tool_name, e)
+
+
+async def warm_up(
+    team: Any,
+    state: Optional[WarmupState] = None,
+    prefetch: Optional[Sequence[Tuple[str, Dict[str, Any]]]] = DEFAULT_PREFETCH,
+) -> WarmupState:
+    """Connect every toolkit on `team` concurrently, then prefetch metadata.
+
+    Pass prefetch=None (or ()) to only connect. Failures are recorded on the
+    state (status "degraded") instead of raised, so startup never aborts.
+    """
+    state = state or WarmupState()
+    state.status = "warming"
+    state.started_at = time.monotonic()
+
+    toolkits = list(iter_toolkits(team))
+    state.toolkits = len(toolkits)
+    # open every pooled session up front, not just the slots the toolkits happen to pick
+    pools = {id(t._pool): t._pool for t in toolkits if t._pool is not None}
+    await asyncio.gather(*(_warm_pool(p, state) for p in pools.values()))
+    await asyncio.gather(*(_connect(t, state) for t in toolkits))
+
+    if prefetch:
+        # the cache is shared, so one toolkit that exposes a tool fetches it for all of them
+        jobs = []
+        for name, kw in prefetch:
+            fetcher = next((t for t in toolkits if t.wrapper_for(name) is not None), None)
+            if fetcher is not None:
+                jobs.append(_prefetch(fetcher, name, dict(kw), state))
+        await asyncio.gather(*jobs)
+
+    state.duration = time.monotonic() - state.started_at
+    state.status = "degraded" if state.errors else "ready"
+    return state
+
+
+def install_warmup(
+    app: Any,
+    team: Any,
+    path: str = "/health/ready",
+    prefetch: Optional[Sequence[Tuple[str, Dict[str, Any]]]] = DEFAULT_PREFETCH,
+    timeout: float = DEFAULT_WARMUP_TIMEOUT,
+) -> WarmupState:
+    """Warm `team` on `app` startup and expose readiness at `path`."""
+    from fastapi.responses import JSONResponse
+
+    state = WarmupState()
+
+    @app.on_event("startup")
+    async def _gridiron_warmup():
+        # uvicorn holds traffic until startup hooks finish, so the first chat sees warm sessions
+        try:
+            await asyncio.wait_for(warm_up(team, state=state, prefetch=prefetch), timeout=timeout)
+        except asyncio.TimeoutError:
+            state.errors.append(f"warm-up timed out after {timeout:.0f}s")
+            state.status = "degraded"
+
+    @app.get(path)
+    async def _gridiron_ready():
+        return JSONResponse(state.as_dict(), status_code=200 if state.ready else 503)
+
+    return state
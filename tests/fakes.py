@@ -0,0 +1,165 @@
+"""Shared test doubles: a fake MCP server behind the real session pool, and fake tools and teams.
+
+Tests import this as `from fakes import ...`; the tests directory is on sys.path both when a
+script is run directly and under pytest.
+"""
+import asyncio
+import inspect
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from gridiron_toolkit.info import GridironTools
+from gridiron_toolkit.pool import MCPSessionPool
+from gridiron_toolkit.results import extract_rows
+
+# every optional layer of GridironTools, switched off
+BARE = dict(
+    use_cache=False,
+    coalesce=False,
+    batch_lookups=False,
+    validate=False,
+    resolve_names=False,
+    use_identity_map=False,
+    use_league_snapshots=False,
+    use_trending_snapshot=False,
+    use_local_store=False,
+)
+
+
+class FakeFunction:
+    """One remote tool. `handler(client, name, **kwargs)` answers it; an async handler gives an async entrypoint."""
+
+    def __init__(self, client, name, handler):
+        self.name = name
+        if inspect.iscoroutinefunction(handler):
+            async def entrypoint(**kw):
+                client.calls.append((name, kw))
+                client.running += 1
+                client.peak = max(client.peak, client.running)
+                try:
+                    return await handler(client, name, **kw)
+                finally:
+                    client.running -= 1
+        else:
+            def entrypoint(**kw):
+                client.calls.append((name, kw))
+                return handler(client, name, **kw)
+
+        self.entrypoint = entrypoint
+
+
+class FakeClient:
+    """Stands in for a connected MCPTools: one FakeFunction per entry of `handlers`, every call recorded."""
+
+    serials = 0
+
+    def __init__(self, handlers, connect_delay=0.0, fail=False):
+        FakeClient.serials += 1
+        self.serial = FakeClient.serials
+        self.functions = {name: FakeFunction(self, name, h) for name, h in handlers.items()}
+        self.tools = {}
+        self.calls = []
+        self.running = 0
+        self.peak = 0
+        self.connect_delay = connect_delay
+        self.fail = fail
+        self.closed = False
+
+    async def connect(self):
+        if self.connect_delay:
+            await asyncio.sleep(self.connect_delay)
+        if self.fail:
+            raise ConnectionError("refused")
+
+    async def close(self):
+        self.closed = True
+
+    def asked(self, arg=None):
+        """The tools called so far, in order, or the value each call passed for `arg`."""
+        return [kw.get(arg) if arg else name for name, kw in self.calls]
+
+
+class FakePool(MCPSessionPool):
+    """A real MCPSessionPool whose sessions are FakeClients; the first `fail_connects` of them refuse to connect."""
+
+    def __init__(self, url, handlers, client_class=FakeClient, connect_delay=0.0, fail_connects=0, **kwargs):
+        kwargs.setdefault("size", 1)
+        super().__init__(url, **kwargs)
+        self.handlers = handlers
+        self.client_class = client_class
+        self.connect_delay = connect_delay
+        self.fail_connects = fail_connects
+
+    def _new_client(self):
+        fail = self.fail_connects > 0
+        self.fail_connects -= 1
+        return self.client_class(self.handlers, connect_delay=self.connect_delay, fail=fail)
+
+
+def bare_toolkit(pool, include_tools, **enable):
+    """A GridironTools over `pool` with every optional layer off; keyword arguments turn the one under test back on."""
+    return GridironTools(url=pool.url, pool=pool, include_tools=list(include_tools), **{**BARE, **enable})
+
+
+class FakeTools:
+    """Stands in for GridironTools in code that only calls tools.
+
+    `handlers` maps a tool name to rows to return, or to a function of the call's
+    keyword arguments (which may raise); other tools come back empty.
+    """
+
+    def __init__(self, handlers=None):
+        self.handlers = handlers or {}
+        self.calls = []
+
+    async def call(self, tool_name, **kwargs):
+        self.calls.append((tool_name, kwargs))
+        handler = self.handlers.get(tool_name, [])
+        return handler(**kwargs) if callable(handler) else {"result": handler}
+
+    async def fetch_rows(self, tool_name, **kwargs):
+        return extract_rows(await self.call(tool_name, **kwargs)) or []
+
+    def called(self):
+        return [name for name, _ in self.calls]
+
+
+class FakeMemory:
+    def __init__(self):
+        self.runs = {}
+
+    def add_run(self, session_id, run):
+        self.runs.setdefault(session_id, []).append(run)
+
+
+class FakeTeam:
+    """The parts of an agno Team the installers touch. `reply(message)`, sync or async, makes each answer."""
+
+    def __init__(self, reply=None, storage=None):
+        self.reply = reply
+        self.asked = []
+        self.written = []
+        self.storage = storage
+        self.memory = FakeMemory()
+        self.team_id = "team"
+        self.session_id = None
+
+    async def arun(self, message, stream=None, **kwargs):
+        self.asked.append(message)
+        if self.reply is None:
+            return "from the team"
+        answer = self.reply(message)
+        return await answer if inspect.isawaitable(answer) else answer
+
+    def initialize_team(self, session_id=None):
+        pass
+
+    def read_from_storage(self, session_id):
+        return None
+
+    def write_to_storage(self, session_id, user_id=None):
+        self.written.append((session_id, user_id))
@@ -0,0 +1,149 @@
+import asyncio
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from fakes import FakeTeam
+from gridiron_toolkit.answers import (
+    AnswerCache,
+    _TOOLS_USED,
+    _reported_errors,
+    install_answer_cache,
+    normalize_question,
+    note_tool,
+    note_tool_error,
+)
+
+TTLS = {"get_advanced_receiving_stats": 3600.0, "get_sleeper_league_rosters": 300.0,
+        "get_sleeper_league_transactions": 0.0}
+
+
+def _cache(**kw):
+    return AnswerCache(ttl_for=lambda t: TTLS.get(t, 0.0), **kw)
+
+
+def test_normalize():
+    assert normalize_question("Compare Jefferson versus Chase, 2023–2024 receiving!") == \
+        "compare jefferson vs chase 2023-2024 receiving"
+
+
+def test_exact_and_semantic_hits_respect_numbers():
+    cache = _cache()
+    assert cache.store("compare Jefferson and Chase 2023-2024 receiving", "answer", ["get_advanced_receiving_stats"])
+    assert cache.lookup("Compare Jefferson and Chase 2023–2024 receiving?").content == "answer"
+    assert cache.lookup("can you compare Jefferson and Chase 2023-2024 receiving please").content == "answer"
+    assert cache.semantic_hits == 1
+    assert cache.lookup("compare Jefferson and Chase 2022-2024 receiving") is None
+    assert cache.lookup("compare Kelce and Andrews 2023-2024 receiving") is None
+
+
+def test_one_name_or_domain_swap_in_a_long_question_misses():
+    cache = _cache()
+    question = ("Justin Jefferson 2023 receiving yards, targets, receptions, touchdowns, yards after catch, "
+                "air yards share and target share")
+    assert cache.store(question, "jefferson", ["get_advanced_receiving_stats"])
+    assert cache.lookup(question.replace("Justin Jefferson", "Jaylen Waddle")) is None
+    assert cache.lookup(question.replace("Jefferson", "Jackson")) is None
+    assert cache.lookup(question.replace("receiving", "rushing")) is None
+    assert cache.lookup(question.replace("2023", "2023 per game")) is None
+    # rewording the stats part alone still matches
+    assert cache.lookup(question.replace("target share", "share of targets")).content == "jefferson"
+
+
+def test_freshness_follows_tool_ttls():
+    cache = _cache()
+    cache.store("rosters in league 123", "r", ["get_sleeper_league_rosters", "get_advanced_receiving_stats"])
+    entry = cache.lookup("rosters in league 123")
+    assert 299 < entry.expires_at - entry.created_at <= 300
+    assert not cache.store("latest trades in league 123", "t", ["get_sleeper_league_transactions"])
+    entry.expires_at = time.time() - 1
+    assert cache.lookup("rosters in league 123") is None
+
+
+def test_personal_and_contextual_questions():
+    cache = _cache()
+    rosters = ["get_sleeper_league_rosters"]
+    assert cache.store("who is on my roster", "mine", rosters, user_id="u1")
+    assert cache.lookup("who is on my roster", user_id="u2") is None
+    assert cache.lookup("who is on my roster", user_id="u1").content == "mine"
+    assert not cache.store("who is on my roster", "anon", rosters)
+    assert not cache.store("what about his 2022 stats", "x", rosters)
+    # "show me" is not about the asker
+    assert cache.store("show me Josh Allen 2024 stats", "allen", rosters)
+    assert cache.lookup("show me Josh Allen 2024 stats", user_id="u2").content == "allen"
+
+
+def test_no_tools_or_failed_tools_are_not_stored():
+    cache = _cache()
+    stats = ["get_advanced_receiving_stats"]
+    assert not cache.store("who won the 2020 super bowl", "Tampa Bay", [])
+    assert not cache.store("Jefferson 2023 receiving", "x", stats, errors=["get_advanced_receiving_stats"])
+    assert cache.stats()["skipped"] == 2 and len(cache) == 0
+
+
+class Response:
+    def __init__(self, content):
+        self.content = content
+
+
+def _team(fail=False):
+    team = FakeTeam(storage=object())
+
+    async def reply(message):
+        async def member():
+            note_tool("get_advanced_receiving_stats")  # inherited context, like a member tool call
+            if fail:
+                note_tool_error("get_advanced_receiving_stats")
+
+        await asyncio.create_task(member())
+        return Response(f"answer {len(team.asked)}")
+
+    team.reply = reply
+    return team
+
+
+def test_install_tracks_tools_and_serves_repeats():
+    team = _team()
+    cache = install_answer_cache(team, cache=_cache())
+    first = asyncio.run(team.arun("compare Jefferson and Chase 2023 receiving", stream=False))
+    assert first.content == "answer 1" and _TOOLS_USED.get() is None
+    entry = cache.lookup("compare Jefferson and Chase 2023 receiving")
+    assert entry.tools == frozenset({"get_advanced_receiving_stats"})
+    assert len(team.asked) == 1
+    # a repeat is answered from the cache and still lands in the session history
+    again = asyncio.run(team.arun("compare Jefferson and Chase 2023 receiving", stream=False, session_id="s1"))
+    assert again.model == "answer-cache" and len(team.asked) == 1
+    assert [m.content for m in team.memory.runs["s1"][0].messages] == [
+        "compare Jefferson and Chase 2023 receiving", "answer 1"]
+
+
+def test_failed_runs_are_not_cached():
+    team = _team(fail=True)
+    cache = install_answer_cache(team, cache=_cache())
+    asyncio.run(team.arun("compare Jefferson and Chase 2023 receiving", stream=False))
+    assert len(cache) == 0
+
+    # a member tool error agno recorded on the run counts too
+    from agno.models.response import ToolExecution
+
+    member = Response("m")
+    member.tools = [ToolExecution(tool_name="crawl", tool_call_error=True)]
+    run = Response("x")
+    run.member_responses = [member]
+    assert _reported_errors(run) == {"crawl"}
+
+
+if __name__ == "__main__":
+    test_normalize()
+    test_exact_and_semantic_hits_respect_numbers()
+    test_one_name_or_domain_swap_in_a_long_question_misses()
+    test_freshness_follows_tool_ttls()
+    test_personal_and_contextual_questions()
+    test_no_tools_or_failed_tools_are_not_stored()
+    test_install_tracks_tools_and_serves_repeats()
+    test_failed_runs_are_not_cached()
+    print("Done.")
@@ -0,0 +1,105 @@
+import asyncio
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from gridiron_toolkit.batching import MicroBatcher, batch_values
+from gridiron_toolkit.deadline import DeadlineExceeded, remaining, request_budget
+from gridiron_toolkit.results import extract_rows
+
+PLAYERS = [
+    {"player_name": "Josh Allen", "sleeper_id": "4984"},
+    {"player_name": "Ja'Marr Chase", "sleeper_id": "7564"},
+    {"player_name": "Puka Nacua", "sleeper_id": "9493"},
+]
+
+
+def test_batch_values():
+    assert batch_values("get_player_info_tool", (), {"player_names": "Josh Allen"}) == ["Josh Allen"]
+    assert batch_values("get_player_info_tool", (), {"player_names": ["a"], "extra": 1}) is None
+    assert batch_values("get_metrics_metadata", (), {"category": "receiving"}) is None
+
+
+def test_concurrent_lookups_merge_into_one_call():
+    sent = []
+
+    async def send(ids):
+        sent.append(list(ids))
+        return json.dumps({"result": [p for p in PLAYERS if p["sleeper_id"] in ids]})
+
+    batcher = MicroBatcher("get_players_by_sleeper_id_tool", send, window=0.01)
+
+    async def main():
+        return await asyncio.gather(
+            batcher.submit(["4984"]),
+            batcher.submit(["7564", "4984"]),
+            batcher.submit(["9493"]),
+        )
+
+    a, b, c = asyncio.run(main())
+    assert sent == [["4984", "7564", "9493"]]
+    assert [r["sleeper_id"] for r in extract_rows(a)] == ["4984"]
+    assert sorted(r["sleeper_id"] for r in extract_rows(b)) == ["4984", "7564"]
+    assert [r["player_name"] for r in extract_rows(c)] == ["Puka Nacua"]
+
+
+def test_name_lookup_uses_partial_match():
+    async def send(names):
+        return {"result": PLAYERS}
+
+    batcher = MicroBatcher("get_player_info_tool", send, window=0.01)
+
+    async def main():
+        return await asyncio.gather(batcher.submit(["puka"]), batcher.submit(["Allen"]))
+
+    puka, allen = asyncio.run(main())
+    assert [r["player_name"] for r in puka["result"]] == ["Puka Nacua"]
+    assert [r["player_name"] for r in allen["result"]] == ["Josh Allen"]
+
+
+def test_lone_lookup_skips_the_window_and_send_ignores_caller_context():
+    seen = []
+
+    async def send(ids):
+        seen.append(remaining())
+        await asyncio.sleep(0.1)
+        return {"result": [p for p in PLAYERS if p["sleeper_id"] in ids]}
+
+    batcher = MicroBatcher("get_players_by_sleeper_id_tool", send, window=5.0)
+
+    async def main():
+        started = time.monotonic()
+        with request_budget(60):
+            alone = await batcher.submit(["4984"])
+        assert time.monotonic() - started < 1.0
+        # while a batch is in flight, a caller whose budget runs out gives up on its own
+        first = asyncio.ensure_future(batcher.submit(["7564"]))
+        await asyncio.sleep(0)
+        with request_budget(0.05):
+            try:
+                await batcher.submit(["9493"])
+            except DeadlineExceeded:
+                pass
+            else:
+                raise AssertionError("expected DeadlineExceeded")
+        return alone, await first
+
+    alone, first = asyncio.run(main())
+    assert [r["sleeper_id"] for r in alone["result"]] == ["4984"]
+    assert [r["sleeper_id"] for r in first["result"]] == ["7564"]
+    # the merged call never runs under a caller's request budget
+    assert seen[:2] == [None, None]
+
+
+if __name__ == "__main__":
+    print("Running batching tests...")
+    test_batch_values()
+    test_concurrent_lookups_merge_into_one_call()
+    test_name_lookup_uses_partial_match()
+    test_lone_lookup_skips_the_window_and_send_ignores_caller_context()
+    print("Done.")
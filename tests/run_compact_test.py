@@ -0,0 +1,44 @@
+import json
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from gridiron_toolkit.compact import compact_result
+
+ROWS = [
+    {"player_name": "Ja'Marr Chase", "season": 2023, "targets": 145, "adot": 9.4567, "drop": None},
+    {"player_name": "Justin Jefferson", "season": 2023, "targets": 100, "adot": 11.0, "drop": None},
+]
+
+
+def test_csv_header_once_rounded_and_null_columns_dropped():
+    out = compact_result({"result": ROWS, "note": "capped"})
+    print(out)
+    lines = out.strip().split("\n")
+    assert lines[0] == "rows: 2"
+    assert lines[1] == "player_name,season,targets,adot"
+    assert lines[2] == "Ja'Marr Chase,2023,145,9.46"
+    assert lines[3] == "Justin Jefferson,2023,100,11"
+    assert lines[-1] == 'meta: {"note":"capped"}'
+
+
+def test_columns_format_from_json_string():
+    out = json.loads(compact_result(json.dumps({"result": ROWS}), fmt="columns"))
+    assert out["columns"] == ["player_name", "season", "targets", "adot"]
+    assert out["rows"][0] == ["Ja'Marr Chase", 2023, 145, 9.46]
+
+
+def test_non_row_results_pass_through():
+    payload = {"receiving": {"volume_metrics": ["targets"]}}
+    assert compact_result(payload) is payload
+
+
+if __name__ == "__main__":
+    print("Running compact tests...")
+    test_csv_header_once_rounded_and_null_columns_dropped()
+    test_columns_format_from_json_string()
+    test_non_row_results_pass_through()
+    print("Done.")
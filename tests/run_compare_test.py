@@ -0,0 +1,104 @@
+import asyncio
+import json
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from gridiron_toolkit.compare import available, compare_rows
+
+ROWS = [
+    {"player_name": "Ja'Marr Chase", "season": 2024, "games": 17, "targets": 175, "catch_percentage": 72.6},
+    {"player_name": "Justin Jefferson", "season": 2024, "games": 17, "targets": 154, "catch_percentage": 66.9},
+    {"player_name": "Puka Nacua", "season": 2024, "games": 11, "targets": 106, "catch_percentage": 74.5},
+]
+
+
+def test_per_game_leaders_and_deltas():
+    if not available():
+        print("numpy/pandas not installed; skipping")
+        return
+    table, leaders = compare_rows(ROWS, ["targets", "catch_percentage"], per_game_metrics=["targets"])
+    by = {(r["player"], r["metric"]): r for r in table}
+    assert round(by[("Puka Nacua", "targets")]["value"], 2) == round(106 / 11, 2)
+    assert leaders["targets"]["player"] == "Ja'Marr Chase"
+    assert leaders["catch_percentage"]["player"] == "Puka Nacua"
+    assert by[("Ja'Marr Chase", "targets")]["delta"] == 0.0
+    assert by[("Puka Nacua", "catch_percentage")]["rank"] == 1
+    assert by[("Justin Jefferson", "catch_percentage")]["pct"] < 50 < by[("Puka Nacua", "catch_percentage")]["pct"]
+
+
+def test_weekly_rows_average_per_player_and_pool_percentiles():
+    if not available():
+        return
+    weekly = [
+        {"player_name": "A", "season": 2024, "week": 1, "avg_separation": 3.0},
+        {"player_name": "A", "season": 2024, "week": 2, "avg_separation": 4.0},
+        {"player_name": "B", "season": 2024, "week": 1, "avg_separation": 2.0},
+    ]
+    pool = [{"player_name": f"P{i}", "season": 2024, "avg_separation": float(i)} for i in range(1, 5)]
+    table, leaders = compare_rows(weekly, ["avg_separation"], pool_rows=pool, baseline="B")
+    by = {r["player"]: r for r in table}
+    assert by["A"]["value"] == 3.5 and by["A"]["games"] == 2
+    assert by["A"]["delta"] == 1.5 and by["B"]["delta"] == 0.0
+    assert by["A"]["pct"] == 75.0
+    assert leaders["avg_separation"] == {"player": "A", "value": 3.5}
+
+
+def test_unknown_baseline_is_an_error():
+    if not available():
+        return
+    table, _ = compare_rows(ROWS, ["targets"], baseline="puka nacua")
+    assert next(r for r in table if r["player"] == "Puka Nacua")["delta"] == 0.0
+    try:
+        compare_rows(ROWS, ["targets"], baseline="Tee Higgins")
+    except ValueError as e:
+        assert "Tee Higgins" in str(e)
+    else:
+        raise AssertionError("expected ValueError")
+
+
+class _Stats:
+    """fetch_rows stand-in: player queries answer with ROWS, league pool queries fail."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def fetch_rows(self, tool_name, /, **kwargs):
+        self.calls.append(kwargs)
+        if "player_names" not in kwargs:
+            raise ConnectionError("pool fetch failed")
+        return ROWS
+
+
+def test_compare_players_survives_pool_failure():
+    if not available():
+        return
+    from gridiron_toolkit.compare_tools import ComparisonTools
+
+    stats = _Stats()
+    tools = ComparisonTools("http://fake/mcp/", stats=stats)
+    out = asyncio.run(tools.compare_players("get_advanced_receiving_stats", ["Chase", "Nacua"], ["targets"],
+                                            season_list=[2024]))
+    assert len(stats.calls) == 2
+    assert "ConnectionError: pool fetch failed" in out and "compared players" in out
+    assert "Puka Nacua" in out
+
+    # no seasons: no league pool is fetched at all
+    stats.calls.clear()
+    asyncio.run(tools.compare_players("get_advanced_receiving_stats", ["Chase"], ["targets"]))
+    assert len(stats.calls) == 1
+
+    out = asyncio.run(tools.compare_players("get_advanced_receiving_stats", ["Chase"], ["targets"],
+                                            baseline="Tee Higgins"))
+    assert json.loads(out)["error"].startswith("baseline 'Tee Higgins'")
+
+
+if __name__ == "__main__":
+    test_per_game_leaders_and_deltas()
+    test_weekly_rows_average_per_player_and_pool_percentiles()
+    test_unknown_baseline_is_an_error()
+    test_compare_players_survives_pool_failure()
+    print("Done.")
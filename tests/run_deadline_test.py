@@ -0,0 +1,177 @@
+import asyncio
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from gridiron_toolkit.deadline import (
+    DeadlineExceeded,
+    RequestBudgetMiddleware,
+    remaining,
+    request_budget,
+    with_deadline,
+)
+from gridiron_toolkit.singleflight import SingleFlight
+
+
+def test_no_budget_outside_a_request():
+    assert remaining() is None
+
+
+def test_nested_budget_only_shortens():
+    with request_budget(10):
+        outer = remaining()
+        with request_budget(60):
+            assert remaining() <= outer
+        with request_budget(1):
+            assert remaining() <= 1
+    assert remaining() is None
+
+
+def test_tool_timeout_applies_per_call():
+    async def slow():
+        await asyncio.sleep(1)
+
+    try:
+        asyncio.run(with_deadline("get_player_info_tool", slow(), timeout=0.01))
+    except DeadlineExceeded:
+        raise AssertionError("a tool timeout is not a spent budget")
+    except asyncio.TimeoutError:
+        pass
+    else:
+        raise AssertionError("expected a timeout")
+
+
+def test_budget_shorter_than_tool_timeout_raises_deadline_exceeded():
+    async def run():
+        with request_budget(0.02):
+            await with_deadline("get_player_info_tool", asyncio.sleep(1), timeout=5)
+
+    start = time.monotonic()
+    try:
+        asyncio.run(run())
+    except DeadlineExceeded:
+        pass
+    else:
+        raise AssertionError("expected DeadlineExceeded")
+    assert time.monotonic() - start < 0.5
+
+
+def test_spent_budget_fails_without_awaiting():
+    started = []
+
+    async def call():
+        started.append(1)
+
+    async def run():
+        with request_budget(0):
+            await with_deadline("get_player_info_tool", call())
+
+    try:
+        asyncio.run(run())
+    except DeadlineExceeded:
+        pass
+    assert started == []
+
+
+def test_budget_is_inherited_by_spawned_tasks():
+    async def run():
+        with request_budget(5):
+            return await asyncio.ensure_future(asyncio.sleep(0, result=remaining()))
+
+    left = asyncio.run(run())
+    assert left is not None and 0 < left <= 5
+
+
+def test_singleflight_cancels_shared_call_when_all_waiters_leave():
+    flight = SingleFlight()
+    cancelled = []
+
+    async def remote():
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(1)
+            raise
+
+    async def run():
+        a = asyncio.ensure_future(flight.do("k", remote))
+        b = asyncio.ensure_future(flight.do("k", remote))
+        await asyncio.sleep(0.01)
+        a.cancel()
+        await asyncio.sleep(0.01)
+        assert cancelled == []  # b still wants the answer
+        b.cancel()
+        await asyncio.sleep(0.01)
+        return flight.inflight()
+
+    assert asyncio.run(run()) == 0
+    assert cancelled == [1]
+
+
+def test_middleware_cancels_handler_on_disconnect():
+    seen = {}
+
+    async def app(scope, receive, send):
+        seen["budget"] = remaining()
+        await receive()
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            seen["cancelled"] = True
+            raise
+
+    async def run():
+        messages = asyncio.Queue()
+        messages.put_nowait({"type": "http.request", "body": b"{}", "more_body": False})
+        middleware = RequestBudgetMiddleware(app, seconds=30)
+        task = asyncio.ensure_future(middleware({"type": "http"}, messages.get, None))
+        await asyncio.sleep(0.01)
+        messages.put_nowait({"type": "http.disconnect"})
+        await asyncio.wait_for(task, 1.0)
+
+    asyncio.run(run())
+    assert seen["cancelled"] and 0 < seen["budget"] <= 30
+
+
+def test_middleware_passes_completed_requests_through():
+    sent = []
+
+    async def app(scope, receive, send):
+        body = await receive()
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": body["body"]})
+
+    async def run():
+        reads = []
+
+        async def receive():
+            reads.append(1)
+            if len(reads) == 1:
+                return {"type": "http.request", "body": b"ok", "more_body": False}
+            # nothing more until the client leaves
+            await asyncio.sleep(5)
+
+        async def send(message):
+            sent.append(message)
+
+        await RequestBudgetMiddleware(app)({"type": "http"}, receive, send)
+
+    asyncio.run(run())
+    assert [m["type"] for m in sent] == ["http.response.start", "http.response.body"] and sent[1]["body"] == b"ok"
+
+
+if __name__ == "__main__":
+    test_no_budget_outside_a_request()
+    test_nested_budget_only_shortens()
+    test_tool_timeout_applies_per_call()
+    test_budget_shorter_than_tool_timeout_raises_deadline_exceeded()
+    test_spent_budget_fails_without_awaiting()
+    test_budget_is_inherited_by_spawned_tasks()
+    test_singleflight_cancels_shared_call_when_all_waiters_leave()
+    test_middleware_cancels_handler_on_disconnect()
+    test_middleware_passes_completed_requests_through()
+    print("Done.")
@@ -0,0 +1,42 @@
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from fakes import FakeClient, FakeFunction
+from gridiron_toolkit.dispatch import dispatch_table_for, resolve
+
+
+def _echo(client, name, **kw):
+    return name, kw
+
+
+def _client(names):
+    return FakeClient(dict.fromkeys(names, _echo))
+
+
+def test_table_is_reused_until_tools_change():
+    client = _client(["get_player_info_tool", "get_metrics_metadata"])
+    first = dispatch_table_for(client)
+    assert dispatch_table_for(client) is first
+    assert first["get_metrics_metadata"](category="passing") == ("get_metrics_metadata", {"category": "passing"})
+
+    client.functions = _client(["get_player_info_tool", "get_stats_metadata"]).functions
+    assert dispatch_table_for(client) is not first
+    assert resolve(client, "get_stats_metadata") is not None
+    assert resolve(client, "get_metrics_metadata") is None
+
+
+def test_list_shaped_functions():
+    client = _client([])
+    client.functions = [FakeFunction(client, "get_dictionary_info", _echo)]
+    assert resolve(client, "get_dictionary_info")() == ("get_dictionary_info", {})
+
+
+if __name__ == "__main__":
+    print("Running dispatch tests...")
+    test_table_is_reused_until_tools_change()
+    test_list_shaped_functions()
+    print("Done.")
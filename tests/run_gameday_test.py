@@ -0,0 +1,119 @@
+import asyncio
+import datetime
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from fakes import FakeTools
+from gridiron_toolkit.gameday import EASTERN, PrefetchScheduler, harvest_calls, next_kickoff, plan_prefetch
+
+
+def _session(calls, updated_at=None):
+    # agno stores each call in the assistant message and again in the run's tool executions
+    messages = [{"role": "assistant", "tool_calls": [
+        {"id": f"c{i}", "type": "function", "function": {"name": t, "arguments": json.dumps(a)}}
+        for i, (t, a) in enumerate(calls)
+    ]}]
+    tools = [{"tool_call_id": f"c{i}", "tool_name": t, "tool_args": a} for i, (t, a) in enumerate(calls)]
+    run = {"messages": [], "member_responses": [{"messages": messages, "tools": tools}]}
+    return {"session_id": "s", "updated_at": updated_at or int(time.time()), "memory": {"runs": [run]}}
+
+
+INFO = ("get_player_info_tool", {"player_names": ["Josh Allen"]})
+ROSTERS = ("get_sleeper_league_rosters", {"league_id": "L1"})
+TXNS = ("get_sleeper_league_transactions", {"league_id": "L1", "week": 3})
+
+
+def test_harvest_dedupes_and_skips_old_sessions():
+    sessions = [_session([INFO, ROSTERS]), _session([INFO], updated_at=1)]
+    multi = ("multi_call", {"calls": [{"id": "a", "tool": INFO[0], "args": INFO[1]}]})
+    sessions.append(_session([multi, ("not_a_tool", {})]))
+    calls = harvest_calls(sessions, since=time.time() - 3600)
+    assert calls == [INFO, ROSTERS, INFO]
+
+
+def test_plan_ranks_and_respects_budget():
+    calls = [INFO] * 5 + [ROSTERS] * 3 + [TXNS] * 9
+    plan = plan_prefetch(calls, budget=5, week=3)
+    # league L1 was asked about 12 times, so its snapshot parts (with this week's matchups) come first
+    assert ROSTERS in plan.calls[:4]
+    assert ("get_sleeper_league_matchups", {"league_id": "L1", "week": 3}) in plan.calls[:4]
+    assert plan.calls[4] == INFO
+    assert len(plan_prefetch(calls, budget=2, week=3).calls) == 2
+    assert all(t != TXNS[0] for t, _ in plan_prefetch(calls, week=3).calls)  # never cached
+    assert plan.players["Josh Allen"] == 5 and plan.leagues["L1"] == 12
+
+
+def test_next_kickoff():
+    tuesday = datetime.datetime(2025, 10, 14, 12, 0, tzinfo=EASTERN)
+    assert next_kickoff(tuesday) == datetime.datetime(2025, 10, 16, 20, 15, tzinfo=EASTERN)
+    sunday_noon = datetime.datetime(2025, 10, 19, 14, 0, tzinfo=EASTERN)
+    assert next_kickoff(sunday_noon) == datetime.datetime(2025, 10, 19, 16, 5, tzinfo=EASTERN)
+
+
+def test_plan_drops_other_weeks_of_the_current_season():
+    weekly = "get_advanced_receiving_stats_weekly"
+    last_week = ("get_sleeper_league_matchups", {"league_id": "L1", "week": 2})
+    old_stats = (weekly, {"player_names": ["A"], "weekly_list": [1, 2]})
+    old_this_season = (weekly, {"player_names": ["A"], "season_list": [2024, 2025], "weekly_list": [1, 2]})
+    this_week = (weekly, {"player_names": ["A"], "weekly_list": [2, 3]})
+    closed_season = (weekly, {"player_names": ["A"], "season_list": [2023, 2024], "weekly_list": [1, 2]})
+    plan = plan_prefetch([last_week, old_stats, old_this_season, this_week, closed_season], week=3, season=2025)
+    assert last_week not in plan.calls and old_stats not in plan.calls and old_this_season not in plan.calls
+    assert this_week in plan.calls
+    # historical weekly stats never change, so they are still warmed
+    assert closed_season in plan.calls
+    # the league itself is still warmed, with this week's matchups
+    assert ("get_sleeper_league_matchups", {"league_id": "L1", "week": 3}) in plan.calls
+
+
+class FakeStorage:
+    def get_all_sessions(self):
+        return [_session([INFO, ROSTERS, ("get_advanced_receiving_stats", {"player_names": ["Ja'Marr Chase"]})])]
+
+
+def _boom(**kwargs):
+    raise RuntimeError("boom")
+
+
+def _tools():
+    return FakeTools({"get_sleeper_league_users": _boom})
+
+
+def test_run_once_stays_within_budget():
+    tools = _tools()
+    report = asyncio.run(PrefetchScheduler(tools, FakeStorage(), budget=3, concurrency=2).run_once())
+    assert len(tools.calls) == 3 and report["sessions"] == 1
+    assert report["fetched"] + len(report["errors"]) == 3
+
+
+def test_calls_are_timed_against_their_cache_ttl():
+    ttls = {"get_sleeper_league_matchups": 120.0, "get_advanced_receiving_stats": 3600.0}
+    scheduler = PrefetchScheduler(_tools(), FakeStorage(), lead=600.0, ttl_for=lambda t: ttls.get(t, 0.0))
+    assert scheduler.lead_for("get_sleeper_league_matchups") == 60.0
+    assert scheduler.lead_for("get_advanced_receiving_stats") == 600.0
+    assert scheduler.lead_for("get_sleeper_league_transactions") == 600.0
+
+    tools = _tools()
+    ttls = {"get_sleeper_league_rosters": 0.2, "get_player_info_tool": 60.0, "get_advanced_receiving_stats": 60.0}
+    scheduler = PrefetchScheduler(tools, FakeStorage(), budget=3, lead=0.15, ttl_for=lambda t: ttls.get(t, 0.0))
+    kickoff = datetime.datetime.now(EASTERN) + datetime.timedelta(seconds=0.15)
+    asyncio.run(scheduler.run_once(kickoff))
+    # rosters expire fastest, so they are fetched last, closest to kickoff
+    assert len(tools.calls) == 3 and tools.called()[-1] == "get_sleeper_league_rosters"
+    assert datetime.datetime.now(EASTERN) >= kickoff - datetime.timedelta(seconds=0.1)
+
+
+if __name__ == "__main__":
+    test_harvest_dedupes_and_skips_old_sessions()
+    test_plan_ranks_and_respects_budget()
+    test_next_kickoff()
+    test_plan_drops_other_weeks_of_the_current_season()
+    test_run_once_stays_within_budget()
+    test_calls_are_timed_against_their_cache_ttl()
+    print("Done.")
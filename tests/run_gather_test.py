@@ -0,0 +1,100 @@
+import asyncio
+import json
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from fakes import FakePool, bare_toolkit
+from gridiron_toolkit.info import MULTI_CALL
+
+# seconds each fake tool takes; the first call listed finishes last
+DELAYS = {"get_metrics_metadata": 0.05, "get_stats_metadata": 0.01, "get_fantasy_rank_page_types": 0.0}
+
+
+async def _answer(client, name, **kw):
+    await asyncio.sleep(DELAYS[name])
+    if kw.get("category") == "boom":
+        raise ValueError("bad category")
+    return json.dumps({"tool": name, "args": kw})
+
+
+def _toolkit():
+    pool = FakePool("http://fake-gather/mcp/", dict.fromkeys(DELAYS, _answer))
+    return bare_toolkit(pool, DELAYS, multi_call=True), pool
+
+
+def test_results_keep_call_order_and_ids():
+    tools, _ = _toolkit()
+    calls = [
+        {"id": "meta", "tool": "get_metrics_metadata", "args": {"category": "receiving"}},
+        {"tool": "get_stats_metadata", "args": {"category": "offense"}},
+        {"id": "ranks", "tool": "get_fantasy_rank_page_types"},
+    ]
+    results = asyncio.run(tools.gather(calls))
+    # keyed by id (position when missing) in request order, whatever finished first
+    assert list(results) == ["meta", "1", "ranks"]
+    assert all(r["ok"] for r in results.values())
+    assert json.loads(results["meta"]["result"])["args"] == {"category": "receiving"}
+
+
+def test_errors_stay_with_their_call():
+    tools, _ = _toolkit()
+    calls = [
+        {"id": "bad", "tool": "get_stats_metadata", "args": {"category": "boom"}},
+        {"id": "good", "tool": "get_stats_metadata", "args": {"category": "defense"}},
+        {"id": "slow", "tool": "get_metrics_metadata"},
+        {"id": "shape", "tool": "get_stats_metadata", "args": ["offense"]},
+    ]
+    results = asyncio.run(tools.gather(calls, timeout=0.02))
+    assert results["bad"] == {"ok": False, "error": "ValueError: bad category"}
+    assert results["good"]["ok"]
+    assert results["slow"] == {"ok": False, "error": "timed out after 0.02s"}
+    assert results["shape"] == {"ok": False, "error": "args must be an object of keyword arguments"}
+
+
+def test_unknown_and_nested_tools_are_refused():
+    tools, _ = _toolkit()
+    results = asyncio.run(tools.gather([
+        {"id": "x", "tool": "get_sleeper_league_rosters", "args": {"league_id": "1"}},
+        {"id": "y", "tool": MULTI_CALL, "args": {"calls": []}},
+        {"id": "z"},
+    ]))
+    assert results["x"] == {"ok": False, "error": "tool 'get_sleeper_league_rosters' is not available here"}
+    assert results["y"]["ok"] is False and results["z"]["ok"] is False
+
+
+def test_concurrency_is_bounded():
+    tools, pool = _toolkit()
+    calls = [{"id": str(i), "tool": "get_stats_metadata", "args": {"category": str(i)}} for i in range(6)]
+
+    async def run():
+        results = await tools.gather(calls, max_concurrency=2)
+        return results, (await pool.acquire()).peak
+
+    results, peak = asyncio.run(run())
+    assert len(results) == 6 and all(r["ok"] for r in results.values())
+    assert peak == 2
+
+
+def test_multi_call_tool_embeds_json_results():
+    tools, _ = _toolkit()
+    multi_call = tools.wrapper_for(MULTI_CALL)
+    out = json.loads(asyncio.run(multi_call(None, calls=[
+        {"id": "a", "tool": "get_stats_metadata", "args": {"category": "offense"}},
+        {"id": "b", "tool": "nope"},
+    ])))
+    assert out["a"] == {"ok": True, "result": {"tool": "get_stats_metadata", "args": {"category": "offense"}}}
+    assert out["b"]["ok"] is False
+
+
+if __name__ == "__main__":
+    print("Running gather tests...")
+    test_results_keep_call_order_and_ids()
+    test_errors_stay_with_their_call()
+    test_unknown_and_nested_tools_are_refused()
+    test_concurrency_is_bounded()
+    test_multi_call_tool_embeds_json_results()
+    print("Done.")
@@ -0,0 +1,120 @@
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from fakes import FakePool, bare_toolkit
+from gridiron_toolkit.identity import IdentityMap
+
+ROWS = [
+    {"sleeper_id": "4046", "gsis_id": "00-0033873", "pfr_id": "MahoPa00", "merge_name": "patrick mahomes", "player_name": "Patrick Mahomes"},
+    {"sleeper_id": "6794", "gsis_id": "00-0036322", "pfr_id": "JeffJu00", "merge_name": "justin jefferson", "player_name": "Justin Jefferson"},
+    {"player_name": "no sleeper id"},
+]
+
+
+def test_lookup_splits_held_and_missing_in_request_order():
+    ids = IdentityMap(path=None)
+    assert ids.add_rows(ROWS) == 2
+    found, missing = ids.lookup(["6794", "9999", "4046", "9999"])
+    assert [r["player_name"] for r in found] == ["Justin Jefferson", "Patrick Mahomes"]
+    assert missing == ["9999"]
+
+
+def test_cross_references():
+    ids = IdentityMap(path=None)
+    ids.add_rows(ROWS)
+    assert ids.sleeper_id_for(gsis_id="00-0033873") == "4046"
+    assert ids.sleeper_id_for(pfr_id="JeffJu00") == "6794"
+    assert ids.sleeper_id_for(merge_name="Justin Jefferson") == "6794"
+
+
+def test_old_rows_are_refetched():
+    ids = IdentityMap(path=None, max_age=60)
+    ids.add_rows(ROWS[:1], fetched_at=time.time() - 120)
+    assert ids.lookup(["4046"]) == ([], ["4046"])
+
+
+def test_persists_and_reloads():
+    path = os.path.join(tempfile.mkdtemp(), "nested", "identity.json")
+    ids = IdentityMap(path=path, save_interval=3600)
+    ids.add_rows(ROWS)
+    assert ids.save(force=True)
+    assert not ids.save(force=True)  # nothing changed
+    again = IdentityMap(path=path)
+    assert len(again) == 2 and again.get("4046")["pfr_id"] == "MahoPa00"
+    assert again.sleeper_id_for(gsis_id="00-0036322") == "6794"
+
+
+def test_save_async_writes_off_the_loop():
+    path = os.path.join(tempfile.mkdtemp(), "identity.json")
+    ids = IdentityMap(path=path, save_interval=3600)
+    ids.add_rows(ROWS)
+    assert asyncio.run(ids.save_async(force=True))
+    assert not asyncio.run(ids.save_async())  # clean, and inside the interval
+    assert len(IdentityMap(path=path)) == 2
+
+
+LOOKUP = "get_players_by_sleeper_id_tool"
+
+
+def _lookup(client, name, sleeper_ids=(), **kw):
+    if getattr(client, "error", None):
+        return json.dumps({"error": client.error})
+    return json.dumps({"result": [r for r in ROWS if r.get("sleeper_id") in sleeper_ids]})
+
+
+def _toolkit(url, ids):
+    pool = FakePool(url, {LOOKUP: _lookup})
+    return bare_toolkit(pool, [LOOKUP], use_identity_map=True, identity_map=ids), pool
+
+
+def test_expansion_keeps_the_tool_container_and_dedupes():
+    ids = IdentityMap(path=None)
+    ids.add_rows(ROWS[:1])
+    tools, pool = _toolkit("http://fake-identity/mcp/", ids)
+
+    async def run():
+        mixed = await tools.call(LOOKUP, sleeper_ids=["6794", "4046", "6794"])
+        held = await tools.call(LOOKUP, sleeper_ids=["4046", "6794", "4046"])
+        return mixed, held, (await pool.acquire()).asked(arg="sleeper_ids")
+
+    mixed, held, asked = asyncio.run(run())
+    assert asked == [["6794"]]
+    assert isinstance(held, str) and isinstance(mixed, str)
+    assert [r["sleeper_id"] for r in json.loads(mixed)["result"]] == ["6794", "4046"]
+    assert [r["sleeper_id"] for r in json.loads(held)["result"]] == ["4046", "6794"]
+
+
+def test_failed_lookup_does_not_shape_later_answers():
+    ids = IdentityMap(path=None)
+    ids.add_rows(ROWS[:1])
+    tools, pool = _toolkit("http://fake-identity-error/mcp/", ids)
+
+    async def run():
+        (await pool.acquire()).error = "upstream 502"
+        failed = await tools.call(LOOKUP, sleeper_ids=["4046", "6794"])
+        ids.add_rows(ROWS[1:2])
+        held = await tools.call(LOOKUP, sleeper_ids=["4046", "6794"])
+        return failed, held
+
+    failed, held = asyncio.run(run())
+    assert json.loads(failed)["error"] == "upstream 502"
+    assert json.loads(held) == {"result": ROWS[:2]}
+
+
+if __name__ == "__main__":
+    test_lookup_splits_held_and_missing_in_request_order()
+    test_cross_references()
+    test_old_rows_are_refetched()
+    test_persists_and_reloads()
+    test_save_async_writes_off_the_loop()
+    test_expansion_keeps_the_tool_container_and_dedupes()
+    test_failed_lookup_does_not_shape_later_answers()
+    print("Done.")
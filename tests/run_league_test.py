@@ -0,0 +1,110 @@
+import asyncio
+import datetime
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from fakes import FakePool, bare_toolkit
+from gridiron_toolkit import league
+from gridiron_toolkit.league import LeagueSnapshotCache, nfl_week, season_kickoff
+
+ROSTERS = "get_sleeper_league_rosters"
+TRANSACTIONS = "get_sleeper_league_transactions"
+
+
+def test_week_math():
+    assert season_kickoff(2025) == datetime.date(2025, 9, 4)
+    assert nfl_week(datetime.date(2025, 9, 1)) == 0
+    assert nfl_week(datetime.date(2025, 9, 4)) == 1
+    assert nfl_week(datetime.date(2025, 9, 8)) == 1  # Monday night still week 1
+    assert nfl_week(datetime.date(2025, 9, 9)) == 2
+
+
+def test_snapshot_reused_until_week_changes():
+    os.environ["GRIDIRON_NFL_WEEK"] = "5"
+    try:
+        snaps = LeagueSnapshotCache()
+        snaps.put(ROSTERS, {"league_id": "L1"}, ["r"])
+        assert snaps.get(ROSTERS, {"league_id": "L1"}) == (True, ["r"])
+        assert snaps.get(ROSTERS, {"league_id": "L2"}) == (False, None)
+        os.environ["GRIDIRON_NFL_WEEK"] = "6"
+        assert snaps.get(ROSTERS, {"league_id": "L1"}) == (False, None)
+        assert snaps.stats()["invalidations"] == {"week": 1}
+    finally:
+        del os.environ["GRIDIRON_NFL_WEEK"]
+
+
+def test_new_transactions_drop_the_snapshot():
+    snaps = LeagueSnapshotCache()
+    snaps.put(ROSTERS, {"league_id": "L1"}, ["r"])
+    old = [{"transaction_id": "t1", "status": "complete", "status_updated": (time.time() - 3600) * 1000}]
+    args = {"league_id": "L1", "week": 3}
+    assert not snaps.observe_transactions("L1", {"result": old}, args)
+    assert not snaps.observe_transactions("L1", {"result": old}, args)
+    assert snaps.get(ROSTERS, {"league_id": "L1"})[0]
+    new = old + [{"transaction_id": "t2", "status": "complete", "status_updated": time.time() * 1000 + 5000}]
+    assert snaps.observe_transactions("L1", {"result": new}, args)
+    assert snaps.get(ROSTERS, {"league_id": "L1"}) == (False, None)
+
+
+def test_live_matchups_expire_quickly_on_game_days():
+    snaps = LeagueSnapshotCache()
+    sunday = datetime.datetime(2025, 10, 12, 14, 0).timestamp()
+    tuesday = datetime.datetime(2025, 10, 14, 14, 0).timestamp()
+    assert snaps._ttl("get_sleeper_league_matchups", sunday) == league.LIVE_MATCHUP_TTL
+    assert snaps._ttl("get_sleeper_league_matchups", tuesday) == league.MATCHUP_TTL
+    assert snaps._ttl(ROSTERS, sunday) == league.SNAPSHOT_MAX_AGE
+
+
+def _league_part(client, name, **kw):
+    rows = client.transactions if name == TRANSACTIONS else [{"roster_id": 1}]
+    return json.dumps({"result": rows})
+
+
+def _backdate(snaps, league_id, seconds):
+    snap = snaps._leagues[league_id]
+    snap.created_at -= seconds
+    snap.checked_at -= seconds
+    snap.parts = {k: (at - seconds, v) for k, (at, v) in snap.parts.items()}
+
+
+def test_parts_older_than_the_cache_ttl_are_rechecked():
+    snaps = LeagueSnapshotCache()
+    pool = FakePool("http://fake-league/mcp/", dict.fromkeys((ROSTERS, TRANSACTIONS), _league_part))
+    tools = bare_toolkit(pool, [ROSTERS], use_league_snapshots=True, league_snapshots=snaps)
+    args = {"league_id": "L1"}
+
+    async def run():
+        client = await pool.acquire()
+        client.transactions = [
+            {"transaction_id": "t1", "status": "complete", "status_updated": (time.time() - 86400) * 1000}]
+        await tools.call(ROSTERS, **args)
+        await tools.call(ROSTERS, **args)
+        assert client.asked() == [ROSTERS]
+        # past the 5 minute rosters TTL: a transactions call with nothing new keeps the snapshot
+        _backdate(snaps, "L1", 600)
+        await tools.call(ROSTERS, **args)
+        assert client.asked() == [ROSTERS, TRANSACTIONS]
+        assert snaps.age(ROSTERS, args) < 1
+        # a new move since then drops it
+        _backdate(snaps, "L1", 600)
+        client.transactions = client.transactions + [
+            {"transaction_id": "t2", "status": "complete", "status_updated": (time.time() - 60) * 1000}]
+        await tools.call(ROSTERS, **args)
+        assert client.asked()[2:] == [TRANSACTIONS, ROSTERS]
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    test_week_math()
+    test_snapshot_reused_until_week_changes()
+    test_new_transactions_drop_the_snapshot()
+    test_live_matchups_expire_quickly_on_game_days()
+    test_parts_older_than_the_cache_ttl_are_rechecked()
+    print("Done.")
@@ -0,0 +1,97 @@
+import asyncio
+import datetime
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from gridiron_toolkit import localstore
+from gridiron_toolkit.localstore import LocalStatsStore, current_season, sync_store
+from gridiron_toolkit.schemas import default_positions
+
+TOOL = "get_advanced_receiving_stats_weekly"
+
+
+def test_current_season_rolls_over_in_march():
+    assert current_season(datetime.date(2025, 2, 10)) == 2024
+    assert current_season(datetime.date(2025, 3, 1)) == 2025
+    assert current_season(datetime.date(2025, 10, 5)) == 2025
+
+
+def test_default_positions_from_schema():
+    assert default_positions(TOOL) == ("WR", "TE", "RB")
+    assert default_positions("get_offensive_players_game_stats") == ("QB", "RB", "WR", "TE")
+
+
+def test_snapshot_answers_closed_synced_seasons_only():
+    if localstore.duckdb is None:
+        print("duckdb not installed; skipping snapshot test")
+        return
+    path = os.path.join(tempfile.mkdtemp(), "stats.duckdb")
+    store = LocalStatsStore(path, read_only=False)
+    store.write_season(TOOL, 2022, [
+        {"season": 2022, "week": 1, "player_name": "Stefon Diggs", "ff_position": "WR", "avg_separation": 3.1},
+        {"season": 2022, "week": 2, "player_name": "Stefon Diggs", "ff_position": "WR", "avg_separation": 2.4},
+        {"season": 2022, "week": 1, "player_name": "Dawson Knox", "ff_position": "TE", "avg_separation": 2.9},
+    ])
+    assert store.answers(TOOL, {"season_list": [2022]}, season=2024)
+    assert not store.answers(TOOL, {"season_list": [2022, 2023]}, season=2024)  # 2023 not synced
+    assert not store.answers(TOOL, {"season_list": [2022]}, season=2022)  # not closed
+    assert not store.answers(TOOL, {}, season=2024)
+    assert not store.answers(TOOL, {"season_list": [2022], "positions": ["QB"]}, season=2024)
+
+    rows = store.query(TOOL, {"season_list": [2022], "player_names": ["diggs"], "order_by_metric": "avg_separation"})["result"]
+    assert [r["week"] for r in rows] == [1, 2]
+    rows = store.query(TOOL, {"season_list": [2022], "positions": ["TE"], "metrics": ["avg_separation"]})["result"]
+    assert len(rows) == 1 and rows[0]["player_name"] == "Dawson Knox" and "avg_separation" in rows[0]
+    store.close()
+
+
+class _RecordingStore:
+    def __init__(self):
+        self.written = {}
+
+    def write_season(self, tool_name, season, rows):
+        self.written[(tool_name, season)] = rows
+        return len(rows)
+
+
+class _LimitedTools:
+    """Answers fetch_rows with `per_position` rows for each position asked for (all defaults if none)."""
+
+    def __init__(self, per_position):
+        self.per_position = per_position
+        self.calls = []
+
+    async def fetch_rows(self, tool_name, /, **kwargs):
+        self.calls.append(kwargs.get("positions"))
+        positions = kwargs.get("positions") or default_positions(tool_name)
+        rows = [{"ff_position": p, "n": i} for p in positions for i in range(self.per_position[p])]
+        return rows[:kwargs["limit"]]
+
+
+def test_sync_splits_by_position_then_skips_truncated_seasons():
+    tool = "get_advanced_receiving_stats"
+    assert default_positions(tool) == ("WR", "TE", "RB")
+    store = _RecordingStore()
+    tools = _LimitedTools({"WR": 4, "TE": 2, "RB": 3})
+    written = asyncio.run(sync_store(store, tools, [2022], [tool], sync_limit=5))
+    # the whole season hit the limit, each position fits under it
+    assert tools.calls == [None, ["WR"], ["TE"], ["RB"]]
+    assert written == {f"{tool} 2022": 9} and len(store.written[(tool, 2022)]) == 9
+
+    store = _RecordingStore()
+    tools = _LimitedTools({"WR": 6, "TE": 2, "RB": 3})
+    assert asyncio.run(sync_store(store, tools, [2022], [tool], sync_limit=5)) == {}
+    assert store.written == {}
+
+
+if __name__ == "__main__":
+    test_current_season_rolls_over_in_march()
+    test_default_positions_from_schema()
+    test_snapshot_answers_closed_synced_seasons_only()
+    test_sync_splits_by_position_then_skips_truncated_seasons()
+    print("Done.")
@@ -0,0 +1,61 @@
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from gridiron_toolkit.metrics import ToolMetrics, payload_size
+
+
+def test_payload_size():
+    assert payload_size(None) == 0
+    assert payload_size("abc") == 3
+
+    class _ToolResult:
+        content = '{"result": []}'
+
+    assert payload_size(_ToolResult()) == len('{"result": []}')
+    assert payload_size({"a": 1}) == len('{"a":1}')
+
+
+def test_record_and_render():
+    m = ToolMetrics()
+    m.record("get_advanced_receiving_stats", 0.2, 40, 5000)
+    m.record("get_advanced_receiving_stats", 1.5, 40, 0, error=TimeoutError())
+    m.record_cache_hit("get_metrics_metadata")
+
+    snap = m.snapshot()
+    assert snap["get_advanced_receiving_stats"]["calls"] == 2
+    assert snap["get_advanced_receiving_stats"]["errors"] == 1
+    assert snap["get_metrics_metadata"]["cache_hits"] == 1
+
+    text = "\n".join(m.render())
+    print(text[:400])
+    assert 'gridiron_tool_duration_seconds_bucket{tool="get_advanced_receiving_stats",le="0.25"} 1' in text
+    assert 'gridiron_tool_duration_seconds_bucket{tool="get_advanced_receiving_stats",le="+Inf"} 2' in text
+    assert 'gridiron_tool_errors_total{tool="get_advanced_receiving_stats",error="TimeoutError"} 1' in text
+
+
+def test_prometheus_reads_public_stats():
+    from gridiron_toolkit.metrics import render_prometheus
+    from gridiron_toolkit.pool import get_pool, pool_stats
+    from gridiron_toolkit.resilience import breaker_stats, get_breaker
+
+    get_breaker("http://metrics-test/mcp/", "get_fantasy_ranks").opened_at = time.monotonic()
+    get_pool("http://metrics-test/mcp/")
+    assert {"url": "http://metrics-test/mcp/", "tool": "get_fantasy_ranks", "state": "open",
+            "failures": 0, "opens": 0} in breaker_stats()
+    assert any(p["url"] == "http://metrics-test/mcp/" and p["connected"] == 0 for p in pool_stats())
+    text = render_prometheus()
+    assert 'gridiron_tool_circuit_open{url="http://metrics-test/mcp/",tool="get_fantasy_ranks"} 1' in text
+    assert 'gridiron_mcp_pool_connects_total{url="http://metrics-test/mcp/"} 0' in text
+
+
+if __name__ == "__main__":
+    print("Running metrics tests...")
+    test_payload_size()
+    test_record_and_render()
+    test_prometheus_reads_public_stats()
+    print("Done.")
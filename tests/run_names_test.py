@@ -0,0 +1,90 @@
+import asyncio
+import json
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from fakes import FakePool, bare_toolkit
+from gridiron_toolkit.names import PlayerNameIndex, normalize_name
+
+ROWS = [
+    {"gsis_id": "00-0036900", "player_name": "Ja'Marr Chase", "position": "WR", "latest_team": "CIN"},
+    {"gsis_id": "00-0039075", "player_name": "Puka Nacua", "position": "WR", "latest_team": "LA"},
+    {"gsis_id": "00-0036322", "player_name": "Justin Jefferson", "position": "WR"},
+    {"gsis_id": "00-0037207", "player_name": "Chase Brown", "position": "RB"},
+    {"gsis_id": "00-0033280", "player_name": "Christian McCaffrey", "position": "RB"},
+]
+
+
+def test_normalize_name():
+    assert normalize_name("Ja'Marr Chase") == "jamarr chase"
+    assert normalize_name("Amon-Ra St. Brown") == "amon ra st brown"
+    assert normalize_name("Marvin Harrison Jr.") == "marvin harrison"
+    assert normalize_name("Jérôme  Bettis") == "jerome bettis"
+
+
+def test_resolves_misspellings_partials_and_aliases():
+    index = PlayerNameIndex()
+    assert index.add_rows(ROWS) == 5
+    assert index.resolve("Jamarr Chase").id == "00-0036900"
+    assert index.resolve("justin jeferson").id == "00-0036322"
+    assert index.resolve("Puka").id == "00-0039075"
+    assert index.resolve("cmc").name == "Christian McCaffrey"
+    assert index.resolve("Chase") is None  # two players, ambiguous
+    assert index.resolve("Tom Brady") is None
+
+
+def test_rewrite_only_touches_names_the_server_would_miss():
+    index = PlayerNameIndex()
+    index.add_rows(ROWS)
+    names, changed = index.rewrite(["Jamarr Chase", "Puka", "Nacua", "Unknown Guy", "cmc"])
+    assert names == ["Ja'Marr Chase", "Puka", "Nacua", "Unknown Guy", "Christian McCaffrey"]
+    assert changed == {"Jamarr Chase": "Ja'Marr Chase", "cmc": "Christian McCaffrey"}
+    # fuzzy guesses are not applied up front, only on request
+    assert index.rewrite(["justin jeferson"]) == (["justin jeferson"], {})
+    assert index.rewrite(["justin jeferson"], fuzzy=True)[1] == {"justin jeferson": "Justin Jefferson"}
+
+
+def test_upsert_reindexes_renamed_player():
+    index = PlayerNameIndex()
+    index.add("1", "Gabe Davis")
+    index.add("1", "Gabriel Davis")
+    assert len(index) == 1
+    assert index.resolve("gabriel davis").id == "1"
+    assert index.search("gabe davis")[0][0].name == "Gabriel Davis"
+
+
+def _player_info(client, name, player_names=(), **kw):
+    # the server's case-insensitive substring match
+    rows = [r for r in ROWS if any(n.lower() in r["player_name"].lower() for n in player_names)]
+    return json.dumps({"result": rows})
+
+
+def test_toolkit_tries_fuzzy_names_only_after_an_empty_result():
+    index = PlayerNameIndex()
+    index.add_rows(ROWS)
+    pool = FakePool("http://fake-names/mcp/", {"get_player_info_tool": _player_info})
+    tools = bare_toolkit(pool, ["get_player_info_tool"], resolve_names=True, name_index=index)
+
+    async def run():
+        exact = json.loads(await tools.call("get_player_info_tool", player_names=["Jamarr Chase"]))
+        fuzzy = json.loads(await tools.call("get_player_info_tool", player_names=["justin jeferson"]))
+        return exact, fuzzy, (await pool.acquire()).asked(arg="player_names")
+
+    exact, fuzzy, asked = asyncio.run(run())
+    assert [r["player_name"] for r in exact["result"]] == ["Ja'Marr Chase"] and "names_changed" not in exact
+    assert [r["player_name"] for r in fuzzy["result"]] == ["Justin Jefferson"]
+    assert fuzzy["names_changed"] == {"justin jeferson": "Justin Jefferson"}
+    assert asked == [["Ja'Marr Chase"], ["justin jeferson"], ["Justin Jefferson"]]
+
+
+if __name__ == "__main__":
+    test_normalize_name()
+    test_resolves_misspellings_partials_and_aliases()
+    test_rewrite_only_touches_names_the_server_would_miss()
+    test_upsert_reindexes_renamed_player()
+    test_toolkit_tries_fuzzy_names_only_after_an_empty_result()
+    print("Done.")
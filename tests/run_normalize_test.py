@@ -0,0 +1,59 @@
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from gridiron_toolkit.normalize import check_metrics, metric_names_in, normalize_args
+from gridiron_toolkit.schemas import ToolArgumentError
+
+
+def test_scalars_wrapped_and_ranges_expanded():
+    out = normalize_args(
+        "get_advanced_receiving_stats_weekly",
+        {"player_names": " Puka Nacua ", "season_list": "2023-2024", "weekly_list": "1-3,3,5", "limit": "25"},
+    )
+    assert out == {
+        "player_names": ["Puka Nacua"],
+        "season_list": [2023, 2024],
+        "weekly_list": [1, 2, 3, 5],
+        "limit": 25,
+    }
+
+
+def test_lists_deduped():
+    out = normalize_args("get_player_info_tool", {"player_names": ["Josh Allen", "Josh Allen"]})
+    assert out == {"player_names": ["Josh Allen"]}
+
+
+def test_unknown_metric_fails_with_choices():
+    metadata = {"targets", "adot", "new_metric"}
+    check_metrics("get_advanced_receiving_stats", {"metrics": ["targets", "adot"]}, metadata)
+    try:
+        check_metrics("get_advanced_receiving_stats", {"metrics": ["targetz"]}, metadata)
+    except ToolArgumentError as e:
+        assert "targetz" in str(e) and "targets" in str(e)
+    else:
+        raise AssertionError("targetz accepted")
+    # names seen in cached metadata count as valid too
+    check_metrics("get_advanced_receiving_stats", {"metrics": ["new_metric"]}, metadata)
+    # without metadata the description's partial list is not an allowlist
+    check_metrics("get_advanced_receiving_stats_weekly", {"metrics": ["targets", "receptions"]})
+    check_metrics("get_advanced_receiving_stats", {"metrics": ["targetz"]})
+    # game-stats tools don't enumerate their metrics; leave them to the server
+    check_metrics("get_offensive_players_game_stats", {"metrics": ["anything"]})
+
+
+def test_metric_names_in_metadata():
+    meta = '{"receiving": {"volume_metrics": {"targets": "Targets"}, "weekly": ["avg_yac"]}}'
+    assert {"targets", "avg_yac"} <= metric_names_in(meta)
+
+
+if __name__ == "__main__":
+    print("Running normalize tests...")
+    test_scalars_wrapped_and_ranges_expanded()
+    test_lists_deduped()
+    test_unknown_metric_fails_with_choices()
+    test_metric_names_in_metadata()
+    print("Done.")
@@ -0,0 +1,52 @@
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from gridiron_toolkit.paging import SEASON_WEEKS, RunningTotals, plan_pages
+
+
+def test_pages_split_by_season_and_week_block():
+    pages = plan_pages({"season_list": [2024, 2023], "weekly_list": [1, 2, 3, 4], "limit": 50, "positions": ["WR"]},
+                       page_size=200, weeks_per_page=3)
+    assert [(p["season_list"], p["weekly_list"]) for p in pages] == [
+        ([2023], [1, 2, 3]), ([2023], [4]), ([2024], [1, 2, 3]), ([2024], [4]),
+    ]
+    assert all(p["limit"] == 200 and p["positions"] == ["WR"] for p in pages)
+
+
+def test_missing_weeks_cover_the_whole_season():
+    pages = plan_pages({"season_list": [2024]}, weeks_per_page=4)
+    weeks = [w for p in pages for w in p["weekly_list"]]
+    assert weeks == list(SEASON_WEEKS)
+
+
+def test_no_seasons_is_a_single_page():
+    pages = plan_pages({"player_names": ["Allen"], "weekly_list": [1]}, page_size=100)
+    assert pages == [{"player_names": ["Allen"], "limit": 100, "weekly_list": [1]}]
+
+
+def test_running_totals_fold_pages():
+    totals = RunningTotals()
+    totals.add([
+        {"player_name": "A", "season": 2024, "week": 1, "receiving_yards": 100, "team": "BUF"},
+        {"player_name": "B", "season": 2024, "week": 1, "receiving_yards": 40},
+    ])
+    totals.add([
+        {"player_name": "A", "season": 2024, "week": 2, "receiving_yards": 50, "targets": None},
+    ])
+    by_name = {r["player_name"]: r for r in totals.rows()}
+    assert by_name["A"] == {"player_name": "A", "games": 2, "receiving_yards": 150.0}
+    assert totals.rows(per_game=True, order_by="receiving_yards")[0]["receiving_yards"] == 75.0
+    assert totals.rows_seen == 3 and len(totals) == 2
+    assert len(totals.rows(limit=1)) == 1
+
+
+if __name__ == "__main__":
+    test_pages_split_by_season_and_week_block()
+    test_missing_weeks_cover_the_whole_season()
+    test_no_seasons_is_a_single_page()
+    test_running_totals_fold_pages()
+    print("Done.")
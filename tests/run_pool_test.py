@@ -0,0 +1,132 @@
+import asyncio
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from fakes import FakeClient, FakePool, bare_toolkit
+
+TOOLS = ("get_player_info_tool", "get_metrics_metadata")
+
+
+class _Session:
+    def __init__(self):
+        self.healthy = True
+        self.pings = 0
+
+    async def send_ping(self):
+        self.pings += 1
+        if not self.healthy:
+            raise ConnectionError("session gone")
+
+
+class _Client(FakeClient):
+    """A client whose calls can be held at `gate` or made to fail like a dropped transport."""
+
+    def __init__(self, handlers, **kwargs):
+        super().__init__(handlers, **kwargs)
+        self.session = _Session()
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.broken = False
+
+
+async def _answer(client, name, **kw):
+    await client.gate.wait()
+    if client.broken:
+        raise ConnectionError("reset by peer")
+    return f"{client.serial}:{name}"
+
+
+def _pool(url="http://fake/mcp/", **kwargs):
+    return FakePool(url, dict.fromkeys(TOOLS, _answer), client_class=_Client, **kwargs)
+
+
+def test_round_robin_and_lazy_connect():
+    async def run():
+        pool = _pool(size=2, health_check_interval=60)
+        first, second, third = await pool.acquire(), await pool.acquire(), await pool.acquire()
+        assert first is not second and third is first
+        assert pool.connects == 2 and pool.reconnects == 0
+        assert await pool.warm() == [] and pool.connects == 2
+
+    asyncio.run(run())
+
+
+def test_health_check_reconnects_dead_session():
+    async def run():
+        pool = _pool(size=1, health_check_interval=0)
+        client = await pool.acquire()
+        client.session.healthy = False
+        replacement = await pool.acquire()
+        assert replacement is not client and client.closed
+        assert pool.reconnects == 1
+        # a healthy session is pinged and kept
+        assert await pool.acquire() is replacement and replacement.session.pings == 1
+
+    asyncio.run(run())
+
+
+def test_report_failure_drops_only_that_client():
+    async def run():
+        pool = _pool(size=2, health_check_interval=60)
+        a, b = await pool.acquire(), await pool.acquire()
+        await pool.report_failure(a)
+        assert a.closed and not b.closed and pool.peek() is b
+        # a stale client (already replaced) is ignored
+        await pool.report_failure(a)
+        assert await pool.acquire() is not a
+
+    asyncio.run(run())
+
+
+def test_toolkit_calls_keep_their_own_client():
+    async def run():
+        pool = _pool(size=2, health_check_interval=60)
+        tools = bare_toolkit(pool, TOOLS)
+        await tools.connect()
+        held = [s.client for s in pool._slots if s.client is not None]
+        for c in held:
+            c.gate.clear()
+        pending = [asyncio.ensure_future(tools.call("get_metrics_metadata")) for _ in range(4)]
+        await asyncio.sleep(0)
+        # closing the toolkit (or another call reconnecting) must not touch in-flight calls
+        await tools.close()
+        await pool.acquire()
+        for s in pool._slots:
+            if s.client is not None:
+                s.client.gate.set()
+        results = await asyncio.gather(*pending)
+        assert sorted({r.split(":")[1] for r in results}) == ["get_metrics_metadata"]
+        assert len({r.split(":")[0] for r in results}) == 2
+
+    asyncio.run(run())
+
+
+def test_transport_error_reports_the_failing_client():
+    async def run():
+        pool = _pool(size=1, health_check_interval=60)
+        tools = bare_toolkit(pool, TOOLS)
+        bad = await pool.acquire()
+        bad.broken = True
+        try:
+            await tools.call("get_player_info_tool", player_names=["Josh Allen"])
+        except ConnectionError:
+            pass
+        assert bad.closed
+        assert (await tools.call("get_player_info_tool", player_names=["Josh Allen"])).endswith(":get_player_info_tool")
+        assert pool.reconnects == 0 and pool.connects == 2
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    print("Running pool tests...")
+    test_round_robin_and_lazy_connect()
+    test_health_check_reconnects_dead_session()
+    test_report_failure_drops_only_that_client()
+    test_toolkit_calls_keep_their_own_client()
+    test_transport_error_reports_the_failing_client()
+    print("Done.")
@@ -0,0 +1,46 @@
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from gridiron_toolkit.projection import identity_fields, project_result
+
+ROW = {
+    "season": 2023,
+    "player_name": "Ja'Marr Chase",
+    "ff_team": "CIN",
+    "merge_name": "jamarr chase",
+    "targets": 145,
+    "adot": 9.4,
+    "avg_separation": 2.9,
+}
+
+
+def test_identity_resolved_from_schema():
+    assert identity_fields("get_advanced_receiving_stats") == ("season", "player_name", "ff_team")
+    assert identity_fields("get_advanced_passing_stats_weekly") == ("season", "week", "player_name", "team")
+
+
+def test_projection_keeps_requested_metrics_and_identity():
+    out = project_result(
+        "get_advanced_receiving_stats",
+        {"metrics": ["targets"], "order_by_metric": "adot"},
+        {"result": [ROW]},
+    )
+    assert out == {"result": [{"season": 2023, "player_name": "Ja'Marr Chase", "ff_team": "CIN", "targets": 145, "adot": 9.4}]}
+
+
+def test_without_metrics_or_for_other_tools_nothing_changes():
+    payload = {"result": [ROW]}
+    assert project_result("get_advanced_receiving_stats", {}, payload) is payload
+    assert project_result("get_player_info_tool", {"metrics": ["x"]}, payload) is payload
+
+
+if __name__ == "__main__":
+    print("Running projection tests...")
+    test_identity_resolved_from_schema()
+    test_projection_keeps_requested_metrics_and_identity()
+    test_without_metrics_or_for_other_tools_nothing_changes()
+    print("Done.")
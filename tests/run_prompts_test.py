@@ -0,0 +1,54 @@
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from bill.prompts import DEFAULT_VERSION, PROMPT_NAMES, load_prompt, versions
+
+
+def test_every_prompt_loads():
+    assert DEFAULT_VERSION in versions()
+    for name in PROMPT_NAMES:
+        text = load_prompt(name, DEFAULT_VERSION)
+        assert text.strip() and not text.startswith((" ", "\n")), name
+    assert "Supervisor Role" in load_prompt("supervisor", DEFAULT_VERSION)
+
+
+def test_unknown_version_falls_back():
+    assert load_prompt("fantasy", "v999") == load_prompt("fantasy", DEFAULT_VERSION)
+
+
+def test_env_selects_version():
+    os.environ["BILL_PROMPT_VERSION"] = "v999"
+    try:
+        assert load_prompt("league") == load_prompt("league", DEFAULT_VERSION)
+    finally:
+        del os.environ["BILL_PROMPT_VERSION"]
+
+
+def test_missing_prompt_raises():
+    try:
+        load_prompt("no_such_agent", DEFAULT_VERSION)
+    except FileNotFoundError:
+        pass
+    else:
+        raise AssertionError("expected FileNotFoundError")
+
+
+def test_factory_imports_without_building():
+    import bill.factory as factory
+
+    # nothing heavy is constructed until get_team() is called
+    assert factory._TEAMS == {}
+    assert "get_sleeper_trending_players" in factory.FANTASY_TOOLS
+
+
+if __name__ == "__main__":
+    test_every_prompt_loads()
+    test_unknown_version_falls_back()
+    test_env_selects_version()
+    test_missing_prompt_raises()
+    test_factory_imports_without_building()
+    print("Done.")
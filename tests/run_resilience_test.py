@@ -0,0 +1,119 @@
+import asyncio
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from gridiron_toolkit.cache import ResultCache
+from gridiron_toolkit.deadline import DeadlineExceeded
+from gridiron_toolkit.resilience import CircuitBreaker, CircuitOpenError, RetryPolicy, call_with_retry
+
+FAST = RetryPolicy(max_attempts=3, base_delay=0.001, max_delay=0.002)
+
+
+def test_retries_transport_errors_then_succeeds():
+    attempts = []
+
+    async def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise ConnectionError("reset")
+        return "ok"
+
+    assert asyncio.run(call_with_retry(flaky, FAST, lambda e: isinstance(e, ConnectionError))) == "ok"
+    assert len(attempts) == 3
+
+
+def test_non_retryable_errors_raise_immediately():
+    attempts = []
+
+    async def bad():
+        attempts.append(1)
+        raise ValueError("tool error")
+
+    try:
+        asyncio.run(call_with_retry(bad, FAST, lambda e: isinstance(e, ConnectionError)))
+    except ValueError:
+        pass
+    assert len(attempts) == 1
+
+
+def test_breaker_opens_then_half_opens():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+
+    async def down():
+        raise ConnectionError("down")
+
+    async def run(fn):
+        return await call_with_retry(fn, RetryPolicy(max_attempts=1), lambda e: True, breaker=breaker)
+
+    for _ in range(2):
+        try:
+            asyncio.run(run(down))
+        except ConnectionError:
+            pass
+    assert breaker.state == "open"
+    try:
+        asyncio.run(run(down))
+    except CircuitOpenError as e:
+        print("fail fast:", e)
+    else:
+        raise AssertionError("breaker let the call through")
+
+    time.sleep(0.06)
+
+    async def up():
+        return "back"
+
+    assert asyncio.run(run(up)) == "back"
+    assert breaker.state == "closed"
+
+
+def test_only_retryable_failures_count_against_the_breaker():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+
+    def retry_on(e):
+        return isinstance(e, ConnectionError) and not isinstance(e, DeadlineExceeded)
+
+    async def bad_args():
+        raise ValueError("Error from MCP tool: unknown season")
+
+    async def out_of_budget():
+        raise DeadlineExceeded("request time budget exhausted")
+
+    for fn, exc in ((bad_args, ValueError), (out_of_budget, DeadlineExceeded)):
+        try:
+            asyncio.run(call_with_retry(fn, FAST, retry_on, breaker=breaker))
+        except exc:
+            pass
+    assert breaker.state == "closed" and breaker.failures == 0
+
+    # a half-open probe that hits a tool error frees the slot for the next probe
+    breaker.opened_at = time.monotonic() - 61
+    try:
+        asyncio.run(call_with_retry(bad_args, FAST, retry_on, breaker=breaker))
+    except ValueError:
+        pass
+    assert breaker.allow()
+
+
+def test_stale_if_error_window():
+    c = ResultCache(ttl_policy={"meta": 0.01}, stale_policy={"meta": 60})
+    c.put("meta", {}, "M")
+    time.sleep(0.02)
+    assert c.get("meta", {}) == (False, None)
+    assert c.get_stale("meta", {}) == (True, "M")
+    assert c.get_stale("other", {}) == (False, None)
+
+
+if __name__ == "__main__":
+    print("Running resilience tests...")
+    test_retries_transport_errors_then_succeeds()
+    test_non_retryable_errors_raise_immediately()
+    test_breaker_opens_then_half_opens()
+    test_only_retryable_failures_count_against_the_breaker()
+    test_stale_if_error_window()
+    print("Done.")
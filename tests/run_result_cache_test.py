@@ -0,0 +1,65 @@
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from gridiron_toolkit.cache import ResultCache, canonical_args
+
+
+def test_canonical_args_order_independent():
+    assert canonical_args((), {"a": 1, "b": [1, 2]}) == canonical_args((), {"b": [1, 2], "a": 1})
+    # None-valued kwargs are the same as omitted ones
+    assert canonical_args((), {"a": 1, "limit": None}) == canonical_args((), {"a": 1})
+
+
+def test_hit_miss_and_ttl():
+    c = ResultCache(ttl_policy={"meta": 0.05, "txns": 0})
+    assert c.get("meta", {"x": 1}) == (False, None)
+    c.put("meta", {"x": 1}, "M")
+    assert c.get("meta", {"x": 1}) == (True, "M")
+    # ttl 0 means never cached
+    c.put("txns", {"league_id": "1"}, "T")
+    assert c.get("txns", {"league_id": "1"}) == (False, None)
+    time.sleep(0.06)
+    assert c.get("meta", {"x": 1}) == (False, None)
+    stats = c.stats()
+    print("cache stats:", stats)
+    assert stats["hits"] == 1 and stats["misses"] == 2
+
+
+def test_lru_eviction():
+    c = ResultCache(max_entries=2, ttl_policy={}, default_ttl=60)
+    c.put("t", {"k": "a"}, "A")
+    c.put("t", {"k": "b"}, "B")
+    c.get("t", {"k": "a"})  # a is now most recently used
+    c.put("t", {"k": "c"}, "C")
+    assert c.get("t", {"k": "b"}) == (False, None)
+    assert c.get("t", {"k": "a"}) == (True, "A")
+    assert c.evictions == 1
+
+
+def test_entries_are_per_server_and_detached():
+    c = ResultCache(ttl_policy={"rows": 60})
+    c.put("rows", {"k": 1}, {"result": [{"player": "A"}]}, url="http://one/mcp/")
+    assert c.get("rows", {"k": 1}, url="http://two/mcp/") == (False, None)
+    hit, value = c.get("rows", {"k": 1}, url="http://one/mcp/")
+    assert hit
+    # a caller mutating its copy leaves the entry intact
+    value["result"].append({"player": "B"})
+    assert c.peek("rows", {"k": 1}, url="http://one/mcp/") == {"result": [{"player": "A"}]}
+    c.invalidate("rows", url="http://two/mcp/")
+    assert len(c) == 1
+    c.invalidate("rows")
+    assert len(c) == 0
+
+
+if __name__ == "__main__":
+    print("Running result cache tests...")
+    test_canonical_args_order_independent()
+    test_hit_miss_and_ttl()
+    test_lru_eviction()
+    test_entries_are_per_server_and_detached()
+    print("Done.")
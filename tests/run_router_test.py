@@ -0,0 +1,95 @@
+import asyncio
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from fakes import FakeTeam, FakeTools
+from gridiron_toolkit.names import PlayerNameIndex
+from gridiron_toolkit.router import IntentRouter, Plan, install_intent_router, match_intent
+
+LEAGUE = "1180208512191082496"
+
+
+def test_matches_simple_lookups():
+    assert match_intent("basic info about Josh Allen") == Plan(
+        "player_info", [("get_player_info_tool", {"player_names": ["Josh Allen"]})]
+    )
+    assert match_intent("Who is Ja'Marr Chase and Puka Nacua?").calls[0][1] == {
+        "player_names": ["Ja'Marr Chase", "Puka Nacua"]
+    }
+    plan = match_intent(f"show me the rosters for league {LEAGUE}")
+    assert plan.intent == "league_rosters" and plan.calls[0] == ("get_sleeper_league_rosters", {"league_id": LEAGUE})
+    assert match_intent("top 10 trending drops this week").calls == [
+        ("get_sleeper_trending_players", {"add_drop": "drop", "hours": 168, "limit": 10})
+    ]
+    assert match_intent("who's hot on waivers?").calls[0][1] == {"add_drop": "add", "hours": 24, "limit": 25}
+
+
+def test_open_ended_questions_fall_through():
+    for question in (
+        "should I start Josh Allen or Jalen Hurts?",
+        "compare Jefferson and Chase 2023-2024 receiving",
+        "who is the best WR in my league",
+        "info on the Bills",
+        f"analyze the rosters in league {LEAGUE}",
+        "what about his stats?",
+        "what is trending on twitter about Jefferson",
+        "who is available?",
+        "who is next",
+        "who's Detroit's QB",
+        "who is Puka",
+    ):
+        assert match_intent(question) is None, question
+
+
+def test_one_word_who_is_needs_a_known_player():
+    index = PlayerNameIndex()
+    index.add("00-0039075", "Puka Nacua")
+    assert match_intent("who is Puka?", index).calls == [("get_player_info_tool", {"player_names": ["Puka"]})]
+    assert match_intent("who is available?", index) is None
+
+
+def test_router_answers_and_falls_back():
+    tools = FakeTools({
+        "get_sleeper_trending_players": [{"player_id": "4046", "count": 900}],
+        "get_players_by_sleeper_id_tool": [
+            {"sleeper_id": "4046", "player_name": "Patrick Mahomes", "position": "QB", "latest_team": "KC"}
+        ],
+    })
+    router = IntentRouter(tools)
+    intent, content = asyncio.run(router.answer("trending adds"))
+    assert intent == "trending" and "1. Patrick Mahomes (QB, KC): 900 adds" in content
+    # no rows: let the coordinator explain
+    assert asyncio.run(router.answer("info on Nobody Known")) is None
+    assert router.stats() == {"routed": {"trending": 1}, "fallbacks": 1}
+
+
+def test_unmatched_questions_reach_the_team():
+    team = FakeTeam()
+    install_intent_router(team, "unused", router=IntentRouter(FakeTools({})))
+    assert asyncio.run(team.arun("should I trade for CMC?", session_id="s")) == "from the team"
+    assert team.asked == ["should I trade for CMC?"]
+
+
+def test_routed_turns_are_stored_in_the_session():
+    team = FakeTeam(storage=object())
+    tools = FakeTools({"get_sleeper_trending_players": [{"player_id": "4046", "count": 900}]})
+    install_intent_router(team, "unused", router=IntentRouter(tools, name_index=PlayerNameIndex()))
+    response = asyncio.run(team.arun("trending adds", session_id="s1", user_id="u1"))
+    assert team.asked == [] and response.model == "intent-router:trending"
+    assert team.written == [("s1", "u1")]
+    run = team.memory.runs["s1"][0]
+    assert [(m.role, m.content) for m in run.messages] == [("user", "trending adds"), ("assistant", response.content)]
+
+
+if __name__ == "__main__":
+    test_matches_simple_lookups()
+    test_open_ended_questions_fall_through()
+    test_one_word_who_is_needs_a_known_player()
+    test_router_answers_and_falls_back()
+    test_unmatched_questions_reach_the_team()
+    test_routed_turns_are_stored_in_the_session()
+    print("Done.")
@@ -0,0 +1,51 @@
+import inspect
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from typing import List, Optional
+
+from gridiron_toolkit.schemas import ToolArgumentError, apply_schema, get_tool, validate_args
+
+
+def test_tool_list_is_importable():
+    from gridiron_toolkit import tool_list
+
+    assert any(t["name"] == "get_player_info_tool" for t in tool_list.tools)
+    assert get_tool("get_sleeper_trending_players") is not None
+
+
+def test_wrapper_gets_typed_signature():
+    async def _wrapper(agent, *args, **kwargs):
+        return kwargs
+
+    apply_schema(_wrapper, "get_advanced_receiving_stats_weekly")
+    params = inspect.signature(_wrapper).parameters
+    assert list(params)[0] == "agent"
+    assert params["weekly_list"].annotation == Optional[List[int]]
+    assert params["limit"].default == 100
+    assert "weekly receiving" in _wrapper.__doc__
+
+
+def test_validate_args():
+    validate_args("get_player_info_tool", {"player_names": ["Josh Allen"]})
+    for bad in ({}, {"player_names": "Josh Allen"}, {"player_names": ["x"], "team": "BUF"}):
+        try:
+            validate_args("get_player_info_tool", bad)
+        except ToolArgumentError as e:
+            print("rejected:", e)
+        else:
+            raise AssertionError(f"accepted {bad}")
+    # tools the catalog doesn't know about are left to the server
+    validate_args("some_new_tool", {"anything": 1})
+
+
+if __name__ == "__main__":
+    print("Running schemas tests...")
+    test_tool_list_is_importable()
+    test_wrapper_gets_typed_signature()
+    test_validate_args()
+    print("Done.")
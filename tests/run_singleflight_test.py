@@ -0,0 +1,49 @@
+import asyncio
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from gridiron_toolkit.singleflight import SingleFlight
+
+
+def test_concurrent_calls_share_one_request():
+    flight = SingleFlight()
+    calls = []
+
+    async def remote():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"player": "Josh Allen"}
+
+    async def main():
+        return await asyncio.gather(*(flight.do("k", remote) for _ in range(5)))
+
+    results = asyncio.run(main())
+    assert len(calls) == 1
+    assert all(r == {"player": "Josh Allen"} for r in results)
+    assert flight.stats()["shared"] == 4
+    assert flight.inflight() == 0
+
+
+def test_errors_reach_every_waiter():
+    flight = SingleFlight()
+
+    async def remote():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    async def main():
+        return await asyncio.gather(*(flight.do("k", remote) for _ in range(3)), return_exceptions=True)
+
+    results = asyncio.run(main())
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+if __name__ == "__main__":
+    print("Running singleflight tests...")
+    test_concurrent_calls_share_one_request()
+    test_errors_reach_every_waiter()
+    print("Done.")
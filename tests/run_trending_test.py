@@ -0,0 +1,58 @@
+import asyncio
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from fakes import FakeTools
+from gridiron_toolkit.trending import TRENDING_TOOL, TrendingPoller, TrendingSnapshot
+
+ROWS = [{"player_id": str(i), "count": 100 - i} for i in range(50)]
+
+
+def test_snapshot_fills_defaults_and_slices_smaller_limits():
+    snap = TrendingSnapshot(max_stale=60)
+    snap.put({"add_drop": "add", "hours": 24, "limit": 50}, {"result": ROWS})
+    hit, result = snap.get({})  # schema defaults: nfl, add, 24h, 25 players
+    assert hit and result["result"] == ROWS[:25]
+    assert snap.get({"add_drop": "add", "hours": 24, "limit": 50}) == (True, {"result": ROWS})
+    assert snap.get({"limit": 100}) == (False, None)
+    assert snap.get({"add_drop": "drop"}) == (False, None)
+
+
+def test_snapshot_goes_stale():
+    snap = TrendingSnapshot(max_stale=60)
+    snap.put({"limit": 50}, {"result": ROWS}, fetched_at=time.time() - 120)
+    assert snap.get({"limit": 10}) == (False, None)
+
+
+def _trending(add_drop, hours, limit, **kw):
+    if add_drop == "drop" and hours == 48:
+        raise RuntimeError("upstream down")
+    return {"result": ROWS[:limit]}
+
+
+def test_poller_refreshes_every_variant():
+    async def main():
+        tools = FakeTools({TRENDING_TOOL: _trending})
+        snap = TrendingSnapshot(max_stale=60)
+        poller = TrendingPoller(tools, snapshot=snap, interval=0.01)
+        poller.start()
+        await asyncio.sleep(0.05)
+        await poller.stop()
+        assert poller.polls >= 2 and poller.errors >= 1
+        assert len(tools.calls) >= 2 * len(poller.variants)
+        assert snap.get({"add_drop": "drop", "hours": 24, "limit": 5})[0]
+        assert not snap.get({"add_drop": "drop", "hours": 48})[0]
+
+    asyncio.run(main())
+
+
+if __name__ == "__main__":
+    test_snapshot_fills_defaults_and_slices_smaller_limits()
+    test_snapshot_goes_stale()
+    test_poller_refreshes_every_variant()
+    print("Done.")
@@ -0,0 +1,76 @@
+import asyncio
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from fakes import FakePool, bare_toolkit
+from gridiron_toolkit.cache import ResultCache
+from gridiron_toolkit.warmup import install_warmup, iter_toolkits, warm_up
+
+
+def _answer(client, name, **kw):
+    return f'{{"result": [{{"tool": "{name}"}}]}}'
+
+
+def _pool(url, size=2, fail_slots=0):
+    return FakePool(url, {"get_metrics_metadata": _answer}, size=size, connect_delay=0.05, fail_connects=fail_slots)
+
+
+class _Agent:
+    def __init__(self, tools, members=()):
+        self.tools = tools
+        self.members = list(members)
+
+
+def _toolkit(pool):
+    # prefetches land in the toolkit's own cache
+    return bare_toolkit(pool, ["get_metrics_metadata"], use_cache=True, cache=ResultCache())
+
+
+def test_warms_every_toolkit_in_parallel():
+    pool = _pool("http://fake-a/mcp/", size=3)
+    a, b = _toolkit(pool), _toolkit(pool)
+    team = _Agent([a], members=[_Agent([b, a])])
+    assert list(iter_toolkits(team)) == [a, b]
+
+    started = asyncio.run(asyncio.wait_for(warm_up(team, prefetch=[("get_metrics_metadata", {})]), 1.0))
+    assert started.status == "ready" and started.errors == []
+    assert started.toolkits == 2 and started.connected == 2 and started.prefetched == 1
+    assert pool.connects == 3
+    # three slots connected concurrently, not one after another
+    assert started.duration < 3 * 0.05
+
+
+def test_pool_and_toolkit_failures_are_reported_alike():
+    pool = _pool("http://fake-b/mcp/", size=2, fail_slots=3)
+    state = asyncio.run(warm_up(_Agent([_toolkit(pool)]), prefetch=None))
+    assert state.status == "degraded" and state.ready
+    assert state.errors[:2] == ["connect http://fake-b/mcp/: ConnectionError: refused"] * 2
+    # the toolkit's own connect then retries a slot; it fails the same way
+    assert state.errors[2:] == ["connect http://fake-b/mcp/: ConnectionError: refused"]
+
+
+def test_readiness_endpoint():
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    app = FastAPI()
+    pool = _pool("http://fake-c/mcp/", size=1)
+    state = install_warmup(app, _Agent([_toolkit(pool)]), prefetch=None)
+    client = TestClient(app)
+    assert client.get("/health/ready").status_code == 503
+    with TestClient(app) as started:
+        body = started.get("/health/ready")
+        assert body.status_code == 200 and body.json()["status"] == "ready"
+    assert state.connected == 1
+
+
+if __name__ == "__main__":
+    print("Running warmup tests...")
+    test_warms_every_toolkit_in_parallel()
+    test_pool_and_toolkit_failures_are_reported_alike()
+    test_readiness_endpoint()
+    print("Done.")